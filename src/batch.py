@@ -0,0 +1,187 @@
+# File: batch.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   Headless batch runner, playing many seeded games across a pool of worker processes.
+# Notes:
+#   Run from the src directory, for example:
+#       python batch.py --games 1000 --policy aim --output results.jsonl
+#   Game i is seeded with seed + i, so every game's result is the same no matter which worker plays it.
+#   Games follow the game's difficulty curve, starting each level immediately instead of waiting for a button.
+#   Input policies:
+#       random) a random input each tick
+#       spin) turn clockwise while firing
+#       aim) turn toward the nearest asteroid, firing when facing it
+#       script) loop the input of a log recorded with the record_input setting, given by --script
+#   Each game's result is written as a line of JSON as soon as it finishes, and a summary is printed at the end.
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', "dummy")
+os.environ.setdefault('SDL_AUDIODRIVER', "dummy")
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
+
+import argparse
+import json
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from math import atan2, pi
+from random import Random, seed
+from time import perf_counter
+
+import numpy as np
+from game_classes import Player, Vector2D, Level, GameConfig, FrameInput, InputRecorder, InputLog
+from game import create_level
+
+SCREEN_DIM = (500, 500)
+POLICIES = ["random", "spin", "aim", "script"]
+# The script policy's input, set once in each worker
+WORKER_SCRIPT = None
+
+
+class InputPolicy:
+    """Chooses the input for each tick of a headless game."""
+
+    # Precond:
+    #   name is one of POLICIES.
+    #   rng is the Random object the policy draws from.
+    #   script is the list of FrameInputs the script policy loops, or None.
+    #
+    # Postcond:
+    #   Creates a new InputPolicy.
+    def __init__(self, name: str, rng: Random, script: [FrameInput] = None):
+        """InputPolicy constructor."""
+        self.name = name
+        self.rng = rng
+        self.script = script
+        self.tick = 0
+
+    # Precond:
+    #   level is the level being played.
+    #
+    # Postcond:
+    #   Returns the FrameInput for the next tick.
+    def next_input(self, level: Level) -> FrameInput:
+        """Chooses the next tick's input."""
+        self.tick += 1
+        if self.name == "random":
+            rng = self.rng
+            return FrameInput(rng.randint(-1, 1), rng.randint(-1, 1), rng.random() < 0.05, rng.random() < 0.5)
+        if self.name == "spin":
+            return FrameInput(rotation=1, fire=True)
+        if self.name == "script":
+            return self.script[(self.tick - 1) % len(self.script)]
+        return InputPolicy.__aim(level)
+
+    @staticmethod
+    def __aim(level: Level) -> FrameInput:
+        """Turns toward the nearest asteroid, firing when facing it."""
+        positions = level.asteroids.positions()
+        if len(positions) == 0:
+            return FrameInput()
+        anchor = level.player.get_anchor()
+        offsets = positions - np.array([anchor.x, anchor.y])
+        nearest = offsets[np.argmin(np.einsum("ij,ij->i", offsets, offsets))]
+        turn = (atan2(nearest[1], nearest[0]) - level.player.facing + pi) % (2 * pi) - pi
+        rotation = 0 if abs(turn) < 0.05 else (1 if turn > 0 else -1)
+        return FrameInput(rotation=rotation, fire=abs(turn) < 0.2)
+
+
+def init_worker(world_dim: (int, int), script: bytes):
+    """Configures a worker process, decoding the script policy's input once."""
+    global WORKER_SCRIPT
+    GameConfig.register_setting("world_dim", world_dim)
+    WORKER_SCRIPT = None if script is None else [InputRecorder.decode(code) for code in script]
+
+
+def play_game(game_seed: int, policy: str, max_ticks: int) -> dict:
+    """Plays a single headless game, returning its result."""
+    start = perf_counter()
+    seed(game_seed)
+    inputs = InputPolicy(policy, Random(game_seed), WORKER_SCRIPT)
+    player = Player(Vector2D(250, 250))
+    player.set_active(True)
+    player.set_visible(True)
+    difficulty = 10
+    levels_cleared = 0
+    level = create_level(player, SCREEN_DIM, difficulty)
+    player.reset_cooldown()
+    level.resume()
+    tick_delta = GameConfig.get_tick_delta()
+    ticks = 0
+    while ticks < max_ticks and not level.lose():
+        level.step(tick_delta, inputs.next_input(level))
+        ticks += 1
+        if level.win():
+            difficulty += 1
+            levels_cleared += 1
+            level.close()
+            level = create_level(player, SCREEN_DIM, difficulty)
+            player.set_visible(True)
+            player.reset_cooldown()
+            level.resume()
+    result = {
+        "seed": game_seed,
+        "score": int(player.get_score()),
+        "levels_cleared": levels_cleared,
+        "frames": ticks,
+        "lost": level.lose(),
+        "wall_time": perf_counter() - start
+    }
+    level.close()
+    return result
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Play many headless Masteroids games in parallel.")
+    parser.add_argument("--games", type=int, default=100, help="number of games to play")
+    parser.add_argument("--workers", type=int, default=os.cpu_count(), help="number of worker processes")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the first game, game i uses seed + i")
+    parser.add_argument("--policy", choices=POLICIES, default="random", help="input policy for every game")
+    parser.add_argument("--script", default=None, help="input log the script policy loops")
+    parser.add_argument("--max-frames", type=int, default=24 * 60 * 5, help="frames before a game is stopped")
+    parser.add_argument("--world-dim", type=int, nargs=2, default=None, help="level (width, height)")
+    parser.add_argument("--output", default=None, help="file to write results to (default: stdout)")
+    args = parser.parse_args()
+    if args.policy == "script" and args.script is None:
+        parser.error("the script policy needs --script")
+    return args
+
+
+def main():
+    args = parse_args()
+    script = None
+    if args.policy == "script":
+        # Sent to workers as encoded bytes, which are much cheaper to pickle than FrameInputs
+        script = bytes(InputRecorder.encode(inputs) for _, inputs, _ in InputLog(args.script).ticks)
+        if len(script) == 0:
+            sys.exit(f"{args.script} has no recorded input")
+    world_dim = None if args.world_dim is None else tuple(args.world_dim)
+    fout = sys.stdout if args.output is None else open(args.output, 'w')
+    scores = []
+    frames = 0
+    start = perf_counter()
+    try:
+        with ProcessPoolExecutor(max_workers=args.workers, initializer=init_worker,
+                                 initargs=(world_dim, script)) as executor:
+            games = [executor.submit(play_game, args.seed + idx, args.policy, args.max_frames)
+                     for idx in range(args.games)]
+            for game in as_completed(games):
+                result = game.result()
+                fout.write(json.dumps(result) + "\n")
+                fout.flush()
+                scores.append(result["score"])
+                frames += result["frames"]
+    finally:
+        if fout is not sys.stdout:
+            fout.close()
+    elapsed = perf_counter() - start
+    if len(scores) == 0:
+        return
+    print(f"{len(scores)} games on {args.workers} workers in {elapsed:.2f}s: {frames / elapsed:.0f} frames/s, "
+          f"score mean {np.mean(scores):.0f} max {max(scores)}", file=sys.stderr)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,199 @@
+# File: benchmark.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   Headless benchmark suite measuring how level simulation and drawing scale with entity counts.
+# Notes:
+#   Run from the src directory, for example:
+#       python benchmark.py --asteroids 10 1000 100000 --pellets 0 10000 --output bench.json
+#   Every configuration is run twice from the same seed: once timed with a FrameProfiler attached, and
+#   once for a few frames under tracemalloc to measure allocations.
+#   Asteroid counts are split across size-classes like the game's levels, and the level is sized to keep
+#   the asteroid density per screen constant, so collision work grows with count rather than crowding.
+#   Scenario files can be benchmarked instead of entity counts, to measure specific loads:
+#       python benchmark.py --scenario scenarios/clusters.json scenarios/pellet_storm.json
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', "dummy")
+os.environ.setdefault('SDL_AUDIODRIVER', "dummy")
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
+
+import argparse
+import json
+import platform
+import sys
+import tracemalloc
+from datetime import datetime, timezone
+from math import ceil, radians, sqrt
+from random import seed, randint
+from time import perf_counter
+
+import numpy as np
+import pygame as pg
+from game_classes import Level, Player, Asteroid, Pellet, Vector2D, AssetManager, FrameInput, FrameProfiler, \
+    Scenario, GameConfig
+
+SCREEN_DIM = (500, 500)
+
+
+def create_level(asteroids: int, pellets: int, density: float) -> Level:
+    """Creates a running level with the given entity counts, sized for the given asteroids per screen."""
+    scale = max(1.0, sqrt(asteroids / density))
+    world_dim = ceil(SCREEN_DIM[0] * scale), ceil(SCREEN_DIM[1] * scale)
+    large = asteroids // 7
+    medium = asteroids // 5
+    player = Player(Vector2D(0, 0))
+    player.set_active(True)
+    player.set_visible(True)
+    level = Level(player, SCREEN_DIM, asteroids - medium - large, medium, large, world_dim)
+    pool = Pellet.get_pool()
+    for _ in range(pellets):
+        pellet = pool.acquire(Vector2D(randint(0, world_dim[0]), randint(0, world_dim[1])),
+                              Vector2D.ang_to_vec(radians(randint(0, 359))))
+        pellet.activate()
+        level.pellets.append(pellet)
+    level.resume()
+    return level
+
+
+def run_frames(level: Level, screen: pg.Surface, frames: int, render: bool, profiler: FrameProfiler = None):
+    """Steps (and optionally draws) the level for a number of frames, with the player turning and firing."""
+    inputs = FrameInput(rotation=1, throttle=1, fire=True)
+    tick_delta = GameConfig.get_tick_delta()
+    for _ in range(frames):
+        level.step(tick_delta, inputs)
+        if render:
+            mark = perf_counter()
+            screen.fill((0, 0, 0))
+            level.render(screen)
+            if profiler is not None:
+                profiler.record("render", mark)
+        if profiler is not None:
+            profiler.end_frame()
+
+
+def create_scenario_level(scenario: Scenario) -> Level:
+    """Creates a running level from a scenario."""
+    player = Player(Vector2D(0, 0))
+    player.set_active(True)
+    player.set_visible(True)
+    level = scenario.build(player, SCREEN_DIM)
+    level.resume()
+    return level
+
+
+def bench_level(screen: pg.Surface, build, args: argparse.Namespace) -> dict:
+    """Benchmarks the levels created by build, which must create the same level every time it is called."""
+    # Timed run
+    level = build()
+    asteroids, pellets = len(level.asteroids), len(level.pellets)
+    profiler = FrameProfiler()
+    level.profiler = profiler
+    start = perf_counter()
+    run_frames(level, screen, args.frames, args.render, profiler)
+    elapsed = perf_counter() - start
+    result = {
+        "asteroids": asteroids,
+        "pellets": pellets,
+        "world_dim": list(level.dim),
+        "frames": args.frames,
+        "seconds": elapsed,
+        "fps": args.frames / elapsed,
+        "phases": profiler.get_stats(session=True),
+        "final": {"asteroids": len(level.asteroids), "pellets": len(level.pellets),
+                  "score": level.player.get_score()}
+    }
+    level.close()
+
+    # Allocation run
+    level = build()
+    tracemalloc.start()
+    before = tracemalloc.get_traced_memory()[0]
+    run_frames(level, screen, args.alloc_frames, args.render)
+    current, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    result["allocations"] = {"frames": args.alloc_frames, "net_bytes": current - before, "peak_bytes": peak - before}
+    level.close()
+    return result
+
+
+def bench_config(screen: pg.Surface, asteroids: int, pellets: int, args: argparse.Namespace) -> dict:
+    """Benchmarks a single configuration."""
+    def build() -> Level:
+        seed(args.seed)
+        return create_level(asteroids, pellets, args.density)
+    return bench_level(screen, build, args)
+
+
+def bench_scenario(screen: pg.Surface, scenario: Scenario, args: argparse.Namespace) -> dict:
+    """Benchmarks a single scenario."""
+    result = {"scenario": scenario.name, "description": scenario.description}
+    result.update(bench_level(screen, lambda: create_scenario_level(scenario), args))
+    return result
+
+
+def parse_args() -> argparse.Namespace:
+    parser = argparse.ArgumentParser(description="Headless Masteroids benchmark suite.")
+    parser.add_argument("--asteroids", type=int, nargs="+", default=[10, 100, 1000, 10000, 100000],
+                        help="asteroid counts to benchmark")
+    parser.add_argument("--pellets", type=int, nargs="+", default=[0, 100, 1000, 10000],
+                        help="initial pellet counts to benchmark")
+    parser.add_argument("--frames", type=int, default=120, help="frames timed per configuration")
+    parser.add_argument("--alloc-frames", type=int, default=10, help="frames traced for allocations")
+    parser.add_argument("--density", type=float, default=50, help="asteroids per screen-sized area")
+    parser.add_argument("--seed", type=int, default=42, help="seed for the global random sequence")
+    parser.add_argument("--scenario", nargs="+", default=None,
+                        help="scenario files to benchmark instead of the asteroid and pellet counts")
+    parser.add_argument("--no-render", dest="render", action="store_false", help="only step the simulation")
+    parser.add_argument("--output", default=None, help="file to write the JSON report to (default: stdout)")
+    return parser.parse_args()
+
+
+def main():
+    args = parse_args()
+    pg.init()
+    screen = pg.display.set_mode(SCREEN_DIM)
+    fonts = os.path.join(os.path.dirname(os.path.abspath(__file__)), "assets", "fonts", "Consolas.ttf")
+    AssetManager.get_instance().register_font("hud", pg.font.Font(fonts, 30))
+    Player.build_sprite_cache()
+    Asteroid.build_shapes()
+    Pellet.build_sprite()
+
+    results = []
+    if args.scenario is not None:
+        for filename in args.scenario:
+            result = bench_scenario(screen, Scenario.load(filename), args)
+            print(f"scenario={result['scenario']:<20} {result['fps']:10.1f} fps", file=sys.stderr)
+            results.append(result)
+    else:
+        for asteroids in args.asteroids:
+            for pellets in args.pellets:
+                result = bench_config(screen, asteroids, pellets, args)
+                print(f"asteroids={asteroids:<7} pellets={pellets:<6} {result['fps']:10.1f} fps", file=sys.stderr)
+                results.append(result)
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "python": platform.python_version(),
+            "pygame": pg.version.ver,
+            "numpy": np.__version__,
+            "platform": platform.platform(),
+            "seed": args.seed,
+            "render": args.render,
+            "density": args.density
+        },
+        "results": results
+    }
+    pg.quit()
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2)
+        print()
+    else:
+        with open(args.output, 'w') as fout:
+            json.dump(report, fout, indent=2)
+
+
+if __name__ == '__main__':
+    main()
@@ -8,7 +8,7 @@
 # Notes:
 
 import pygame as pg
-from game_classes import Button, Leaderboard, AssetManager, GameConfig
+from game_classes import Button, Leaderboard, AssetManager, GameConfig, RetainedScreen
 from time import perf_counter
 
 
@@ -20,6 +20,15 @@ def leaderboard():
     back_btn = Button("Back", None, (255, 0, 0))
     back_anchor = screen.get_width() - back_btn.get_dim()[0], screen.get_height() - back_btn.get_dim()[1]
     board = Leaderboard("leader.board")
+    
+    def compose(surf: pg.Surface):
+        surf.fill((0, 0, 0))
+        leader_render = board.render()
+        leader_anchor = (screen_dim[0] - leader_render.get_width())//2, (screen_dim[1] - leader_render.get_height())//2
+        surf.blit(leader_render, leader_anchor)
+        if GameConfig.get_setting("controller") == "KEYBOARD":
+            back_btn.place(surf, back_anchor)
+    retained = RetainedScreen(compose)
 
     # Update accounting
     frame_delta = 1 / 24
@@ -29,15 +38,10 @@ def leaderboard():
         if delta >= frame_delta:
             frame_timer = perf_counter()
             # Process Frame
-            screen.fill((0, 0, 0))
-            leader_render = board.render()
-            leader_anchor = (screen_dim[0] - leader_render.get_width())//2, (screen_dim[1] - leader_render.get_height())//2
-            screen.blit(leader_render, leader_anchor)
-            if GameConfig.get_setting("controller") == "KEYBOARD":
-                back_btn.place(screen, back_anchor)
-            pg.display.flip()
+            retained.present(screen)
             # Process Events
             for event in pg.event.get():
+                retained.handle_event(event)
                 if event.type == pg.QUIT:
                     running = False
                     return -1
@@ -52,6 +56,8 @@ def leaderboard():
                     if event.type == pg.JOYBUTTONDOWN:
                         if event.button == GameConfig.get_setting("B"):
                             running = False
+        else:
+            pg.time.wait(int((frame_delta - delta) * 1000))
     board.write_out()
     return 0
 
@@ -66,16 +72,28 @@ def leaderboard_add(score: int):
     blink_freq = 0.25
     blink_timer = blink_freq
     blink = False
-    font = AssetManager.get_instance().get_font("medium")
-    font.set_bold(False)
-    dir_font = AssetManager.get_instance().get_font("small")
-    dir_font.set_bold(False)
+    font = AssetManager.get_instance().get_glyph_atlas("medium")
+    dir_font = AssetManager.get_instance().get_glyph_atlas("small")
     dir_text = None
     if GameConfig.get_setting("controller") == "KEYBOARD":
-        dir_text = dir_font.render("Press Enter When Done", True, (255, 255, 255))
+        dir_text = dir_font.render("Press Enter When Done")
     elif GameConfig.get_setting("controller") == "GAMEPAD":
-        dir_text = dir_font.render("Press Start When Done", True, (255, 255, 255))
+        dir_text = dir_font.render("Press Start When Done")
     board = Leaderboard("leader.board")
+    
+    def compose(surf: pg.Surface):
+        # Render text with blinking
+        surf.fill((0, 0, 0))
+        temp_text = name
+        if blink:
+            temp_text = temp_text[:char_index] + "_" + temp_text[char_index+1:]
+        text = (" "*5).join([temp_text, f"{score:09}"])
+        text_render = font.render(text)
+        text_anchor = (screen_dim[0] - text_render.get_width())//2, (screen_dim[1] - text_render.get_height())//2
+        dir_anchor = text_anchor[0], text_anchor[1] + text_render.get_height() + 10
+        surf.blit(text_render, text_anchor)
+        surf.blit(dir_text, dir_anchor)
+    retained = RetainedScreen(compose)
 
     # Update accounting
     frame_delta = 1 / 24
@@ -85,24 +103,17 @@ def leaderboard_add(score: int):
         if delta >= frame_delta:
             frame_timer = perf_counter()
             # Process Frame
-            screen.fill((0, 0, 0))
-            # Render text with blinking
-            temp_text = name
             blink_timer -= delta
             if blink_timer <= 0:
                 blink = not blink
                 blink_timer = blink_freq
-            if blink:
-                temp_text = temp_text[:char_index] + "_" + temp_text[char_index+1:]
-            text = (" "*5).join([temp_text, f"{score:09}"])
-            text_render = font.render(text, True, (255, 255, 255))
-            text_anchor = (screen_dim[0] - text_render.get_width())//2, (screen_dim[1] - text_render.get_height())//2
-            dir_anchor = text_anchor[0], text_anchor[1] + text_render.get_height() + 10
-            screen.blit(text_render, text_anchor)
-            screen.blit(dir_text, dir_anchor)
-            pg.display.flip()
+                retained.invalidate()
+            retained.present(screen)
             # Process Events
             for event in pg.event.get():
+                retained.handle_event(event)
+                if event.type in [pg.KEYDOWN, pg.JOYBUTTONDOWN, pg.JOYAXISMOTION]:
+                    retained.invalidate()
                 if event.type == pg.QUIT:
                     running = False
                     return -1
@@ -157,5 +168,7 @@ def leaderboard_add(score: int):
                             elif round(event.value) == 1:
                                 char_index += 1
                                 char_index = char_index % 3
+        else:
+            pg.time.wait(int((frame_delta - delta) * 1000))
     board.write_out()
     return 0
@@ -6,27 +6,46 @@
 # Purpose:
 #   A file for running an instance of the game, and required supporting functions.
 # Notes:
+#   The simulation runs at a fixed tick rate, while rendering runs up to the frame rate with
+#   positions interpolated between the last two simulation steps.
+#   With the "DIRTY" render mode only the regions drawn this frame or last frame are updated.
+#   With the sim_thread setting the simulation runs on a SimulationThread, and this loop only handles events,
+#   passes input along and renders the latest snapshot; level state is only changed while holding its lock.
+#   With the profiler setting each frame's phases are timed, F3 (or Select) toggles an overlay of the
+#   timings, and the whole session is exported when profile_export names a file prefix. With sim_thread the
+#   simulation thread times its steps with a profiler of its own, which is merged in each frame under the lock.
+#   With the track_allocations setting an AllocationTracker takes the profiler's place, measuring the memory
+#   allocated in each phase instead of its time. It cannot be combined with sim_thread.
+#   With the telemetry_log setting histograms of frame times and sim-to-present latency, along with the number of
+#   frames which overran the frame budget and the level's entity counts, are logged to a rotating file per level.
+#   With the record_input setting the session is seeded, and every simulation step's input is recorded to the
+#   named file so it can be replayed by replay.py.
 
-from time import perf_counter
+from time import perf_counter, sleep
+from contextlib import nullcontext
 import pygame as pg
-from game_classes import Player, Vector2D, Level, AssetManager, GameConfig
-from random import seed
+from game_classes import Player, Vector2D, Level, AssetManager, GameConfig, FrameInput, DirtyRenderer, \
+    SimulationThread, GlyphAtlas, FrameProfiler, InputRecorder, AllocationTracker, FrameTelemetry
+from random import seed, randrange
 
 
 def create_level(player: Player, screen_dim: (int, int), difficulty: int):
     small = difficulty // 2
     medium = difficulty // 5
     large = difficulty // 7
-    return Level(player, screen_dim, small, medium, large)
+    return Level(player, screen_dim, small, medium, large, GameConfig.get_setting("world_dim"))
 
 
-def create_level_label(level: int, font: pg.font.Font, screen_dim: (int, int)):
-    level_label = font.render(f"LEVEL {level}", True, (255, 255, 255))
+def create_level_label(level: int, font: GlyphAtlas, screen_dim: (int, int)):
+    level_label = font.render(f"LEVEL {level}")
     level_anchor = (screen_dim[0] - level_label.get_width()) // 2, (screen_dim[1] - level_label.get_height()) // 2
     return level_label, level_anchor
 
 
 def game():
+    if GameConfig.get_setting("track_allocations") and GameConfig.get_setting("sim_thread"):
+        # tracemalloc's peak is process-wide, so the two threads' phases would corrupt each other's measurements
+        raise ValueError("The track_allocations setting cannot be used with sim_thread")
     # Start the music
     pg.mixer.music.load(AssetManager.get_instance().get_music("background"))
     pg.mixer.music.set_volume(0.05)
@@ -34,95 +53,215 @@ def game():
     # Running constants
     screen = pg.display.get_surface()
     screen_dim = screen.get_size()
-    frame_delta = 1 / 24
+    tick_delta = GameConfig.get_tick_delta()
+    frame_delta = 1 / GameConfig.get_setting("frame_rate")
+    # Time before a frame is due when the loop stops sleeping and spins, as sleeps can overshoot
+    frame_spin = 0.001
+    max_catch_up = GameConfig.get_setting("max_catch_up")
+    accumulator = 0
     frame_timer = perf_counter()
-    announcement_font = AssetManager.get_instance().get_font("large")
-    announcement_font.set_bold(True)
-    subtitle_font = AssetManager.get_instance().get_font("small")
+    renderer = DirtyRenderer(screen, enabled=GameConfig.get_setting("render_mode") == "DIRTY")
+    announcement_font = AssetManager.get_instance().get_glyph_atlas("large", bold=True)
+    subtitle_font = AssetManager.get_instance().get_glyph_atlas("small")
     running = True
     
+    # Optionally record the session, seeding it so a replay creates the same levels
+    recorder = None
+    if GameConfig.get_setting("record_input") is not None:
+        session_seed = randrange(1 << 32)
+        seed(session_seed)
+        recorder = InputRecorder(GameConfig.get_setting("record_input"), session_seed, tick_delta, screen_dim,
+                                 GameConfig.get_setting("world_dim"))
+    
     # Setup GameObjects
     player = Player(Vector2D(250, 250))
     difficulty = 10
     level_count = 1
     level = create_level(player, screen_dim, difficulty)
+    level.recorder = recorder
+    tracker = AllocationTracker() if GameConfig.get_setting("track_allocations") else None
+    profiler = FrameProfiler() if GameConfig.get_setting("profiler") and tracker is None else tracker
+    if tracker is not None:
+        tracker.begin_level(level_count)
+    # The profiler attached to levels, a separate one when they are stepped on the simulation thread
+    step_profiler = profiler
+    if GameConfig.get_setting("sim_thread") and profiler is not None:
+        step_profiler = FrameProfiler()
+    telemetry = None
+    if GameConfig.get_setting("telemetry_log") is not None:
+        telemetry = FrameTelemetry(GameConfig.get_setting("telemetry_log"), frame_delta)
+        telemetry.begin_level(level_count)
+    # When the simulation state being drawn was stepped
+    sim_time = perf_counter()
+    profiler_font = AssetManager.get_instance().get_glyph_atlas("small")
+    level.profiler = step_profiler
     player.set_active(True)
     player.set_visible(True)
     
     # Basic Game state handling and text
     game_state = "NEW_LEVEL"
-    pause_label = announcement_font.render("==PAUSED==", True, (255, 255, 255))
+    pause_label = announcement_font.render("==PAUSED==")
     pause_anchor = (screen_dim[0] - pause_label.get_width()) // 2, (screen_dim[1] - pause_label.get_height()) // 2
     level_label, level_anchor = create_level_label(level_count, announcement_font, screen_dim)
     level_dir = None
     if GameConfig.get_setting("controller") == "KEYBOARD":
-        level_dir = subtitle_font.render("Press SPACE to proceed", True, (255, 255, 255))
+        level_dir = subtitle_font.render("Press SPACE to proceed")
     elif GameConfig.get_setting("controller") == "GAMEPAD":
-        level_dir = subtitle_font.render("Press A to proceed", True, (255, 255, 255))
+        level_dir = subtitle_font.render("Press A to proceed")
     level_dir_anchor = (screen_dim[0] - level_dir.get_width()) // 2, (
               screen_dim[1] - level_dir.get_height()) // 2 + level_label.get_height()
     
+    # Optionally move the simulation to its own thread
+    simulation = None
+    lock = nullcontext()
+    if GameConfig.get_setting("sim_thread"):
+        simulation = SimulationThread(level, tick_delta, max_catch_up)
+        lock = simulation.lock
+        simulation.start()
+    
     # Main game loop
-    while running:
-        delta = perf_counter() - frame_timer
-        if delta >= frame_delta:
-            frame_timer = perf_counter()
-            # Process Frame
-            screen.fill((0, 0, 0))
-            level.run_frame(screen, delta)
-            if game_state == "PAUSED":
-                screen.blit(pause_label, pause_anchor)
-            elif game_state == "NEW_LEVEL":
-                player.set_visible(False)
-                screen.blit(level_label, level_anchor)
-                screen.blit(level_dir, level_dir_anchor)
-            pg.draw.rect(screen, (255, 255, 255), screen.get_rect(), 3)
-            pg.display.flip()
-            # Process Events
-            for event in pg.event.get():
-                if event.type == pg.QUIT:
-                    running = False
-                    return -1
-                if GameConfig.get_setting("controller") == "KEYBOARD":
-                    if event.type == pg.KEYDOWN:
-                        if event.key == pg.K_ESCAPE:
-                            if game_state in ["PLAY", "PAUSED"]:
-                                level.toggle_pause()
-                                if game_state == "PLAY":
-                                    game_state = "PAUSED"
-                                    pg.mixer.music.pause()
-                                else:
+    try:
+        while running:
+            delta = perf_counter() - frame_timer
+            if delta < frame_delta - frame_spin:
+                # Sleep until shortly before the next frame, leaving the CPU to the simulation thread
+                sleep(frame_delta - frame_spin - delta)
+                delta = perf_counter() - frame_timer
+            if delta >= frame_delta:
+                frame_timer += delta
+                if simulation is None:
+                    # Run fixed simulation steps for the elapsed time
+                    accumulator += delta
+                    steps = 0
+                    while accumulator >= tick_delta and steps < max_catch_up:
+                        level.step(tick_delta, FrameInput.poll())
+                        accumulator -= tick_delta
+                        steps += 1
+                    if accumulator >= tick_delta:
+                        # Drop any remaining backlog after a stall
+                        accumulator = 0
+                    if steps > 0:
+                        sim_time = perf_counter()
+                    # Process Frame
+                    mark = profiler.mark() if profiler is not None else 0.0
+                    renderer.begin_frame()
+                    drawn = level.render(screen, accumulator / tick_delta)
+                    counts = len(level.asteroids), len(level.pellets)
+                else:
+                    # The simulation thread steps the level, only pass it input and draw its latest snapshot
+                    simulation.set_input(FrameInput.poll())
+                    mark = profiler.mark() if profiler is not None else 0.0
+                    renderer.begin_frame()
+                    snapshot, alpha = simulation.latest()
+                    drawn = level.render_snapshot(screen, snapshot, alpha)
+                    sim_time = snapshot.time
+                    # The level may be mid-step, so entity counts come from the snapshot being drawn
+                    counts = snapshot.counts
+                if game_state == "PAUSED":
+                    drawn.append(screen.blit(pause_label, pause_anchor))
+                elif game_state == "NEW_LEVEL":
+                    player.set_visible(False)
+                    drawn.append(screen.blit(level_label, level_anchor))
+                    drawn.append(screen.blit(level_dir, level_dir_anchor))
+                pg.draw.rect(screen, (255, 255, 255), screen.get_rect(), 3)
+                if profiler is not None:
+                    drawn.extend(profiler.draw_overlay(screen, profiler_font, (5, 35)))
+                    mark = profiler.record("render", mark)
+                renderer.end_frame(drawn)
+                presented = perf_counter()
+                if profiler is not None:
+                    mark = profiler.record("present", mark)
+                with lock:
+                    # Process Events
+                    for event in pg.event.get():
+                        if event.type == pg.QUIT:
+                            running = False
+                            return -1
+                        if GameConfig.get_setting("controller") == "KEYBOARD":
+                            if event.type == pg.KEYDOWN:
+                                if event.key == pg.K_F3 and profiler is not None:
+                                    profiler.toggle_overlay()
+                                if event.key == pg.K_ESCAPE:
+                                    if game_state in ["PLAY", "PAUSED"]:
+                                        level.toggle_pause()
+                                        if recorder is not None:
+                                            recorder.record_command(InputRecorder.TOGGLE_PAUSE)
+                                        if game_state == "PLAY":
+                                            game_state = "PAUSED"
+                                            pg.mixer.music.pause()
+                                        else:
+                                            game_state = "PLAY"
+                                            pg.mixer.music.unpause()
+                                if game_state == "NEW_LEVEL" and event.key == pg.K_SPACE:
                                     game_state = "PLAY"
-                                    pg.mixer.music.unpause()
-                        if game_state == "NEW_LEVEL" and event.key == pg.K_SPACE:
-                            game_state = "PLAY"
-                            player.set_visible(True)
-                            player.reset_cooldown()
-                            level.toggle_pause()
-                elif GameConfig.get_setting("controller") == "GAMEPAD":
-                    if event.type == pg.JOYBUTTONDOWN:
-                        if event.button == GameConfig.get_setting("START"):
-                            if game_state in ["PLAY", "PAUSED"]:
-                                level.toggle_pause()
-                                if game_state == "PLAY":
-                                    game_state = "PAUSED"
-                                    pg.mixer.music.pause()
-                                else:
+                                    player.set_visible(True)
+                                    player.reset_cooldown()
+                                    level.toggle_pause()
+                                    if recorder is not None:
+                                        recorder.record_command(InputRecorder.START)
+                        elif GameConfig.get_setting("controller") == "GAMEPAD":
+                            if event.type == pg.JOYBUTTONDOWN:
+                                if event.button == GameConfig.get_setting("SELECT") and profiler is not None:
+                                    profiler.toggle_overlay()
+                                if event.button == GameConfig.get_setting("START"):
+                                    if game_state in ["PLAY", "PAUSED"]:
+                                        level.toggle_pause()
+                                        if recorder is not None:
+                                            recorder.record_command(InputRecorder.TOGGLE_PAUSE)
+                                        if game_state == "PLAY":
+                                            game_state = "PAUSED"
+                                            pg.mixer.music.pause()
+                                        else:
+                                            game_state = "PLAY"
+                                            pg.mixer.music.unpause()
+                                if game_state == "NEW_LEVEL" and event.button == GameConfig.get_setting("A"):
                                     game_state = "PLAY"
-                                    pg.mixer.music.unpause()
-                        if game_state == "NEW_LEVEL" and event.button == GameConfig.get_setting("A"):
-                            game_state = "PLAY"
-                            player.set_visible(True)
-                            player.reset_cooldown()
-                            level.toggle_pause()
-            if level.win():
-                difficulty += 1
-                level_count += 1
-                level_label, level_anchor = create_level_label(level_count, announcement_font, screen_dim)
-                level = create_level(player, screen_dim, difficulty)
-                game_state = "NEW_LEVEL"
-            elif level.lose():
-                running = False
-                game_state = "LOST"
+                                    player.set_visible(True)
+                                    player.reset_cooldown()
+                                    level.toggle_pause()
+                                    if recorder is not None:
+                                        recorder.record_command(InputRecorder.START)
+                    if level.win():
+                        difficulty += 1
+                        level_count += 1
+                        level_label, level_anchor = create_level_label(level_count, announcement_font, screen_dim)
+                        level.close()
+                        level = create_level(player, screen_dim, difficulty)
+                        level.profiler = step_profiler
+                        if tracker is not None:
+                            tracker.begin_level(level_count)
+                        if telemetry is not None:
+                            telemetry.begin_level(level_count)
+                        level.recorder = recorder
+                        if recorder is not None:
+                            recorder.record_command(InputRecorder.NEXT_LEVEL)
+                        if simulation is not None:
+                            simulation.set_level(level)
+                        game_state = "NEW_LEVEL"
+                    elif level.lose():
+                        running = False
+                        game_state = "LOST"
+                    if simulation is not None and step_profiler is not None:
+                        profiler.merge(step_profiler)
+                if profiler is not None:
+                    profiler.record("events", mark)
+                    profiler.end_frame()
+                if telemetry is not None:
+                    telemetry.record_frame(delta, perf_counter() - frame_timer, presented - sim_time, *counts)
+    finally:
+        # Also reached when the window is closed mid-game
+        if simulation is not None:
+            simulation.stop()
+        if tracker is not None:
+            tracker.close()
+        if telemetry is not None:
+            telemetry.close()
+        if profiler is not None and GameConfig.get_setting("profile_export") is not None:
+            profiler.export_csv(GameConfig.get_setting("profile_export") + ".csv")
+            profiler.export_json(GameConfig.get_setting("profile_export") + ".json")
+        if recorder is not None:
+            recorder.close(player.get_score(), level.state_hash())
+        # Return the level's pellets to the pool on every exit path
+        level.close()
     pg.mixer.music.stop()
     return player.get_score()
\ No newline at end of file
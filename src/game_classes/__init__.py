@@ -9,8 +9,10 @@
 
 from .game_object import GameObject, MovingGameObject
 from .player import Player
-from .vector2d import Vector2D
+from .vector2d import Vector2D, MutableVector2D
 from .asteroid import Asteroid
+from .asteroid_field import AsteroidField
+from .spatial_hash import SpatialHash
 from .pellet import Pellet
 from .level import Level
 from .button import Button
@@ -18,3 +20,18 @@ from .text_box import TextBox
 from .leaderboard import Leaderboard
 from .asset_manager import AssetManager
 from .game_config import GameConfig
+from .frame_input import FrameInput
+from .object_pool import ObjectPool
+from .dirty_renderer import DirtyRenderer
+from .hud import Hud
+from .retained_screen import RetainedScreen
+from .frame_snapshot import FrameSnapshot, SnapshotBuffer
+from .simulation_thread import SimulationThread
+from .camera import Camera
+from .glyph_atlas import GlyphAtlas
+from .phase_recorder import PhaseRecorder
+from .frame_profiler import FrameProfiler
+from .allocation_tracker import AllocationTracker
+from .frame_telemetry import FrameTelemetry, Histogram
+from .scenario import Scenario
+from .input_recorder import InputRecorder, InputLog
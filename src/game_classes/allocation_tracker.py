@@ -0,0 +1,260 @@
+# File: allocation_tracker.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   An instrumentation mode which measures the memory allocated in each phase of each frame.
+# Notes:
+#   A PhaseRecorder like FrameProfiler, sharing its mark, record and end_frame interface, so it can be attached
+#   anywhere a profiler is.
+#   Memory is measured with tracemalloc, which only sees memory that is still allocated, so for each phase:
+#       peak) bytes allocated above the phase's starting point at its high-water mark, which includes
+#             temporary objects freed before the phase ended
+#       net) change in allocated bytes over the phase
+#       blocks) change in the number of allocated memory blocks over the phase
+#   Garbage collections are counted by generation, per frame and per level.
+#   Allocating call sites are found by comparing a tracemalloc snapshot every sample_interval frames with
+#   the previous one, summing the growth of each site. The first sample is only a baseline, so one-time
+#   startup allocations, such as imports and warming caches, are left out.
+#   Allocations are traced TRACEBACK_DEPTH frames deep, and each is attributed to the innermost frame in the
+#   game's own source (the src directory), so churn inside numpy or pygame is charged to the game code calling
+#   it. Allocations with no game frame keep their innermost frame. Allocations made anywhere under an import
+#   or by the tracker itself are left out. tracemalloc keeps the depth it was started with, so when it is
+#   already tracing only that many frames are searched.
+#   tracemalloc slows down every allocation, so time measurements are not meaningful while tracking.
+#   tracemalloc's peak is process-wide and every mark resets it, so phases are only measured correctly when a
+#   single thread runs the game. The tracker cannot be used with a simulation running on its own thread.
+
+from .phase_recorder import PhaseRecorder
+
+import gc
+import os
+import sys
+import tracemalloc
+
+import numpy as np
+
+
+class AllocationTracker(PhaseRecorder):
+    """Measures memory allocation and garbage collection for each phase of each frame."""
+    # Frames kept for each traced allocation, enough to reach game code from inside libraries
+    TRACEBACK_DEPTH = 32
+    # Allocation sites are attributed to frames under this directory
+    SOURCE_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__))) + os.sep
+
+    # Precond:
+    #   window is the number of recent frames the rolling statistics cover.
+    #   sample_interval is the number of frames between call site samples.
+    #   top is the number of call sites reported.
+    #
+    # Postcond:
+    #   Creates a new AllocationTracker, starting tracemalloc if it is not already tracing.
+    def __init__(self, window: int = 240, sample_interval: int = 120, top: int = 10):
+        """AllocationTracker constructor."""
+        super(AllocationTracker, self).__init__(window)
+        self.sample_interval = sample_interval
+        self.top = top
+        self.sites = {}
+        self.collections = [0, 0, 0]
+        self.frame_collections = [0, 0, 0]
+        self.collection_history = []
+        self.levels = []
+        self.started_tracing = not tracemalloc.is_tracing()
+        if self.started_tracing:
+            tracemalloc.start(AllocationTracker.TRACEBACK_DEPTH)
+        self.last_snapshot = None
+        gc.callbacks.append(self.__on_collect)
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns a mark of the current allocation state, to pass to record when the phase ends.
+    def mark(self) -> (int, int):
+        """Marks the start of a phase."""
+        tracemalloc.reset_peak()
+        return tracemalloc.get_traced_memory()[0], sys.getallocatedblocks()
+
+    # Precond:
+    #   phase is the name of the phase being measured.
+    #   since is the mark made when the phase started.
+    #
+    # Postcond:
+    #   Adds the memory allocated since the mark to the current frame, returning a mark for the next phase.
+    def record(self, phase: str, since: (int, int)) -> (int, int):
+        """Records the end of a phase."""
+        current, peak = tracemalloc.get_traced_memory()
+        blocks = sys.getallocatedblocks()
+        if phase not in self.current:
+            self.add_phase(phase)
+        totals = self.current[phase]
+        totals[0] += max(peak - since[0], 0)
+        totals[1] += current - since[0]
+        totals[2] += blocks - since[1]
+        tracemalloc.reset_peak()
+        return current, blocks
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Stores the current frame's measurements and starts a new frame, sampling call sites when due.
+    def end_frame(self):
+        """Finishes the current frame."""
+        super(AllocationTracker, self).end_frame()
+        self.collection_history.append(tuple(self.frame_collections))
+        self.frame_collections = [0, 0, 0]
+        if len(self.levels) > 0:
+            self.levels[-1]["frames"] += 1
+        if len(self.history) % self.sample_interval == 0:
+            self.__sample_sites()
+
+    # Precond:
+    #   level is a label for the level which is starting, such as its number.
+    #
+    # Postcond:
+    #   Starts counting garbage collections for a new level.
+    def begin_level(self, level):
+        """Marks the start of a new level."""
+        self.levels.append({"level": level, "frames": 0, "collections": [0, 0, 0]})
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Stops counting garbage collections, and stops tracemalloc if the tracker started it.
+    #   Recorded measurements can still be read and exported.
+    def close(self):
+        """Stops tracking."""
+        if self.__on_collect in gc.callbacks:
+            self.__sample_sites()
+            gc.callbacks.remove(self.__on_collect)
+            if self.started_tracing:
+                tracemalloc.stop()
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns a phase's [peak, net, blocks] before anything has been allocated.
+    def empty(self) -> [int]:
+        """Creates an empty measurement."""
+        return [0, 0, 0]
+
+    # Precond:
+    #   column is an array of a single phase's [peak, net, blocks] measurements, one row per frame.
+    #
+    # Postcond:
+    #   Returns the phase's mean peak and net kilobytes, mean change in blocks, and 95th percentile peak
+    #   kilobytes per frame.
+    def summarize(self, column: np.ndarray) -> dict:
+        """Summarizes a phase's allocations."""
+        if len(column) == 0:
+            return {"peak_kb": 0.0, "net_kb": 0.0, "blocks": 0.0, "p95_peak_kb": 0.0}
+        peak, net, blocks = column.mean(axis=0)
+        return {"peak_kb": float(peak / 1024), "net_kb": float(net / 1024), "blocks": float(blocks),
+                "p95_peak_kb": float(np.percentile(column[:, 0], 95) / 1024)}
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns the call sites which grew the most across every sample, as a list of dictionaries with the
+    #   site's file and line, kilobytes and blocks, largest first.
+    def get_top_sites(self) -> [dict]:
+        """Retrieves the top allocating call sites."""
+        ranked = sorted(self.sites.items(), key=lambda item: item[1][0], reverse=True)[:self.top]
+        return [{"site": site, "kb": size / 1024, "blocks": count} for site, (size, count) in ranked]
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns the overlay's lines, each phase's rolling allocations and the level's garbage collections.
+    def overlay_lines(self) -> [str]:
+        """Creates the allocation overlay's text."""
+        lines = [f"{'phase':<8}{'peakKB':>8}{'netKB':>8}{'blocks':>8}"]
+        for phase, stat in self.get_stats().items():
+            lines.append(f"{phase:<8}{stat['peak_kb']:8.1f}{stat['net_kb']:8.1f}{stat['blocks']:8.1f}")
+        collections = self.levels[-1]["collections"] if len(self.levels) > 0 else self.collections
+        lines.append(f"gc {collections[0]}/{collections[1]}/{collections[2]}")
+        return lines
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns the names of each phase's peak, net and blocks columns, followed by the collection columns.
+    def csv_header(self) -> [str]:
+        """Names the CSV columns."""
+        header = []
+        for phase in self.phases:
+            header.extend([f"{phase}_peak", f"{phase}_net", f"{phase}_blocks"])
+        return header + ["gen0", "gen1", "gen2"]
+
+    # Precond:
+    #   frame is the index of a recorded frame.
+    #
+    # Postcond:
+    #   Returns the frame's measurements, followed by its garbage collections by generation, as CSV values.
+    def csv_row(self, frame: int) -> list:
+        """Creates a frame's CSV row."""
+        row = []
+        for totals in self.history[frame]:
+            row.extend(totals)
+        return row + list(self.collection_history[frame])
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns the top call sites and garbage collections per level, for the JSON export.
+    def report(self) -> dict:
+        """Creates the tracker's extra JSON export entries."""
+        return {"top_sites": self.get_top_sites(), "collections": self.collections, "levels": self.levels}
+
+    def __on_collect(self, phase: str, info: dict):
+        """Garbage collector callback, counting each collection by generation."""
+        if phase != "start":
+            return
+        generation = info["generation"]
+        self.collections[generation] += 1
+        self.frame_collections[generation] += 1
+        if len(self.levels) > 0:
+            self.levels[-1]["collections"][generation] += 1
+
+    def __sample_sites(self):
+        """Adds the growth of each call site since the last sample to the site totals."""
+        snapshot = AllocationTracker.__take_snapshot()
+        if self.last_snapshot is None:
+            self.last_snapshot = snapshot
+            return
+        for stat in snapshot.compare_to(self.last_snapshot, "traceback"):
+            if stat.size_diff <= 0:
+                continue
+            frame = AllocationTracker.__game_frame(stat.traceback)
+            site = f"{frame.filename}:{frame.lineno}"
+            size, count = self.sites.get(site, (0, 0))
+            self.sites[site] = (size + stat.size_diff, count + stat.count_diff)
+        self.last_snapshot = snapshot
+
+    @staticmethod
+    def __game_frame(traceback: tracemalloc.Traceback) -> tracemalloc.Frame:
+        """Finds the innermost frame of an allocation's traceback in the game's source."""
+        # Tracebacks are ordered from the oldest frame to the most recent
+        for frame in reversed(traceback):
+            if frame.filename.startswith(AllocationTracker.SOURCE_ROOT):
+                return frame
+        return traceback[-1]
+
+    @staticmethod
+    def __take_snapshot() -> tracemalloc.Snapshot:
+        """Takes a tracemalloc snapshot, leaving out imports and the tracker's own allocations."""
+        return tracemalloc.take_snapshot().filter_traces([
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap>", all_frames=True),
+            tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>", all_frames=True),
+            tracemalloc.Filter(False, tracemalloc.__file__, all_frames=True),
+            tracemalloc.Filter(False, __file__, all_frames=True),
+            tracemalloc.Filter(False, sys.modules[PhaseRecorder.__module__].__file__, all_frames=True)
+        ])
@@ -7,6 +7,9 @@
 #   A simple singleton class for handling various assets such as sfx and music.
 # Notes:
 #   Currently only handles sounds
+#   Text should be drawn through glyph atlases, which are built once per registered font, color and weight.
+
+from .glyph_atlas import GlyphAtlas
 
 import pygame as pg
 
@@ -31,10 +34,18 @@ class AssetManager:
     def destroy():
         AssetManager.__INSTANCE = None
     
+    @staticmethod
+    def convert_sprite(sprite: pg.Surface) -> pg.Surface:
+        """Converts a per-pixel alpha sprite to the display's pixel format, if a display has been created."""
+        if pg.display.get_surface() is None:
+            return sprite
+        return sprite.convert_alpha()
+    
     def __init__(self):
         self.sound_dict = {}
         self.music_dict = {}
         self.font_dict = {}
+        self.atlas_dict = {}
     
     def get_sound(self, name: str) -> pg.mixer.Sound:
         """Retrieves a Pygame sound object based on a registered name."""
@@ -68,3 +79,13 @@ class AssetManager:
             return False
         self.font_dict[name] = font
         return True
+
+    def get_glyph_atlas(self, name: str, color: (int, int, int) = (255, 255, 255), bold: bool = False) -> GlyphAtlas:
+        """Retrieves a GlyphAtlas for a registered font, creating it on first use, or None if the font is not registered."""
+        key = (name, tuple(color), bold)
+        if key not in self.atlas_dict:
+            font = self.get_font(name)
+            if font is None:
+                return None
+            self.atlas_dict[key] = GlyphAtlas(font, color, bold)
+        return self.atlas_dict[key]
@@ -6,10 +6,12 @@
 # Purpose:
 #   A simple class for handling procedurally generated asteroids.
 # Notes:
+#   Asteroid shapes come from a shared pool generated once, so creating an asteroid does not draw a sprite.
 
 from .game_object import MovingGameObject
 from .vector2d import Vector2D
-from random import randint
+from .asset_manager import AssetManager
+from random import randint, Random
 from math import radians
 
 import pygame as pg
@@ -26,6 +28,12 @@ class Asteroid(MovingGameObject):
     ASTEROID_SPEED = [70, 50, 25]
     ASTEROID_VALUE = [10, 100, 1000]
     
+    # Shared shape pool, asteroids pick one of SHAPE_COUNT pre-generated shapes for their size-class.
+    SHAPE_COUNT = 16
+    SHAPE_SEED = 0
+    SHAPE_OUTLINES = None
+    SHAPE_SPRITES = None
+    
     # Precond:
     #   size is a number in the set {0, 1, 2} representing the size-class of the asteroid.
     #   anchor is a valid Vector2D object.
@@ -39,22 +47,8 @@ class Asteroid(MovingGameObject):
         super(Asteroid, self).__init__(anchor, Asteroid.ASTEROID_MIN_RADIUS[size], velocity)
         self.size = size
         self.max_radius = Asteroid.ASTEROID_MAX_RADIUS[size]
-        num_sections = Asteroid.ASTEROID_SECTIONS[self.size]
-        sections = []
-        sect_angle = radians(360//num_sections)
-        for _ in range(num_sections):
-            radius = randint(Asteroid.ASTEROID_MIN_RADIUS[self.size], Asteroid.ASTEROID_MAX_RADIUS[self.size])
-            sections.append(radius)
-        sqr_size = 2 * self.max_radius
-        self.sprite = pg.Surface((sqr_size, sqr_size), flags=pg.SRCALPHA)
-        self.sprite.fill((0, 0, 0, 0))
-        sprite_center = Vector2D(*self.sprite.get_rect().center)
-        for i in range(num_sections):
-            ang_vec = Vector2D.ang_to_vec((i*sect_angle))
-            p1 = ang_vec.scale(sections[i]).add(sprite_center).to_int_tuple()
-            ang_vec = Vector2D.ang_to_vec((i-1)*sect_angle)
-            p2 = ang_vec.scale(sections[i-1]).add(sprite_center).to_int_tuple()
-            pg.draw.line(self.sprite, (255, 0, 0), p1, p2, 2)
+        self.shape = Asteroid.random_shape()
+        self.sprite = Asteroid.get_shape_sprite(size, self.shape)
         
     # Precond:
     #   None.
@@ -92,14 +86,106 @@ class Asteroid(MovingGameObject):
     
     # Precond:
     #   screen is the Pygame Surface object where the object will be drawn.
+    #   alpha is a floating point number in [0, 1] indicating how far between simulation steps to draw.
     #
     # Postcond:
-    #   Override of the draw method for drawing the asteroid.
-    def draw(self, screen: pg.Surface):
-        """Override of the draw method for the asteroid."""
+    #   Returns the asteroid's sprite and where to blit it, or None if it is not visible.
+    def get_blit(self, alpha: float = 1.0) -> (pg.Surface, (int, int)):
+        """Override of the get_blit method for the asteroid."""
         if not self.visible:
-            return
-        anchor = self.get_anchor()
-        anchor = anchor.sub(Vector2D(Asteroid.ASTEROID_MAX_RADIUS[self.size], Asteroid.ASTEROID_MAX_RADIUS[self.size]))
-        screen.blit(self.sprite, anchor.to_int_tuple())
-        
\ No newline at end of file
+            return None
+        anchor = self.get_render_anchor(alpha)
+        max_radius = Asteroid.ASTEROID_MAX_RADIUS[self.size]
+        return self.sprite, (int(anchor[0] - max_radius), int(anchor[1] - max_radius))
+    
+    # =========================
+    #   Static Methods
+    # =========================
+    
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Generates the shared pool of asteroid shapes for every size-class.
+    @staticmethod
+    def build_shapes():
+        """Builds the shared pool of procedurally generated asteroid shapes."""
+        rng = Random(Asteroid.SHAPE_SEED)
+        outlines = []
+        sprites = []
+        for size in [Asteroid.SMALL, Asteroid.MEDIUM, Asteroid.LARGE]:
+            outlines.append([])
+            for _ in range(Asteroid.SHAPE_COUNT):
+                outline = Asteroid.create_outline(size, rng)
+                outlines[size].append(outline)
+                sprites.append(Asteroid.create_sprite(size, outline))
+        Asteroid.SHAPE_OUTLINES = outlines
+        Asteroid.SHAPE_SPRITES = sprites
+    
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns the sprites of the shape pool, indexed by (size * SHAPE_COUNT + shape).
+    @staticmethod
+    def get_shape_sprites() -> [pg.Surface]:
+        """Retrieves the shape pool sprites, building the pool if needed."""
+        if Asteroid.SHAPE_SPRITES is None:
+            Asteroid.build_shapes()
+        return Asteroid.SHAPE_SPRITES
+    
+    # Precond:
+    #   size is a number in the set {0, 1, 2} representing the size-class of the asteroid.
+    #   shape is a number in [0, SHAPE_COUNT) selecting a shape from the pool.
+    #
+    # Postcond:
+    #   Returns the pooled sprite for the given shape.
+    @staticmethod
+    def get_shape_sprite(size: int, shape: int) -> pg.Surface:
+        """Retrieves a single sprite from the shape pool."""
+        return Asteroid.get_shape_sprites()[size * Asteroid.SHAPE_COUNT + shape]
+    
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns a random shape index, drawn from the seeded global random sequence.
+    @staticmethod
+    def random_shape() -> int:
+        """Picks a shape from the shape pool."""
+        return randint(0, Asteroid.SHAPE_COUNT - 1)
+    
+    # Precond:
+    #   size is a number in the set {0, 1, 2} representing the size-class of the asteroid.
+    #   rng is a valid Random object.
+    #
+    # Postcond:
+    #   Returns a new procedurally generated outline, as a list of points in sprite coordinates.
+    @staticmethod
+    def create_outline(size: int, rng: Random) -> [(int, int)]:
+        """Procedurally generates an asteroid outline."""
+        max_radius = Asteroid.ASTEROID_MAX_RADIUS[size]
+        num_sections = Asteroid.ASTEROID_SECTIONS[size]
+        sect_angle = radians(360//num_sections)
+        sprite_center = Vector2D(max_radius, max_radius)
+        outline = []
+        for i in range(num_sections):
+            radius = rng.randint(Asteroid.ASTEROID_MIN_RADIUS[size], Asteroid.ASTEROID_MAX_RADIUS[size])
+            outline.append(Vector2D.ang_to_vec(i*sect_angle).scale(radius).add(sprite_center).to_int_tuple())
+        return outline
+    
+    # Precond:
+    #   size is a number in the set {0, 1, 2} representing the size-class of the asteroid.
+    #   outline is a list of points in sprite coordinates, as produced by create_outline.
+    #
+    # Postcond:
+    #   Returns a new asteroid sprite of the specified size with the given outline.
+    @staticmethod
+    def create_sprite(size: int, outline: [(int, int)]) -> pg.Surface:
+        """Draws an asteroid sprite."""
+        sqr_size = 2 * Asteroid.ASTEROID_MAX_RADIUS[size]
+        sprite = pg.Surface((sqr_size, sqr_size), flags=pg.SRCALPHA)
+        sprite.fill((0, 0, 0, 0))
+        for i in range(len(outline)):
+            pg.draw.line(sprite, (255, 0, 0), outline[i], outline[i-1], 2)
+        return AssetManager.convert_sprite(sprite)
@@ -0,0 +1,344 @@
+# File: asteroid_field.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   An array-backed container which simulates an entire field of asteroids at once.
+# Notes:
+#   Asteroid state is stored as a struct-of-arrays in NumPy arrays, rows [0, len) are in use.
+#   Sprites are not stored per asteroid, each row holds an index into the shared Asteroid shape pool.
+#   All random draws are made in the same order as the Asteroid class, so a seeded run
+#   produces the same asteroids as a list of Asteroid objects would.
+
+from .asteroid import Asteroid
+from .vector2d import Vector2D
+from random import randint
+from math import radians
+
+import numpy as np
+import pygame as pg
+
+
+class AsteroidField:
+    """A struct-of-arrays container for simulating many asteroids."""
+    # Unit vectors for every whole degree, built through Vector2D so results match the Asteroid class.
+    HEADINGS = np.array([Vector2D.ang_to_vec(radians(deg)).to_tuple() for deg in range(360)])
+    # Child placement for splits, indexed by the size-class of the parent.
+    SPLIT_ANGLES = [[], [135, 315], [45, 135, 225, 315]]
+    MIN_RADIUS = np.array(Asteroid.ASTEROID_MIN_RADIUS, dtype=np.float64)
+    MAX_RADIUS = np.array(Asteroid.ASTEROID_MAX_RADIUS, dtype=np.float64)
+    SPEED = np.array(Asteroid.ASTEROID_SPEED, dtype=np.float64)
+    VALUE = np.array(Asteroid.ASTEROID_VALUE, dtype=np.int64)
+    # Every per-asteroid array, in the order they are serialized
+    ARRAYS = ["position", "previous", "velocity", "radius", "size", "alive", "shape"]
+
+    # Precond:
+    #   capacity is the initial number of asteroids the field can hold before growing.
+    #
+    # Postcond:
+    #   Creates a new, empty AsteroidField.
+    def __init__(self, capacity: int = 64):
+        """AsteroidField constructor."""
+        capacity = max(capacity, 1)
+        self.count = 0
+        self.position = np.zeros((capacity, 2), dtype=np.float64)
+        self.previous = np.zeros((capacity, 2), dtype=np.float64)
+        self.velocity = np.zeros((capacity, 2), dtype=np.float64)
+        self.radius = np.zeros(capacity, dtype=np.float64)
+        self.size = np.zeros(capacity, dtype=np.int8)
+        self.alive = np.zeros(capacity, dtype=bool)
+        self.shape = np.zeros(capacity, dtype=np.int16)
+
+    def __len__(self) -> int:
+        return self.count
+
+    # Precond:
+    #   size is a number in the set {0, 1, 2} representing the size-class of the asteroid.
+    #   anchor is a valid Vector2D object.
+    #
+    # Postcond:
+    #   Adds a new asteroid to the field and returns its index.
+    def spawn(self, size: int, anchor: Vector2D) -> int:
+        """Adds a single asteroid to the field."""
+        self.__reserve(self.count + 1)
+        idx = self.count
+        self.position[idx] = anchor.x, anchor.y
+        self.previous[idx] = anchor.x, anchor.y
+        self.velocity[idx] = AsteroidField.HEADINGS[randint(0, 359)] * AsteroidField.SPEED[size]
+        self.radius[idx] = AsteroidField.MIN_RADIUS[size]
+        self.size[idx] = size
+        self.alive[idx] = True
+        self.shape[idx] = Asteroid.random_shape()
+        self.count += 1
+        return idx
+
+    # Precond:
+    #   other is a valid AsteroidField object.
+    #
+    # Postcond:
+    #   Appends every asteroid of the other field to the end of this field.
+    def extend(self, other: 'AsteroidField'):
+        """Adds all the asteroids from another field to this field."""
+        if other.count == 0:
+            return
+        self.__reserve(self.count + other.count)
+        dst = slice(self.count, self.count + other.count)
+        src = slice(0, other.count)
+        self.position[dst] = other.position[src]
+        self.previous[dst] = other.previous[src]
+        self.velocity[dst] = other.velocity[src]
+        self.radius[dst] = other.radius[src]
+        self.size[dst] = other.size[src]
+        self.alive[dst] = other.alive[src]
+        self.shape[dst] = other.shape[src]
+        self.count += other.count
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Records the current positions as the previous positions, for render interpolation.
+    def store_previous(self):
+        """Called at the start of each simulation step to remember asteroid positions."""
+        n = self.count
+        self.previous[:n] = self.position[:n]
+
+    # Precond:
+    #   delta is a floating point number indicating the time elapsed (in seconds) since the last update.
+    #
+    # Postcond:
+    #   Moves every asteroid along its velocity.
+    def update(self, delta: float):
+        """Update method for the whole field."""
+        n = self.count
+        self.position[:n] += self.velocity[:n] * delta
+
+    # Precond:
+    #   screen_dim is a tuple of integers representing the (width, height) of the screen.
+    #
+    # Postcond:
+    #   Bounces every asteroid which is not fully in the screen.
+    #   Matches MovingGameObject.in_bounds followed by MovingGameObject.bounce.
+    def bounce(self, screen_dim: (int, int)):
+        """Bounces asteroids off the edges of the screen."""
+        n = self.count
+        pos = self.position[:n]
+        r = self.radius[:n, np.newaxis]
+        dim = np.array(screen_dim, dtype=np.float64)
+        min_pt = pos - r
+        max_pt = pos + r
+        in_bounds = np.all((0 <= min_pt) & (min_pt < dim) & (0 <= max_pt) & (max_pt < dim), axis=1)
+        hit_wall = ~in_bounds[:, np.newaxis] & ((min_pt < 0) | (max_pt > dim))
+        self.__clamp(np.any(hit_wall, axis=1), screen_dim, False)
+        self.velocity[:n][hit_wall] *= -1
+
+    # Precond:
+    #   screen_dim is a tuple of integers representing the (width, height) of the screen.
+    #   indices is a valid index or index array into the field, or None for the whole field.
+    #
+    # Postcond:
+    #   Clamps the selected asteroids to the edge of the screen.
+    def clamp(self, screen_dim: (int, int), indices=None, vel_zero=True):
+        """Clamps asteroids to the edges of the screen."""
+        mask = np.zeros(self.count, dtype=bool)
+        mask[slice(None) if indices is None else indices] = True
+        self.__clamp(mask, screen_dim, vel_zero)
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns a view of the positions of every asteroid in the field.
+    def positions(self) -> np.ndarray:
+        """Retrieves the asteroid positions."""
+        return self.position[:self.count]
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns a view of the collider radii of every asteroid in the field.
+    def radii(self) -> np.ndarray:
+        """Retrieves the asteroid collider radii."""
+        return self.radius[:self.count]
+
+    # Precond:
+    #   anchor is a valid Vector2D object.
+    #   radius is a floating point number.
+    #   candidates is an ascending array of indices to check, or None to check the whole field.
+    #
+    # Postcond:
+    #   Returns the indices, in ascending order, of every asteroid which intersects the given circle.
+    #   Uses the same test as CircleCollider.has_collided.
+    def collide(self, anchor: Vector2D, radius: float, candidates: np.ndarray = None) -> np.ndarray:
+        """Checks a single circle against the asteroids in the field."""
+        if candidates is None:
+            candidates = np.arange(self.count)
+        offset = self.position[candidates] - (anchor.x, anchor.y)
+        dist_sq = offset[:, 0] * offset[:, 0] + offset[:, 1] * offset[:, 1]
+        reach = self.radius[candidates] + radius
+        return candidates[dist_sq < reach * reach]
+
+    # Precond:
+    #   indices is a sequence of valid indices into the field, repeats are allowed.
+    #   children is an AsteroidField to reuse for the result, or None to create a new field.
+    #
+    # Postcond:
+    #   Returns an AsteroidField containing the asteroids created when the given asteroids are destroyed.
+    #   Children are ordered as if Asteroid.split had been called on each index in turn.
+    def split(self, indices, children: 'AsteroidField' = None) -> 'AsteroidField':
+        """Splits asteroids into smaller asteroids."""
+        indices = np.asarray(indices, dtype=np.intp)
+        sizes = self.size[indices]
+        counts = np.array([len(angles) for angles in AsteroidField.SPLIT_ANGLES])[sizes]
+        parents = np.repeat(indices, counts)
+        child_sizes = np.repeat(sizes - 1, counts)
+        angles = np.concatenate([AsteroidField.SPLIT_ANGLES[s] for s in sizes] + [[]]).astype(np.intp)
+        distances = (AsteroidField.MAX_RADIUS[sizes] // 2).repeat(counts)
+        offsets = AsteroidField.HEADINGS[angles] * distances[:, np.newaxis]
+        if children is None:
+            children = AsteroidField(len(parents))
+        children.count = 0
+        children.__reserve(len(parents))
+        children.count = len(parents)
+        children.position[:len(parents)] = offsets + self.position[parents]
+        children.previous[:len(parents)] = children.position[:len(parents)]
+        children.radius[:len(parents)] = AsteroidField.MIN_RADIUS[child_sizes]
+        children.size[:len(parents)] = child_sizes
+        children.alive[:len(parents)] = True
+        # Random draws are made per child to keep the seeded random sequence of the Asteroid class.
+        headings = np.empty(len(parents), dtype=np.intp)
+        for i in range(len(parents)):
+            headings[i] = randint(0, 359)
+            children.shape[i] = Asteroid.random_shape()
+        children.velocity[:len(parents)] = AsteroidField.HEADINGS[headings] * \
+            AsteroidField.SPEED[child_sizes, np.newaxis]
+        return children
+
+    # Precond:
+    #   indices is a sequence of valid indices into the field.
+    #
+    # Postcond:
+    #   Returns the total point value of the given asteroids.
+    def point_value(self, indices) -> int:
+        """Sums the point values of a set of asteroids."""
+        return int(AsteroidField.VALUE[self.size[np.asarray(indices, dtype=np.intp)]].sum())
+
+    # Precond:
+    #   indices is a sequence of valid indices into the field.
+    #
+    # Postcond:
+    #   Marks the given asteroids as destroyed, they are removed by the next call to compact.
+    def kill(self, indices):
+        """Flags asteroids for removal."""
+        self.alive[np.asarray(indices, dtype=np.intp)] = False
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Removes every destroyed asteroid, keeping the remaining asteroids in order.
+    def compact(self):
+        """Removes all flagged asteroids from the field."""
+        n = self.count
+        keep = np.flatnonzero(self.alive[:n])
+        if len(keep) == n:
+            return
+        m = len(keep)
+        self.position[:m] = self.position[keep]
+        self.previous[:m] = self.previous[keep]
+        self.velocity[:m] = self.velocity[keep]
+        self.radius[:m] = self.radius[keep]
+        self.size[:m] = self.size[keep]
+        self.alive[:m] = True
+        self.alive[m:n] = False
+        self.shape[:m] = self.shape[keep]
+        self.count = m
+
+    # Precond:
+    #   screen is the Pygame Surface object where the field will be drawn.
+    #   alpha is a floating point number in [0, 1] indicating how far between simulation steps to draw.
+    #
+    # Postcond:
+    #   Draws every asteroid in the field to the screen, returning the list of Rects drawn to.
+    def draw(self, screen: pg.Surface, alpha: float = 1.0) -> [pg.Rect]:
+        """Draws the whole field."""
+        return screen.blits(self.get_blits(alpha))
+
+    # Precond:
+    #   alpha is a floating point number in [0, 1] indicating how far between simulation steps to draw.
+    #   indices is an array of asteroid indices to draw, or None for the whole field.
+    #   offset is the (x, y) position subtracted from every blit position, such as a camera offset.
+    #
+    # Postcond:
+    #   Returns the (sprite, position) pair for every selected asteroid, for use with Surface.blits.
+    def get_blits(self, alpha: float = 1.0, indices: np.ndarray = None,
+                  offset: (int, int) = (0, 0)) -> [(pg.Surface, (int, int))]:
+        """Retrieves the (sprite, position) pairs for drawing the field."""
+        if indices is None:
+            indices = slice(0, self.count)
+        position = self.position[indices]
+        if alpha < 1:
+            previous = self.previous[indices]
+            position = previous + alpha * (position - previous)
+        size = self.size[indices]
+        max_radius = AsteroidField.MAX_RADIUS[size, np.newaxis]
+        anchors = ((position - max_radius).astype(np.int64) - np.array(offset, dtype=np.int64)).tolist()
+        sprite_ids = (size.astype(np.intp) * Asteroid.SHAPE_COUNT + self.shape[indices]).tolist()
+        sprites = Asteroid.get_shape_sprites()
+        return [(sprites[sprite_id], anchor) for sprite_id, anchor in zip(sprite_ids, anchors)]
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns the raw bytes of every array's rows in use, in ARRAYS order.
+    def to_bytes(self) -> bytes:
+        """Serializes the field's state."""
+        n = self.count
+        return b"".join(getattr(self, name)[:n].tobytes() for name in AsteroidField.ARRAYS)
+
+    # Precond:
+    #   data is a bytes-like object produced by to_bytes.
+    #   count is the number of asteroids the data holds.
+    #
+    # Postcond:
+    #   Replaces the field's asteroids with those in the data, or raises ValueError if it is the wrong length.
+    def from_bytes(self, data: bytes, count: int):
+        """Restores the field's state."""
+        if len(data) != count * sum(getattr(self, name)[:1].nbytes for name in AsteroidField.ARRAYS):
+            raise ValueError(f"Data does not hold {count} asteroids")
+        self.__reserve(count)
+        idx = 0
+        for name in AsteroidField.ARRAYS:
+            array = getattr(self, name)
+            length = count * array[:1].nbytes
+            array[:count] = np.frombuffer(data, dtype=array.dtype, count=count * array[0].size,
+                                          offset=idx).reshape((count,) + array.shape[1:])
+            idx += length
+        self.alive[count:] = False
+        self.count = count
+
+    def __reserve(self, capacity: int):
+        """Grows the backing arrays to hold at least the given number of asteroids."""
+        if capacity <= len(self.radius):
+            return
+        capacity = max(capacity, 2 * len(self.radius))
+        for name in AsteroidField.ARRAYS:
+            old = getattr(self, name)
+            new = np.zeros((capacity,) + old.shape[1:], dtype=old.dtype)
+            new[:self.count] = old[:self.count]
+            setattr(self, name, new)
+
+    def __clamp(self, mask: np.ndarray, screen_dim: (int, int), vel_zero: bool):
+        """Clamps the masked asteroids to the edges of the screen."""
+        n = self.count
+        pos = self.position[:n][mask]
+        r = self.radius[:n][mask, np.newaxis]
+        clamped = np.minimum(np.maximum(r, pos), np.array(screen_dim, dtype=np.float64) - r)
+        if vel_zero:
+            vel = self.velocity[:n][mask]
+            vel[clamped != pos] = 0
+            self.velocity[:n][mask] = vel
+        self.position[:n][mask] = clamped
@@ -18,12 +18,11 @@ class Button:
         """Button constructor"""
         if min_dim is None:
             min_dim = 0, 0
-        self.font = AssetManager.get_instance().get_font("medium")
-        self.font.set_bold(False)
+        self.font = AssetManager.get_instance().get_glyph_atlas("medium", text_color)
         self.padding = 10
         self.anchor = None
         self.label = label
-        label_surf = self.font.render(self.label, True, text_color)
+        label_surf = self.font.render(self.label)
         self.dim = max(label_surf.get_width(), int(min_dim[0])) + self.padding, max(label_surf.get_height(), int(min_dim[1])) + self.padding
         self.surf = pg.Surface(self.dim, flags=pg.SRCALPHA)
         label_anchor = (self.dim[0] - label_surf.get_width())//2, (self.dim[1] - label_surf.get_height())//2
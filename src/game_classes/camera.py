@@ -0,0 +1,69 @@
+# File: camera.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   A simple camera for viewing a part of a level which is larger than the screen.
+# Notes:
+#   The camera centers on a point, but never scrolls past the edges of the world.
+
+import pygame as pg
+
+
+class Camera:
+    """A scrolling view into the level's world."""
+
+    # Precond:
+    #   view_dim is a tuple of integers representing the (width, height) of the screen.
+    #   world_dim is a tuple of integers representing the (width, height) of the world.
+    #
+    # Postcond:
+    #   Creates a new Camera looking at the top left corner of the world.
+    def __init__(self, view_dim: (int, int), world_dim: (int, int)):
+        """Camera constructor."""
+        self.view_dim = view_dim
+        self.world_dim = world_dim
+        self.offset = (0, 0)
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns true if the world is larger than the view, so the camera can scroll.
+    def scrolls(self) -> bool:
+        """Checks if the camera ever needs to move."""
+        return self.world_dim[0] > self.view_dim[0] or self.world_dim[1] > self.view_dim[1]
+
+    # Precond:
+    #   center is the (x, y) world position the camera should center on.
+    #
+    # Postcond:
+    #   Moves the camera as close to centering on the position as the world's edges allow.
+    def follow(self, center: (float, float)):
+        """Centers the camera on a position."""
+        self.offset = (Camera.__clamp(center[0] - self.view_dim[0] / 2, self.world_dim[0] - self.view_dim[0]),
+                       Camera.__clamp(center[1] - self.view_dim[1] / 2, self.world_dim[1] - self.view_dim[1]))
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns the (x, y) world position of the top left corner of the screen.
+    def get_offset(self) -> (int, int):
+        """Retrieves the camera's offset."""
+        return self.offset
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns the area of the world currently on screen.
+    def get_viewport(self) -> pg.Rect:
+        """Retrieves the camera's view in world coordinates."""
+        return pg.Rect(self.offset, self.view_dim)
+
+    @staticmethod
+    def __clamp(offset: float, max_offset: int) -> int:
+        """Keeps an offset within [0, max_offset]."""
+        return int(min(max(offset, 0), max(max_offset, 0)))
@@ -6,8 +6,11 @@
 # Purpose:
 #   A simple collider class for determining collisions between circles.
 # Notes:
+#   Collisions are tested on squared distances, avoiding a square root per pair.
 
-from .vector2d import Vector2D
+from .vector2d import Vector2D, MutableVector2D
+
+import numpy as np
 
 
 class CircleCollider:
@@ -16,10 +19,10 @@ class CircleCollider:
     #   radius is a floating point number.
     #
     # Postcond:
-    #   Creates a new CircleCollider object.
+    #   Creates a new CircleCollider object, which owns a mutable copy of the anchor.
     def __init__(self, anchor: Vector2D, radius: float):
         """CircleCollider Constructor"""
-        self.anchor = anchor
+        self.anchor = MutableVector2D(anchor.x, anchor.y)
         self.radius = radius
     
     # Precond:
@@ -29,13 +32,17 @@ class CircleCollider:
     #   Returns true if this collider and the other collider intersect.
     def has_collided(self, other: 'CircleCollider'):
         """Checks if this collider collides with another collider"""
-        return self.anchor.sub(other.get_anchor()).magnitude() < (self.radius + other.radius)
+        dx = self.anchor.x - other.anchor.x
+        dy = self.anchor.y - other.anchor.y
+        reach = self.radius + other.radius
+        return ((dx * dx) + (dy * dy)) < (reach * reach)
 
     # Precond:
     #   None.
     #
     # Postcond:
     #   Returns the current anchor for this collider.
+    #   The anchor is updated in place as the collider moves.
     def get_anchor(self) -> Vector2D:
         """Returns the anchor for this collider"""
         return self.anchor
@@ -56,7 +63,17 @@ class CircleCollider:
     #   Updates the current anchor for this collider.
     def move(self, by: Vector2D):
         """Moves the anchor by a specified amount"""
-        self.anchor = self.anchor.add(by)
+        self.anchor.iadd(by)
+    
+    # Precond:
+    #   by is a valid Vector2D object.
+    #   factor is a floating-point value.
+    #
+    # Postcond:
+    #   Updates the current anchor for this collider.
+    def move_scaled(self, by: Vector2D, factor: float):
+        """Moves the anchor by a specified amount scaled by a factor"""
+        self.anchor.iadd_scaled(by, factor)
     
     # Precond:
     #   to is a valid Vector2D object.
@@ -65,4 +82,33 @@ class CircleCollider:
     #   Updates the current anchor for this collider.
     def move_to(self, to: Vector2D):
         """Changes the anchor to the provided location"""
-        self.anchor = to
\ No newline at end of file
+        self.anchor.set(to.x, to.y)
+    
+    # =========================
+    #   Static Methods
+    # =========================
+    
+    # Precond:
+    #   a_centers is an (n, 2) array of circle centers.
+    #   a_radii is an array of n circle radii.
+    #   b_centers is an (m, 2) array of circle centers.
+    #   b_radii is an array of m circle radii.
+    #   candidates is a pair of equal length index arrays (a_indices, b_indices) restricting the pairs
+    #     which are tested, or None to test every pair.
+    #
+    # Postcond:
+    #   Returns a (k, 2) array of every intersecting (a_index, b_index) pair.
+    #   Pairs are ordered as the candidates are, or lexicographically when every pair is tested.
+    @staticmethod
+    def collide_many(a_centers: np.ndarray, a_radii: np.ndarray, b_centers: np.ndarray, b_radii: np.ndarray,
+                     candidates: (np.ndarray, np.ndarray) = None) -> np.ndarray:
+        """Checks two sets of circles against each other, returning every colliding index pair"""
+        if candidates is None:
+            a_idx, b_idx = np.indices((len(a_radii), len(b_radii))).reshape(2, -1)
+        else:
+            a_idx, b_idx = candidates
+        offset = a_centers[a_idx] - b_centers[b_idx]
+        dist_sq = offset[:, 0] * offset[:, 0] + offset[:, 1] * offset[:, 1]
+        reach = a_radii[a_idx] + b_radii[b_idx]
+        hit = dist_sq < reach * reach
+        return np.column_stack((a_idx[hit], b_idx[hit]))
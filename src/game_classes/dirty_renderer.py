@@ -0,0 +1,69 @@
+# File: dirty_renderer.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   A simple renderer which only clears and updates the parts of the screen drawn each frame.
+# Notes:
+#   Each frame the regions drawn on the previous frame are cleared to the background, the frame is
+#   drawn, and only the previous and current regions are sent to the display.
+#   Anything drawn without reporting its rectangle is only shown after a full refresh.
+
+import pygame as pg
+
+
+class DirtyRenderer:
+    """A dirty-rectangle renderer for mostly static screens."""
+
+    # Precond:
+    #   screen is the Pygame display Surface.
+    #   background is the color used to clear the screen.
+    #   enabled is false to fall back to clearing and flipping the whole screen every frame.
+    #
+    # Postcond:
+    #   Creates a new DirtyRenderer, the first frame is always a full refresh.
+    def __init__(self, screen: pg.Surface, background: (int, int, int) = (0, 0, 0), enabled: bool = True):
+        """DirtyRenderer constructor."""
+        self.screen = screen
+        self.background = background
+        self.enabled = enabled
+        self.previous = []
+        self.full_refresh = True
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Forces the next frame to be a full refresh.
+    def invalidate(self):
+        """Requests a full refresh on the next frame."""
+        self.full_refresh = True
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Clears the regions drawn last frame, or the whole screen on a full refresh.
+    def begin_frame(self):
+        """Prepares the screen for drawing a new frame."""
+        if not self.enabled or self.full_refresh:
+            self.screen.fill(self.background)
+            return
+        for rect in self.previous:
+            self.screen.fill(self.background, rect)
+
+    # Precond:
+    #   rects is a list of Pygame Rect objects (or None) covering everything drawn this frame.
+    #
+    # Postcond:
+    #   Sends the changed regions of the screen to the display.
+    def end_frame(self, rects: [pg.Rect]):
+        """Presents the drawn frame."""
+        rects = [rect for rect in rects if rect is not None]
+        if not self.enabled or self.full_refresh:
+            pg.display.flip()
+            self.full_refresh = False
+        else:
+            pg.display.update(self.previous + rects)
+        self.previous = rects
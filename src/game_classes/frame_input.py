@@ -0,0 +1,74 @@
+# File: frame_input.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   A simple data class holding the player's input for a single frame.
+# Notes:
+#   Decouples the Level simulation from Pygame's keyboard and joystick APIs, so levels can be
+#   stepped without a display.
+
+from .game_config import GameConfig
+
+import pygame as pg
+
+
+class FrameInput:
+    """A data class for a single frame of player input."""
+
+    # Precond:
+    #   rotation is -1 for counterclockwise, 1 for clockwise, or 0 for no rotation.
+    #   throttle is 1 for forward, -1 for backward, or 0 for no throttle.
+    #   halt is true if the ship should be halted, which overrides throttle.
+    #   fire is true if the ship should fire.
+    #
+    # Postcond:
+    #   Creates a new FrameInput object.
+    def __init__(self, rotation: int = 0, throttle: int = 0, halt: bool = False, fire: bool = False):
+        """FrameInput constructor."""
+        self.rotation = rotation
+        self.throttle = throttle
+        self.halt = halt
+        self.fire = fire
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns a FrameInput built from the current state of the configured controller.
+    @staticmethod
+    def poll() -> 'FrameInput':
+        """Reads the current frame's input from the keyboard or gamepad."""
+        result = FrameInput()
+        if GameConfig.get_setting("controller") == "KEYBOARD":
+            pressed = pg.key.get_pressed()
+            # Rotational input
+            if pressed[pg.K_a]:
+                result.rotation = -1
+            elif pressed[pg.K_d]:
+                result.rotation = 1
+            # Throttle input
+            if pressed[pg.K_f]:
+                result.halt = True
+            elif pressed[pg.K_w]:
+                result.throttle = 1
+            elif pressed[pg.K_s]:
+                result.throttle = -1
+            # Trigger input
+            result.fire = bool(pressed[pg.K_SPACE])
+        elif GameConfig.get_setting("controller") == "GAMEPAD":
+            joystick = GameConfig.get_setting("gamepad")
+            x_axis = joystick.get_axis(GameConfig.get_setting("X-axis"))
+            y_axis = joystick.get_axis(GameConfig.get_setting("Y-axis"))
+            x_axis, y_axis = round(x_axis), round(y_axis)
+            if x_axis in [-1, 1]:
+                result.rotation = x_axis
+            # Throttle input
+            if joystick.get_button(GameConfig.get_setting("B")):
+                result.halt = True
+            elif y_axis in [-1, 1]:
+                result.throttle = -y_axis
+            # Trigger input
+            result.fire = bool(joystick.get_button(GameConfig.get_setting("A")))
+        return result
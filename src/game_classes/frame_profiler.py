@@ -0,0 +1,112 @@
+# File: frame_profiler.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   A lightweight profiler which times the phases of each frame.
+# Notes:
+#   Callers time a phase by passing the mark made when it started to record, which returns a new mark
+#   so the next phase can start from it. Marks are perf_counter times. Time spent in a phase is summed until the frame ends.
+#   Rolling statistics, the overlay and exports are kept by PhaseRecorder.
+#   Code being profiled holds None instead of a profiler when profiling is off, so it only pays for a check.
+#   A profiler is not thread-safe, code running on another thread records to its own profiler, which is
+#   merged into the main one while both threads are synchronized.
+
+from .phase_recorder import PhaseRecorder
+
+from time import perf_counter
+
+import numpy as np
+
+
+class FrameProfiler(PhaseRecorder):
+    """Times the phases of each frame, keeping rolling and whole-session statistics."""
+
+    # Precond:
+    #   window is the number of recent frames the rolling statistics cover.
+    #
+    # Postcond:
+    #   Creates a new FrameProfiler with no recorded frames.
+    def __init__(self, window: int = 240):
+        """FrameProfiler constructor."""
+        super(FrameProfiler, self).__init__(window)
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns the current time, to pass to record when the phase ends.
+    def mark(self) -> float:
+        """Marks the start of a phase."""
+        return perf_counter()
+
+    # Precond:
+    #   phase is the name of the phase being timed.
+    #   since is the perf_counter time the phase started.
+    #
+    # Postcond:
+    #   Adds the time since the phase started to the current frame, returning the current time.
+    def record(self, phase: str, since: float) -> float:
+        """Records the end of a phase."""
+        now = perf_counter()
+        if phase not in self.current:
+            self.add_phase(phase)
+        self.current[phase] += now - since
+        return now
+
+    # Precond:
+    #   other is a FrameProfiler which nothing else is recording to during the call.
+    #
+    # Postcond:
+    #   Adds the other profiler's phase times for its current frame to this profiler's current frame,
+    #   then starts the other profiler's current frame over.
+    def merge(self, other: 'FrameProfiler'):
+        """Moves another profiler's unfinished frame into this one."""
+        for phase, elapsed in other.current.items():
+            if phase not in self.current:
+                self.add_phase(phase)
+            self.current[phase] += elapsed
+            other.current[phase] = 0.0
+
+    # Precond:
+    #   column is an array of a single phase's times (in seconds), one per frame.
+    #
+    # Postcond:
+    #   Returns the mean, 95th and 99th percentile times (in milliseconds.)
+    def summarize(self, column: np.ndarray) -> dict:
+        """Summarizes a phase's times."""
+        if len(column) == 0:
+            return {"mean": 0.0, "p95": 0.0, "p99": 0.0}
+        p95, p99 = np.percentile(column, [95, 99]) * 1000
+        return {"mean": float(column.mean() * 1000), "p95": float(p95), "p99": float(p99)}
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns the overlay's lines, each phase's rolling mean, 95th and 99th percentile times.
+    def overlay_lines(self) -> [str]:
+        """Creates the profiler overlay's text."""
+        lines = [f"{'phase':<8}{'mean':>7}{'p95':>7}{'p99':>7}"]
+        for phase, stat in self.get_stats().items():
+            lines.append(f"{phase:<8}{stat['mean']:7.2f}{stat['p95']:7.2f}{stat['p99']:7.2f}")
+        return lines
+
+    # Precond:
+    #   frame is the index of a recorded frame.
+    #
+    # Postcond:
+    #   Returns the frame's phase times (in milliseconds) as CSV values.
+    def csv_row(self, frame: int) -> list:
+        """Creates a frame's CSV row."""
+        return [f"{elapsed * 1000:.4f}" for elapsed in self.history[frame]]
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns every recorded frame's phase times (in milliseconds), for the JSON export.
+    def report(self) -> dict:
+        """Creates the profiler's extra JSON export entries."""
+        return {"samples": [[round(elapsed * 1000, 4) for elapsed in times] for times in self.history]}
@@ -0,0 +1,105 @@
+# File: frame_snapshot.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   Classes for handing the drawable state of a level from the simulation to the renderer.
+# Notes:
+#   A FrameSnapshot is built once per simulation step and never modified afterwards, so the renderer
+#   can read it while the simulation is already producing the next one.
+
+from time import perf_counter
+import threading
+
+import pygame as pg
+
+
+class FrameSnapshot:
+    """The drawable state of a level after a single simulation step."""
+    __slots__ = ("sprites", "previous", "current", "score", "lives", "focus", "counts", "time")
+
+    # Precond:
+    #   sprites is a tuple of Pygame Surfaces, one for each drawn entity.
+    #   previous is a tuple of the entities' blit positions at the start of the step.
+    #   current is a tuple of the entities' blit positions at the end of the step.
+    #   score is the player's score.
+    #   lives is the player's remaining lives.
+    #   focus is the pair of the camera's (x, y) focus at the start and end of the step.
+    #   counts is the number of (asteroids, pellets) in the level, including any not drawn.
+    #
+    # Postcond:
+    #   Creates a new FrameSnapshot, timestamped with the current time.
+    def __init__(self, sprites: tuple, previous: tuple, current: tuple, score: int, lives: int,
+                 focus: ((float, float), (float, float)) = ((0, 0), (0, 0)), counts: (int, int) = (0, 0)):
+        """FrameSnapshot constructor."""
+        self.sprites = sprites
+        self.previous = previous
+        self.current = current
+        self.score = score
+        self.lives = lives
+        self.focus = focus
+        self.counts = counts
+        self.time = perf_counter()
+
+    # Precond:
+    #   alpha is a floating point number in [0, 1] indicating how far between the previous and current
+    #   positions to draw.
+    #   offset is the (x, y) position subtracted from every blit position, such as a camera offset.
+    #
+    # Postcond:
+    #   Returns the (sprite, position) pairs for every entity, for use with Surface.blits.
+    def get_blits(self, alpha: float = 1.0, offset: (int, int) = (0, 0)) -> [(pg.Surface, (int, int))]:
+        """Retrieves the interpolated blits for the snapshot."""
+        if alpha >= 1 and offset == (0, 0):
+            return list(zip(self.sprites, self.current))
+        return [(sprite, (int(prev[0] + alpha * (cur[0] - prev[0])) - offset[0],
+                          int(prev[1] + alpha * (cur[1] - prev[1])) - offset[1]))
+                for sprite, prev, cur in zip(self.sprites, self.previous, self.current)]
+
+    # Precond:
+    #   alpha is a floating point number in [0, 1] indicating how far between the start and end of the step.
+    #
+    # Postcond:
+    #   Returns the interpolated (x, y) position the camera should center on.
+    def get_focus(self, alpha: float = 1.0) -> (float, float):
+        """Retrieves the interpolated camera focus."""
+        prev, cur = self.focus
+        return prev[0] + alpha * (cur[0] - prev[0]), prev[1] + alpha * (cur[1] - prev[1])
+
+
+class SnapshotBuffer:
+    """A double buffer of FrameSnapshots shared between one producer and one consumer thread."""
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Creates a new, empty SnapshotBuffer.
+    def __init__(self):
+        """SnapshotBuffer constructor."""
+        self.buffers = [None, None]
+        self.front = 0
+        self.lock = threading.Lock()
+
+    # Precond:
+    #   snapshot is a valid FrameSnapshot object.
+    #
+    # Postcond:
+    #   Writes the snapshot to the back buffer, then swaps it to the front.
+    def publish(self, snapshot: FrameSnapshot):
+        """Makes a new snapshot available to the consumer."""
+        back = 1 - self.front
+        self.buffers[back] = snapshot
+        with self.lock:
+            self.front = back
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns the most recently published snapshot, or None if nothing has been published.
+    def latest(self) -> FrameSnapshot:
+        """Retrieves the front buffer."""
+        with self.lock:
+            return self.buffers[self.front]
@@ -0,0 +1,216 @@
+# File: frame_telemetry.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   Classes for keeping frame time histograms for each level, and logging them to a rotating file.
+# Notes:
+#   Histogram buckets are log-linear, like an HDR histogram: values (in microseconds) below 2^SUB_BUCKET_BITS
+#   each get their own bucket, and every doubling above that is split into 2^(SUB_BUCKET_BITS - 1) buckets,
+#   so any recorded value is known to within 1/16 of itself, using a few hundred buckets at most.
+#   Each level is logged as a single line of JSON when it ends, including its non-empty buckets as
+#   [lower bound, count] pairs, so histograms from many levels or sessions can be merged later.
+#   The log rotates when it reaches max_bytes, keeping the given number of old logs, so its size is bounded.
+
+from datetime import datetime
+import json
+import logging
+import logging.handlers
+
+
+class Histogram:
+    """A log-linear histogram of durations, with bounded relative error."""
+    SUB_BUCKET_BITS = 5
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Creates a new, empty Histogram.
+    def __init__(self):
+        """Histogram constructor."""
+        self.buckets = {}
+        self.count = 0
+        self.total = 0
+        self.min = None
+        self.max = None
+
+    # Precond:
+    #   seconds is a non-negative duration.
+    #
+    # Postcond:
+    #   Adds the duration to the histogram.
+    def record(self, seconds: float):
+        """Records a single duration."""
+        value = max(int(seconds * 1000000), 0)
+        idx = Histogram.__index(value)
+        self.buckets[idx] = self.buckets.get(idx, 0) + 1
+        self.count += 1
+        self.total += value
+        if self.min is None or value < self.min:
+            self.min = value
+        if self.max is None or value > self.max:
+            self.max = value
+
+    # Precond:
+    #   percent is a number in [0, 100].
+    #
+    # Postcond:
+    #   Returns the duration (in milliseconds) which the given percent of recorded durations are at or below.
+    #   Returns 0 if nothing has been recorded.
+    def percentile(self, percent: float) -> float:
+        """Retrieves a percentile of the recorded durations."""
+        if self.count == 0:
+            return 0.0
+        target = max(percent / 100 * self.count, 1)
+        seen = 0
+        for idx in sorted(self.buckets):
+            seen += self.buckets[idx]
+            if seen >= target:
+                # The highest value in the bucket, never reporting more than was recorded
+                return min(Histogram.__lower_bound(idx + 1) - 1, self.max) / 1000
+        return self.max / 1000
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns a dictionary summarizing the histogram in milliseconds, along with its non-empty buckets.
+    def summary(self) -> dict:
+        """Summarizes the histogram."""
+        if self.count == 0:
+            return {"count": 0}
+        return {
+            "count": self.count,
+            "mean": self.total / self.count / 1000,
+            "min": self.min / 1000,
+            "p50": self.percentile(50),
+            "p90": self.percentile(90),
+            "p99": self.percentile(99),
+            "p999": self.percentile(99.9),
+            "max": self.max / 1000,
+            "buckets_us": [[Histogram.__lower_bound(idx), self.buckets[idx]] for idx in sorted(self.buckets)]
+        }
+
+    @staticmethod
+    def __index(value: int) -> int:
+        """Finds the bucket a value (in microseconds) falls in."""
+        sub_count = 1 << Histogram.SUB_BUCKET_BITS
+        if value < sub_count:
+            return value
+        shift = value.bit_length() - Histogram.SUB_BUCKET_BITS
+        half = sub_count >> 1
+        return sub_count + (shift - 1) * half + (value >> shift) - half
+
+    @staticmethod
+    def __lower_bound(idx: int) -> int:
+        """Finds the smallest value (in microseconds) in a bucket."""
+        sub_count = 1 << Histogram.SUB_BUCKET_BITS
+        if idx < sub_count:
+            return idx
+        half = sub_count >> 1
+        shift = (idx - sub_count) // half + 1
+        return (half + (idx - sub_count) % half) << shift
+
+
+class FrameTelemetry:
+    """Keeps frame time telemetry for each level, logging it when the level ends."""
+    MAX_BYTES = 1 << 20
+    BACKUPS = 3
+
+    # Precond:
+    #   filename is the path of the log file.
+    #   frame_delta is the time (in seconds) a frame is budgeted, frames taking longer to process overrun.
+    #   max_bytes is the size the log may reach before it is rotated.
+    #   backups is the number of rotated logs kept.
+    #
+    # Postcond:
+    #   Creates a new FrameTelemetry, opening the log file for appending.
+    def __init__(self, filename: str, frame_delta: float, max_bytes: int = MAX_BYTES, backups: int = BACKUPS):
+        """FrameTelemetry constructor."""
+        self.frame_delta = frame_delta
+        self.handler = logging.handlers.RotatingFileHandler(filename, maxBytes=max_bytes, backupCount=backups)
+        self.handler.setFormatter(logging.Formatter("%(message)s"))
+        self.logger = logging.getLogger(f"{__name__}.{filename}")
+        self.logger.setLevel(logging.INFO)
+        self.logger.propagate = False
+        self.logger.addHandler(self.handler)
+        self.level = None
+        self.__reset()
+
+    # Precond:
+    #   level is the number of the level which is starting.
+    #
+    # Postcond:
+    #   Logs the telemetry of the previous level, if it had any frames, then starts keeping it for the new level.
+    def begin_level(self, level: int):
+        """Marks the start of a new level."""
+        self.flush()
+        self.level = level
+
+    # Precond:
+    #   frame_time is the time (in seconds) since the previous frame started.
+    #   work_time is the time (in seconds) spent processing the frame.
+    #   latency is the time (in seconds) from the simulation step shown by the frame to it being presented.
+    #   asteroids is the number of asteroids in the level.
+    #   pellets is the number of pellets in the level.
+    #
+    # Postcond:
+    #   Adds the frame to the current level's telemetry.
+    def record_frame(self, frame_time: float, work_time: float, latency: float, asteroids: int, pellets: int):
+        """Records a single frame."""
+        self.frame_times.record(frame_time)
+        self.latencies.record(latency)
+        if work_time > self.frame_delta:
+            self.overruns += 1
+        self.asteroids[0] = min(self.asteroids[0], asteroids)
+        self.asteroids[1] = max(self.asteroids[1], asteroids)
+        self.asteroids[2] += asteroids
+        self.pellets[0] = min(self.pellets[0], pellets)
+        self.pellets[1] = max(self.pellets[1], pellets)
+        self.pellets[2] += pellets
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Logs the current level's telemetry as a line of JSON, if it has any frames, then starts it over.
+    def flush(self):
+        """Writes the current level's telemetry to the log."""
+        frames = self.frame_times.count
+        if frames == 0:
+            return
+        self.logger.info(json.dumps({
+            "time": datetime.now().isoformat(timespec="seconds"),
+            "level": self.level,
+            "frames": frames,
+            "overruns": self.overruns,
+            "frame_delta_ms": self.frame_delta * 1000,
+            "asteroids": {"min": self.asteroids[0], "max": self.asteroids[1], "mean": self.asteroids[2] / frames},
+            "pellets": {"min": self.pellets[0], "max": self.pellets[1], "mean": self.pellets[2] / frames},
+            "frame_ms": self.frame_times.summary(),
+            "latency_ms": self.latencies.summary()
+        }))
+        self.handler.flush()
+        self.__reset()
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Logs the current level's telemetry and closes the log file.
+    def close(self):
+        """Finishes logging."""
+        self.flush()
+        self.logger.removeHandler(self.handler)
+        self.handler.close()
+
+    def __reset(self):
+        """Starts keeping telemetry over, for a new level."""
+        self.frame_times = Histogram()
+        self.latencies = Histogram()
+        self.overruns = 0
+        # Entity counts as [min, max, sum]
+        self.asteroids = [float("inf"), 0, 0]
+        self.pellets = [float("inf"), 0, 0]
@@ -6,6 +6,25 @@
 # Purpose:
 #   A singleton clss for handling game configuration.
 # Notes:
+#   Timing settings:
+#       tick_rate) Simulation steps per second
+#       frame_rate) Maximum rendered frames per second
+#       max_catch_up) Maximum simulation steps run before a render, after a stall
+#       render_mode) "FULL" to redraw the whole screen each frame, "DIRTY" to only update changed regions
+#       sim_thread) True to run the simulation on its own thread, rendering the latest snapshot of it
+#   Profiling settings:
+#       profiler) True to time the phases of every frame, F3 (or Select) toggles an overlay of the timings
+#       profile_export) File prefix the session's timings are exported to (as .csv and .json), or None
+#       track_allocations) True to measure the memory allocated in each phase of every frame instead of timing it,
+#                          along with garbage collections per level and the top allocating call sites
+#                          Cannot be combined with sim_thread
+#   Telemetry settings:
+#       telemetry_log) File per-level frame time and latency histograms are logged to, rotating at 1 MiB, or None
+#   Replay settings:
+#       record_input) File the session's seed and per-step input are recorded to, for replay.py, or None
+#   Arena settings:
+#       world_dim) (width, height) of each level, or None to match the screen
+#                  Larger levels scroll to follow the player, only drawing what is on screen
 #   Gamepad Buttons:
 #       0) X
 #       1) A
@@ -27,7 +46,10 @@ class GameConfig:
     
     @staticmethod
     def create():
-        GameConfig.__config = {'controller': "KEYBOARD"}
+        GameConfig.__config = {'controller': "KEYBOARD", 'tick_rate': 24, 'frame_rate': 144, 'max_catch_up': 5,
+                               'render_mode': "FULL", 'sim_thread': False,
+                               'world_dim': None, 'profiler': False, 'profile_export': None, 'track_allocations': False,
+                               'record_input': None, 'telemetry_log': None}
         GameConfig.__detect_snes_gamepad()
         
     @staticmethod
@@ -41,6 +63,11 @@ class GameConfig:
         if GameConfig.__config is None:
             GameConfig.create()
         return GameConfig.__config[name] if name in GameConfig.__config else None
+
+    @staticmethod
+    def get_tick_delta():
+        """Returns the seconds of game time covered by each simulation step."""
+        return 1 / GameConfig.get_setting('tick_rate')
     
     @staticmethod
     def __detect_snes_gamepad():
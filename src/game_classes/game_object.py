@@ -6,8 +6,10 @@
 # Purpose:
 #   A base class for dealing with game objects.
 # Notes:
+#   The collider owns the object's anchor as a MutableVector2D, moved in place. Code inside game_classes reads
+#   it through the collider on hot paths, while get_anchor hands out an immutable copy.
 
-from .vector2d import Vector2D
+from .vector2d import Vector2D, MutableVector2D
 from .circle_collider import CircleCollider
 
 import pygame as pg
@@ -26,6 +28,7 @@ class GameObject:
         self.active = False
         self.visible = False
         self.collider = CircleCollider(anchor, radius)
+        self.previous_anchor = MutableVector2D(anchor.x, anchor.y)
     
     # Precond:
     #   delta is a floating point number indicating the time elapsed since the last update.
@@ -36,15 +39,56 @@ class GameObject:
         """Called each frame, if the object is active, to update the object's state."""
         pass
     
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Records the current state of the object as its previous state, for render interpolation.
+    def store_previous(self):
+        """Called at the start of each simulation step to remember the object's state."""
+        anchor = self.collider.get_anchor()
+        self.previous_anchor.set(anchor.x, anchor.y)
+    
+    # Precond:
+    #   alpha is a floating point number in [0, 1] indicating how far between the previous and current
+    #   simulation steps to render.
+    #
+    # Postcond:
+    #   Returns the interpolated (x, y) position of the object's anchor.
+    def get_render_anchor(self, alpha: float) -> (float, float):
+        """Retrieve the GameObject's anchor interpolated between simulation steps."""
+        anchor = self.collider.get_anchor()
+        if alpha >= 1:
+            return anchor.x, anchor.y
+        previous = self.previous_anchor
+        return previous.x + alpha * (anchor.x - previous.x), previous.y + alpha * (anchor.y - previous.y)
+    
     # Precond:
     #   screen is the Pygame Surface object where the object will be drawn.
+    #   alpha is a floating point number in [0, 1] indicating how far between the previous and current
+    #   simulation steps to draw the object.
     #
     # Postcond:
-    #   Abstract method for drawing the GameObject to a provided screen.
-    #   Method does not draw anything by default.
-    def draw(self, screen: pg.Surface):
+    #   Draws the GameObject to a provided screen by blitting the result of get_blit.
+    #   Returns the Rect drawn to, or None if nothing was drawn.
+    def draw(self, screen: pg.Surface, alpha: float = 1.0) -> pg.Rect:
         """Called each frame, after update if the object is visible, to draw the object to the screen."""
-        pass
+        blit = self.get_blit(alpha)
+        if blit is None:
+            return None
+        return screen.blit(*blit)
+    
+    # Precond:
+    #   alpha is a floating point number in [0, 1] indicating how far between the previous and current
+    #   simulation steps to draw the object.
+    #
+    # Postcond:
+    #   Abstract method returning the (sprite, position) pair to blit for the GameObject, so many objects
+    #   can be submitted to the screen in a single Surface.blits call.
+    #   Returns None by default, meaning there is nothing to draw.
+    def get_blit(self, alpha: float = 1.0) -> (pg.Surface, (int, int)):
+        """Retrieves the sprite and screen position used to draw the object."""
+        return None
     
     # Precond:
     #   new_anchor is a valid Vector2D object.
@@ -54,6 +98,7 @@ class GameObject:
     def set_anchor(self, new_anchor: Vector2D):
         """Set the GameObject's anchor to a new position."""
         self.collider.move_to(new_anchor)
+        self.previous_anchor.set(new_anchor.x, new_anchor.y)
         
     # Precond:
     #   by is a valid Vector2D object.
@@ -72,15 +117,17 @@ class GameObject:
     def move_anchor_to(self, to: Vector2D):
         """Set the GameObject's anchor to a new position."""
         self.collider.move_to(to)
+        self.previous_anchor.set(to.x, to.y)
     
     # Precond:
     #   None.
     #
     # Postcond:
-    #   Returns the object's current anchor.
+    #   Returns a copy of the object's current anchor, which does not change as the object moves.
     def get_anchor(self) -> Vector2D:
         """Retrieve the GameObject's anchor."""
-        return self.collider.get_anchor()
+        anchor = self.collider.get_anchor()
+        return Vector2D(anchor.x, anchor.y)
     
     # Precond:
     #   None.
@@ -143,7 +190,7 @@ class MovingGameObject(GameObject):
     """A class for handling game objects that move via a constant velocity."""
     def __init__(self, anchor: Vector2D, radius: float, velocity: Vector2D):
         super(MovingGameObject, self).__init__(anchor, radius)
-        self.velocity = velocity
+        self.velocity = MutableVector2D(velocity.x, velocity.y)
         
     # Precond:
     #   delta is a floating point number indicating the time elapsed (in seconds) since the last update.
@@ -154,7 +201,7 @@ class MovingGameObject(GameObject):
         """Update method for a moving game object"""
         if not self.active:
             return
-        self.collider.move(self.velocity.scale(delta))
+        self.collider.move_scaled(self.velocity, delta)
 
     # Precond:
     #   screen_dim is a tuple of integers representing the (width, height) of the screen.
@@ -162,10 +209,10 @@ class MovingGameObject(GameObject):
     # Postcond:
     #   Returns true if the object's collider is fully in the screen.
     def in_bounds(self, screen_dim: (int, int)) -> bool:
-        min_pt = self.collider.get_anchor().sub(Vector2D(self.collider.radius, self.collider.radius))
-        max_pt = self.collider.get_anchor().add(Vector2D(self.collider.radius, self.collider.radius))
-        return 0 <= min_pt.x < screen_dim[0] and 0 <= min_pt.y < screen_dim[1] and 0 <= max_pt.x < screen_dim[0] and\
-            0 <= max_pt.y < screen_dim[1]
+        anchor = self.collider.get_anchor()
+        radius = self.collider.radius
+        return 0 <= anchor.x - radius < screen_dim[0] and 0 <= anchor.y - radius < screen_dim[1] and\
+            0 <= anchor.x + radius < screen_dim[0] and 0 <= anchor.y + radius < screen_dim[1]
     
     # Precond:
     #   screen_dim is a tuple of integers representing the (width, height) of the screen.
@@ -183,7 +230,7 @@ class MovingGameObject(GameObject):
             self.velocity.x = 0
         if vel_zero and anchor_y != self.collider.get_anchor().y:
             self.velocity.y = 0
-        self.collider.anchor = Vector2D(anchor_x, anchor_y)
+        self.collider.get_anchor().set(anchor_x, anchor_y)
         
     # Precond:
     #   screen_dim is a tuple of integers representing the (width, height) of the screen.
@@ -191,11 +238,12 @@ class MovingGameObject(GameObject):
     # Postcond:
     #   Bounces the object when it hits the edge of the screen.
     def bounce(self, screen_dim: (int, int)):
-        min_pt = self.collider.get_anchor().sub(Vector2D(self.collider.radius, self.collider.radius))
-        max_pt = self.collider.get_anchor().add(Vector2D(self.collider.radius, self.collider.radius))
-        if min_pt.x < 0 or max_pt.x > screen_dim[0]:
+        anchor = self.collider.get_anchor()
+        radius = self.collider.radius
+        bounce_y = anchor.y - radius < 0 or anchor.y + radius > screen_dim[1]
+        if anchor.x - radius < 0 or anchor.x + radius > screen_dim[0]:
             self.clamp(screen_dim, False)
             self.velocity.x = -self.velocity.x
-        if min_pt.y < 0 or max_pt.y > screen_dim[1]:
+        if bounce_y:
             self.clamp(screen_dim, False)
             self.velocity.y = -self.velocity.y
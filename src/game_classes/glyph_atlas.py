@@ -0,0 +1,164 @@
+# File: glyph_atlas.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   A text renderer which lays out strings from a cached atlas of pre-rendered glyphs.
+# Notes:
+#   The printable ASCII glyphs are rasterized once, when the atlas is created, so rendering a string
+#   only blits glyphs. Any other character is rasterized the first time it is used, then cached.
+#   Recently rendered strings are also cached, so the returned surfaces must not be drawn on.
+#   Glyphs are placed by their advance, as measured from the font, which matches the font's own layout for
+#   fonts without kerning, such as the bundled Consolas.
+
+import pygame as pg
+
+
+class GlyphAtlas:
+    """A cached glyph atlas for a single font, size, weight and color."""
+    PRELOADED = [chr(code) for code in range(32, 127)]
+    CACHE_SIZE = 256
+
+    # Precond:
+    #   font is a valid Pygame Font object.
+    #   color is the RGB color of the rendered text.
+    #   bold is true if the text should be rendered bold.
+    #
+    # Postcond:
+    #   Creates a new GlyphAtlas, rasterizing the printable ASCII glyphs.
+    #   The font's bold setting is left as it was.
+    def __init__(self, font: pg.font.Font, color: (int, int, int) = (255, 255, 255), bold: bool = False):
+        """GlyphAtlas constructor."""
+        self.font = font
+        self.color = color
+        self.bold = bold
+        self.glyphs = {}
+        self.cache = {}
+        rendered = [self.__rasterize(char) for char in GlyphAtlas.PRELOADED]
+        self.atlas = pg.Surface((sum(glyph[0].get_width() for glyph in rendered),
+                                 max(glyph[0].get_height() for glyph in rendered)), flags=pg.SRCALPHA)
+        self.atlas.fill((0, 0, 0, 0))
+        horiz = 0
+        for char, (glyph, advance) in zip(GlyphAtlas.PRELOADED, rendered):
+            self.atlas.blit(glyph, (horiz, 0))
+            self.glyphs[char] = (self.atlas, pg.Rect((horiz, 0), glyph.get_size()), advance)
+            horiz += glyph.get_width()
+        self.height = self.glyphs[" "][1].height
+
+    # Precond:
+    #   text is a single line of text.
+    #
+    # Postcond:
+    #   Returns the (width, height) the text will take up when rendered.
+    def size(self, text: str) -> (int, int):
+        """Measures a line of text."""
+        if len(text) == 0:
+            return 0, self.height
+        glyphs = [self.__glyph(char) for char in text]
+        # The last glyph may extend past its advance, such as when rendering bold.
+        width = sum(glyph[2] for glyph in glyphs) + glyphs[-1][1].width - glyphs[-1][2]
+        return width, max(self.height, max(glyph[1].height for glyph in glyphs))
+
+    # Precond:
+    #   text is a single line of text.
+    #
+    # Postcond:
+    #   Returns a Pygame Surface with the text drawn on it, which may be shared with earlier calls.
+    def render(self, text: str) -> pg.Surface:
+        """Renders a line of text."""
+        surf = self.cache.get(text)
+        if surf is None:
+            surf = pg.Surface(self.size(text), flags=pg.SRCALPHA)
+            surf.fill((0, 0, 0, 0))
+            self.draw(surf, text, (0, 0))
+            if len(self.cache) >= GlyphAtlas.CACHE_SIZE:
+                # Evict the oldest render
+                del self.cache[next(iter(self.cache))]
+            self.cache[text] = surf
+        return surf
+
+    # Precond:
+    #   surf is the Pygame Surface to draw on.
+    #   text is a single line of text.
+    #   anchor is the (x, y) position of the top left corner of the text.
+    #
+    # Postcond:
+    #   Draws the text onto the surface, returning the list of Rects drawn to.
+    def draw(self, surf: pg.Surface, text: str, anchor: (int, int)) -> [pg.Rect]:
+        """Draws a line of text by blitting its glyphs."""
+        blits = []
+        horiz = anchor[0]
+        for char in text:
+            source, area, advance = self.__glyph(char)
+            # Taking the maximum keeps anti-aliased edges from blending against the surface underneath.
+            blits.append((source, (horiz, anchor[1]), area, pg.BLEND_RGBA_MAX))
+            horiz += advance
+        return surf.blits(blits)
+
+    # Precond:
+    #   lines is a list of single lines of text.
+    #
+    # Postcond:
+    #   Returns a new Pygame Surface with the lines drawn one under another.
+    def render_lines(self, lines: [str]) -> pg.Surface:
+        """Renders multiple lines of text."""
+        sizes = [self.size(line) for line in lines]
+        surf = pg.Surface((max(size[0] for size in sizes), sum(size[1] for size in sizes)), flags=pg.SRCALPHA)
+        surf.fill((0, 0, 0, 0))
+        vert = 0
+        for line, size in zip(lines, sizes):
+            self.draw(surf, line, (0, vert))
+            vert += size[1]
+        return surf
+
+    # Precond:
+    #   text is a string, which may contain newlines.
+    #   line_length is the maximum number of characters on a line.
+    #
+    # Postcond:
+    #   Returns a new Pygame Surface with the text word wrapped to the given line length.
+    def render_wrapped(self, text: str, line_length: int) -> pg.Surface:
+        """Renders word wrapped text."""
+        return self.render_lines(GlyphAtlas.wrap(text, line_length))
+
+    # Precond:
+    #   text is a string, which may contain newlines.
+    #   line_length is the maximum number of characters on a line.
+    #
+    # Postcond:
+    #   Returns the list of lines after breaking the text between words to fit the line length.
+    @staticmethod
+    def wrap(text: str, line_length: int) -> [str]:
+        """Word wraps text."""
+        wrapped_text = []
+        for line in text.split("\n"):
+            temp = ""
+            words = line.lstrip().split(" ")
+            for word in words:
+                if (len(word) + len(temp) + 1) < line_length:
+                    temp = temp + " " + word
+                else:
+                    wrapped_text.append(temp)
+                    temp = word
+            if len(temp) != 0:
+                wrapped_text.append(temp)
+        return wrapped_text
+
+    def __glyph(self, char: str) -> (pg.Surface, pg.Rect, int):
+        """Retrieves the source surface, area and advance of a glyph, rasterizing it if it is not cached."""
+        glyph = self.glyphs.get(char)
+        if glyph is None:
+            surf, advance = self.__rasterize(char)
+            glyph = (surf, surf.get_rect(), advance)
+            self.glyphs[char] = glyph
+        return glyph
+
+    def __rasterize(self, char: str) -> (pg.Surface, int):
+        """Renders a single glyph with the atlas's settings, along with its advance."""
+        was_bold = self.font.get_bold()
+        self.font.set_bold(self.bold)
+        glyph = self.font.render(char, True, self.color)
+        advance = self.font.size(2 * char)[0] - self.font.size(char)[0]
+        self.font.set_bold(was_bold)
+        return glyph, advance
@@ -0,0 +1,50 @@
+# File: hud.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   A simple class for drawing the in-level score and lives display.
+# Notes:
+#   Rendered text is cached and only rebuilt when the displayed value changes.
+#   Text is laid out from a glyph atlas, so value changes do not rasterize text.
+
+from .glyph_atlas import GlyphAtlas
+
+import pygame as pg
+
+
+class Hud:
+    """A cached heads-up display for the score and remaining lives."""
+    SCORE_DIGITS = 9
+
+    # Precond:
+    #   font is a valid GlyphAtlas object.
+    #
+    # Postcond:
+    #   Creates a new Hud object.
+    def __init__(self, font: GlyphAtlas):
+        """Hud constructor."""
+        self.font = font
+        self.score = None
+        self.score_surf = None
+        self.lives = None
+        self.lives_surf = None
+
+    # Precond:
+    #   screen is the Pygame Surface object where the HUD will be drawn.
+    #   score is the player's current score.
+    #   lives is the player's remaining lives.
+    #
+    # Postcond:
+    #   Draws the HUD to the screen, returning the list of Rects drawn to.
+    def render(self, screen: pg.Surface, score: int, lives: int) -> [pg.Rect]:
+        """Draws the HUD, re-rendering only the values which have changed."""
+        if score != self.score:
+            self.score = score
+            self.score_surf = self.font.render(f"{score:0{Hud.SCORE_DIGITS}}")
+        if lives != self.lives:
+            self.lives = lives
+            self.lives_surf = self.font.render(f"Lives: {lives}")
+        return [screen.blit(self.score_surf, (screen.get_width() - self.score_surf.get_width(), 0)),
+                screen.blit(self.lives_surf, (0, 0))]
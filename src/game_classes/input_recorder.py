@@ -0,0 +1,182 @@
+# File: input_recorder.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   Classes for recording a game session's per-tick input to a compact binary log, and reading it back.
+# Notes:
+#   Log layout (little-endian):
+#       Header) magic, version, seed, tick delta, screen (width, height), world (width, height; 0 for none)
+#       Ticks) one byte per simulation step:
+#           bits 0-1) rotation (0 none, 1 clockwise, 2 counterclockwise)
+#           bits 2-3) throttle (0 none, 1 forward, 2 backward)
+#           bit 4) halt, bit 5) fire
+#           bit 6) commands follow: a count byte, then each command byte (DELTA is followed by a double)
+#       End) the byte 0xFF, a count byte and any commands made after the last tick, followed by the final score
+#            and a SHA-256 hash of the final level state
+#   Commands are game state changes made outside of Level.step, and apply before their tick is stepped.
+
+from .frame_input import FrameInput
+
+import struct
+
+
+class InputRecorder:
+    """Records the input for every simulation step of a game session."""
+    MAGIC = b"MREC"
+    VERSION = 1
+    HEADER = struct.Struct("<4sHIdHHII")
+    FOOTER = struct.Struct("<q32s")
+    END = 0xFF
+    HAS_COMMANDS = 0x40
+    # Commands
+    START = 1
+    TOGGLE_PAUSE = 2
+    NEXT_LEVEL = 3
+    DELTA = 4
+
+    # Precond:
+    #   filename is the path the log will be written to when the recorder is closed.
+    #   seed is the seed the global random sequence was given at the start of the session.
+    #   tick_delta is the usual time (in seconds) of a single simulation step.
+    #   screen_dim is a tuple of integers representing the (width, height) of the screen.
+    #   world_dim is a tuple of integers representing the (width, height) of each level, or None.
+    #
+    # Postcond:
+    #   Creates a new InputRecorder with an empty log.
+    def __init__(self, filename: str, seed: int, tick_delta: float, screen_dim: (int, int),
+                 world_dim: (int, int) = None):
+        """InputRecorder constructor."""
+        self.filename = filename
+        self.tick_delta = tick_delta
+        world_dim = (0, 0) if world_dim is None else world_dim
+        self.data = bytearray(InputRecorder.HEADER.pack(InputRecorder.MAGIC, InputRecorder.VERSION, seed, tick_delta,
+                                                        screen_dim[0], screen_dim[1], world_dim[0], world_dim[1]))
+        self.commands = bytearray()
+        self.command_count = 0
+        self.ticks = 0
+
+    # Precond:
+    #   command is one of START, TOGGLE_PAUSE, or NEXT_LEVEL.
+    #
+    # Postcond:
+    #   Records a command to apply before the next tick.
+    def record_command(self, command: int):
+        """Records a game state change."""
+        self.commands.append(command)
+        self.command_count += 1
+
+    # Precond:
+    #   delta is the time (in seconds) the step covers.
+    #   inputs is the FrameInput the step uses.
+    #
+    # Postcond:
+    #   Appends a tick, along with any pending commands, to the log.
+    def record_tick(self, delta: float, inputs: FrameInput):
+        """Records a single simulation step."""
+        if delta != self.tick_delta:
+            self.commands.append(InputRecorder.DELTA)
+            self.commands.extend(struct.pack("<d", delta))
+            self.command_count += 1
+        code = InputRecorder.encode(inputs)
+        if len(self.commands) == 0:
+            self.data.append(code)
+        else:
+            self.data.append(code | InputRecorder.HAS_COMMANDS)
+            self.data.append(self.command_count)
+            self.data.extend(self.commands)
+            self.commands.clear()
+            self.command_count = 0
+        self.ticks += 1
+
+    # Precond:
+    #   score is the player's final score.
+    #   state_hash is the Level.state_hash of the final level.
+    #
+    # Postcond:
+    #   Ends the log and writes it to the recorder's file.
+    def close(self, score: int, state_hash: bytes):
+        """Finishes the recording."""
+        self.data.append(InputRecorder.END)
+        self.data.append(self.command_count)
+        self.data.extend(self.commands)
+        self.data.extend(InputRecorder.FOOTER.pack(score, state_hash))
+        with open(self.filename, 'wb') as fout:
+            fout.write(self.data)
+
+    # Precond:
+    #   inputs is a valid FrameInput object.
+    #
+    # Postcond:
+    #   Returns the input packed into the low six bits of a byte.
+    @staticmethod
+    def encode(inputs: FrameInput) -> int:
+        """Packs a frame's input into a byte."""
+        return (inputs.rotation % 3) | ((inputs.throttle % 3) << 2) | (int(inputs.halt) << 4) | (int(inputs.fire) << 5)
+
+    # Precond:
+    #   code is a byte produced by encode.
+    #
+    # Postcond:
+    #   Returns the FrameInput packed into the byte.
+    @staticmethod
+    def decode(code: int) -> FrameInput:
+        """Unpacks a frame's input from a byte."""
+        return FrameInput([0, 1, -1][code & 3], [0, 1, -1][(code >> 2) & 3], bool(code & 0x10), bool(code & 0x20))
+
+
+class InputLog:
+    """A recorded game session read back from an InputRecorder log."""
+
+    # Precond:
+    #   filename is the path of a log written by an InputRecorder.
+    #
+    # Postcond:
+    #   Reads the whole log, raising ValueError if it is not a valid log.
+    def __init__(self, filename: str):
+        """InputLog constructor."""
+        with open(filename, 'rb') as fin:
+            data = fin.read()
+        if len(data) < InputRecorder.HEADER.size:
+            raise ValueError(f"{filename} is not an input log")
+        magic, version, self.seed, self.tick_delta, width, height, world_width, world_height = \
+            InputRecorder.HEADER.unpack_from(data)
+        if magic != InputRecorder.MAGIC or version != InputRecorder.VERSION:
+            raise ValueError(f"{filename} is not a version {InputRecorder.VERSION} input log")
+        self.screen_dim = width, height
+        self.world_dim = None if world_width == 0 else (world_width, world_height)
+        # Each tick is a (delta, FrameInput, [commands]) tuple
+        self.ticks = []
+        idx = InputRecorder.HEADER.size
+        try:
+            while data[idx] != InputRecorder.END:
+                code = data[idx]
+                delta = self.tick_delta
+                commands = []
+                if code & InputRecorder.HAS_COMMANDS:
+                    idx, delta = InputLog.__read_commands(data, idx + 1, commands, delta)
+                else:
+                    idx += 1
+                self.ticks.append((delta, InputRecorder.decode(code), commands))
+            # Commands made after the final tick
+            self.final_commands = []
+            idx, _ = InputLog.__read_commands(data, idx + 1, self.final_commands, self.tick_delta)
+            self.score, self.state_hash = InputRecorder.FOOTER.unpack_from(data, idx)
+        except (IndexError, struct.error):
+            raise ValueError(f"{filename} is truncated")
+
+    @staticmethod
+    def __read_commands(data: bytes, idx: int, commands: [int], delta: float) -> (int, float):
+        """Reads a count byte and that many commands, returning the index after them and the step's delta."""
+        count = data[idx]
+        idx += 1
+        for _ in range(count):
+            command = data[idx]
+            idx += 1
+            if command == InputRecorder.DELTA:
+                delta = struct.unpack_from("<d", data, idx)[0]
+                idx += 8
+            else:
+                commands.append(command)
+        return idx, delta
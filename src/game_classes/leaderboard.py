@@ -9,6 +9,8 @@
 
 import os
 import pygame as pg
+from .asset_manager import AssetManager
+from .glyph_atlas import GlyphAtlas
 
 
 class Leader:
@@ -35,6 +37,7 @@ class Leaderboard:
         self.filename = filename
         self.leaders = []
         self.updated = True
+        self.render_cache = None
         if os.path.isfile(self.filename):
             # Load file
             with open(self.filename, 'r') as fin:
@@ -51,6 +54,7 @@ class Leaderboard:
         if score < self.leaders[-1].score:
             return
         self.updated = True
+        self.render_cache = None
         for i in range(len(self.leaders)):
             if score > self.leaders[i].score:
                 self.leaders.insert(i, Leader(name, score))
@@ -71,11 +75,15 @@ class Leaderboard:
                 print(line, file=fout)
     
     def render(self) -> pg.Surface:
-        """Renders the leaderboard into a Pygame surface for display."""
-        font = pg.font.SysFont("consolas", 20)
+        """Renders the leaderboard into a Pygame surface for display, reusing the last render if unchanged."""
+        if self.render_cache is not None:
+            return self.render_cache
+        font = AssetManager.get_instance().get_glyph_atlas("board")
+        if font is None:
+            font = GlyphAtlas(pg.font.SysFont("consolas", 20))
         renders = []
         for leader in self.leaders:
-            renders.append(font.render(leader.name + (5*" ") + f"{leader.score:09}", True, (255, 255, 255)))
+            renders.append(font.render(leader.name + (5*" ") + f"{leader.score:09}"))
         total_vertical = sum(map(lambda proc_line: proc_line.get_height(), renders))
         max_horizontal = max(map(lambda proc_line: proc_line.get_width(), renders))
         surf = pg.Surface((max_horizontal, total_vertical))
@@ -84,6 +92,7 @@ class Leaderboard:
         for render in renders:
             surf.blit(render, (0, vert))
             vert += render.get_height() + vert_padding
+        self.render_cache = surf
         return surf
     
     def __encrypt(self) -> [str]:
@@ -6,156 +6,407 @@
 # Purpose:
 #   A simple level class for handling a single asteroids level.
 # Notes:
+#   Snapshot layout (little-endian):
+#       Header) magic, version, world (width, height), paused, i-frames, i-frame blink count, lives,
+#               pellet count, asteroid count
+#       Player) anchor, previous anchor, velocity, facing, previous facing, score, cooldown, active, visible
+#       Random) the Mersenne Twister state of the global random sequence, and any cached gaussian
+#       Pellets) anchor, previous anchor and velocity of each pellet
+#       Asteroids) the AsteroidField's arrays, as produced by AsteroidField.to_bytes
 
+from .game_object import GameObject
 from .player import Player
 from .asteroid import Asteroid
+from .asteroid_field import AsteroidField
+from .spatial_hash import SpatialHash
 from .pellet import Pellet
 from .vector2d import Vector2D
-from .game_config import GameConfig
+from .circle_collider import CircleCollider
+from .frame_input import FrameInput
+from .hud import Hud
+from .glyph_atlas import GlyphAtlas
+from .asset_manager import AssetManager
+from .frame_snapshot import FrameSnapshot
+from .camera import Camera
 
-from random import randint
+from random import randint, getstate, setstate
+import hashlib
+import struct
+import numpy as np
 import pygame as pg
 
 
 class Level:
-    def __init__(self, player: Player, screen_dim: (int, int), small: int, medium: int, large: int):
-        self.dim = screen_dim
+    SNAPSHOT_MAGIC = b"MLVL"
+    SNAPSHOT_VERSION = 1
+    SNAPSHOT_HEADER = struct.Struct("<4sHII?dqqII")
+    SNAPSHOT_PLAYER = struct.Struct("<8dqd??")
+    SNAPSHOT_RANDOM = struct.Struct("<625I?d")
+    SNAPSHOT_PELLET = struct.Struct("<6d")
+    
+    # Precond:
+    #   player is a valid Player object.
+    #   screen_dim is a tuple of integers representing the (width, height) of the screen.
+    #   small, medium, and large are the number of asteroids of each size-class to create.
+    #   world_dim is a tuple of integers representing the (width, height) of the level, or None to
+    #   match the screen. Levels larger than the screen are viewed through a camera following the player.
+    #
+    # Postcond:
+    #   Creates a new, paused level.
+    def __init__(self, player: Player, screen_dim: (int, int), small: int, medium: int, large: int,
+                 world_dim: (int, int) = None):
+        self.dim = screen_dim if world_dim is None else world_dim
+        self.camera = Camera(screen_dim, self.dim)
+        self.capture_camera = Camera(screen_dim, self.dim)
         self.player = player
-        self.player.move_anchor_to(Vector2D(screen_dim[0]//2, screen_dim[1]//2))
+        self.player.move_anchor_to(Vector2D(self.dim[0]//2, self.dim[1]//2))
         self.player.halt_ship()
         self.player.reset_facing()
         self.lives = 3
-        self.asteroids = []
+        self.asteroids = AsteroidField(small + medium + large)
+        self.asteroid_hash = SpatialHash()
+        self.asteroid_spawn = AsteroidField()
         self.pellets = []
-        for i in range(small):
-            self.asteroids.append(Asteroid(Asteroid.SMALL, self.__rand_point()))
-            self.asteroids[-1].clamp(self.dim)
-            self.asteroids[-1].activate()
-        for i in range(medium):
-            self.asteroids.append(Asteroid(Asteroid.MEDIUM, self.__rand_point()))
-            self.asteroids[-1].clamp(self.dim)
-            self.asteroids[-1].activate()
-        for i in range(large):
-            self.asteroids.append(Asteroid(Asteroid.LARGE, self.__rand_point()))
-            self.asteroids[-1].clamp(self.dim)
-            self.asteroids[-1].activate()
+        for size, count in [(Asteroid.SMALL, small), (Asteroid.MEDIUM, medium), (Asteroid.LARGE, large)]:
+            for i in range(count):
+                self.asteroids.spawn(size, self.__rand_point())
+        # Clamping only depends on each asteroid's own position, so the whole field is clamped at once
+        self.asteroids.clamp(self.dim)
+        
+        # Setup viewport culling, asteroids are indexed by position after each step when first drawn
+        self.view_index = SpatialHash()
+        self.view_stale = True
+        self.view_margin = max(Asteroid.ASTEROID_MAX_RADIUS)
         
         # Setup HUD elements
-        self.font = pg.font.SysFont("consolas", 30)
+        self.hud = None
         self.paused = True
         
+        # Phase timing is only recorded when a FrameProfiler is attached
+        self.profiler = None
+        # Every step's input is recorded when an InputRecorder is attached
+        self.recorder = None
+        
         # setup initial i-frames (measured in seconds)
         self.i_frames = 3
         self.i_blink_count = 0
 
+    # Precond:
+    #   screen is the Pygame Surface object where the level will be drawn.
+    #   delta is a floating point number indicating the time elapsed (in seconds) since the last frame.
+    #
+    # Postcond:
+    #   Advances the level using live controller input, then draws it.
+    #   Ends the attached profiler's frame, if there is one.
     def run_frame(self, screen: pg.Surface, delta: float):
+        self.step(delta, FrameInput.poll())
+        profiler = self.profiler
+        mark = profiler.mark() if profiler is not None else 0.0
+        self.render(screen)
+        if profiler is not None:
+            profiler.record("render", mark)
+            profiler.end_frame()
+
+    # Precond:
+    #   delta is a floating point number indicating the time elapsed (in seconds) since the last step.
+    #   inputs is a valid FrameInput object.
+    #
+    # Postcond:
+    #   Advances the level simulation without using any Pygame display or input APIs.
+    def step(self, delta: float, inputs: FrameInput):
+        """Advances the level by a single step."""
+        profiler = self.profiler
+        mark = profiler.mark() if profiler is not None else 0.0
+        if self.recorder is not None:
+            self.recorder.record_tick(delta, inputs)
+        self.player.store_previous()
+        self.asteroids.store_previous()
+        for pellet in self.pellets:
+            pellet.store_previous()
         if not self.paused:
             self.handle_i_frames(delta)
             
             # update
             self.player.update(delta)
-            for asteroid in self.asteroids:
-                asteroid.update(delta)
+            self.asteroids.update(delta)
             for pellet in self.pellets:
                 pellet.update(delta)
+            if profiler is not None:
+                mark = profiler.record("update", mark)
                 
             # Handle out-of-bounds
             if not self.player.in_bounds(self.dim):
                 self.player.bounce(self.dim)
-            for asteroid in self.asteroids:
-                if not asteroid.in_bounds(self.dim):
-                    asteroid.bounce(self.dim)
+            self.asteroids.bounce(self.dim)
+            if profiler is not None:
+                mark = profiler.record("bounds", mark)
             
             # collide
-            pellet_remove = set()
-            asteroid_remove = set()
-            asteroid_add = []
-            for idx in range(len(self.pellets)):
-                for i in range(len(self.asteroids)):
-                    if self.pellets[idx].has_collided(self.asteroids[i]):
-                        asteroid_remove.add(i)
-                        pellet_remove.add(idx)
-                        asteroid_add.extend(self.asteroids[i].split())
-                        self.player.add_score(self.asteroids[i].get_point_value())
+            self.asteroid_hash.rebuild(self.asteroids.positions(), self.asteroids.radii())
+            pellet_hits = self.__collide_asteroids(self.pellets)
+            pellet_remove = set(pellet_hits[:, 0].tolist())
+            asteroid_hits = pellet_hits[:, 1]
+            asteroid_add = self.asteroids.split(asteroid_hits, self.asteroid_spawn)
+            self.asteroids.kill(asteroid_hits)
+            self.player.add_score(self.asteroids.point_value(asteroid_hits))
             if self.i_frames <= 0:
-                for asteroid in self.asteroids:
-                    if asteroid.has_collided(self.player):
-                        self.lives -= 1
-                        self.player.move_anchor_to(Vector2D(self.dim[0]//2, self.dim[1]//2))
-                        self.player.halt_ship()
-                        self.i_frames = 1
-                        self.i_blink_count = 0
-                        break
+                if len(self.__collide_asteroids([self.player])) > 0:
+                    self.lives -= 1
+                    self.player.move_anchor_to(Vector2D(self.dim[0]//2, self.dim[1]//2))
+                    self.player.halt_ship()
+                    self.i_frames = 1
+                    self.i_blink_count = 0
+            if profiler is not None:
+                mark = profiler.record("collide", mark)
                     
             # Garbage collection
-            for i in range(len(self.pellets)):
-                if not self.pellets[i].in_bounds(self.dim):
-                    pellet_remove.add(i)
-            asteroid_remove = list(asteroid_remove)
-            pellet_remove = list(pellet_remove)
-            asteroid_remove.sort(reverse=True)
-            pellet_remove.sort(reverse=True)
-            for i in pellet_remove:
-                self.pellets.pop(i)
-            for i in asteroid_remove:
-                self.asteroids.pop(i)
+            # Removed objects are compacted out in a single stable pass, then split children are appended.
+            pellet_pool = Pellet.get_pool()
+            kept = 0
+            for idx, pellet in enumerate(self.pellets):
+                if idx in pellet_remove or not pellet.in_bounds(self.dim):
+                    pellet_pool.release(pellet)
+                else:
+                    self.pellets[kept] = pellet
+                    kept += 1
+            del self.pellets[kept:]
             del pellet_remove
-            del asteroid_remove
+            self.asteroids.compact()
             self.asteroids.extend(asteroid_add)
+            # Drawn positions may lag the indexed ones by up to a step of movement
+            self.view_stale = True
+            self.view_margin = max(Asteroid.ASTEROID_MAX_RADIUS) + max(Asteroid.ASTEROID_SPEED) * delta
+            if profiler is not None:
+                mark = profiler.record("gc", mark)
             
-            # Process Key Input
-            # Rotational input
-            if GameConfig.get_setting("controller") == "KEYBOARD":
-                if pg.key.get_pressed()[pg.K_a]:
-                    self.player.rotate_ccw(delta)
-                elif pg.key.get_pressed()[pg.K_d]:
-                    self.player.rotate_cw(delta)
-                # Throttle input
-                if pg.key.get_pressed()[pg.K_f]:
-                    self.player.halt_ship()
-                elif pg.key.get_pressed()[pg.K_w]:
-                    self.player.throttle_up(delta)
-                elif pg.key.get_pressed()[pg.K_s]:
-                    self.player.throttle_down(delta)
-                # Trigger input
-                if pg.key.get_pressed()[pg.K_SPACE]:
-                    pellet = self.player.fire()
-                    if pellet is not None:
-                        self.pellets.append(pellet)
-            elif GameConfig.get_setting("controller") == "GAMEPAD":
-                joystick = GameConfig.get_setting("gamepad")
-                x_axis = joystick.get_axis(GameConfig.get_setting("X-axis"))
-                y_axis = joystick.get_axis(GameConfig.get_setting("Y-axis"))
-                x_axis, y_axis = round(x_axis), round(y_axis)
-                if x_axis == -1:
-                    self.player.rotate_ccw(delta)
-                elif x_axis == 1:
-                    self.player.rotate_cw(delta)
-                # Throttle input
-                if joystick.get_button(GameConfig.get_setting("B")):
-                    self.player.halt_ship()
-                elif y_axis == -1:
-                    self.player.throttle_up(delta)
-                elif y_axis == 1:
-                    self.player.throttle_down(delta)
-                # Trigger input
-                if joystick.get_button(GameConfig.get_setting("A")):
-                    pellet = self.player.fire()
-                    if pellet is not None:
-                        self.pellets.append(pellet)
+            # Process input
+            if inputs.rotation == -1:
+                self.player.rotate_ccw(delta)
+            elif inputs.rotation == 1:
+                self.player.rotate_cw(delta)
+            if inputs.halt:
+                self.player.halt_ship()
+            elif inputs.throttle == 1:
+                self.player.throttle_up(delta)
+            elif inputs.throttle == -1:
+                self.player.throttle_down(delta)
+            if inputs.fire:
+                pellet = self.player.fire()
+                if pellet is not None:
+                    self.pellets.append(pellet)
+            if profiler is not None:
+                profiler.record("input", mark)
+    
+    # Precond:
+    #   screen is the Pygame Surface object where the level will be drawn.
+    #
+    #   alpha is a floating point number in [0, 1] indicating how far between the previous and current
+    #   steps to draw moving objects.
+    #
+    # Postcond:
+    #   Draws the level and its HUD to the screen, returning the list of Rects drawn to.
+    def render(self, screen: pg.Surface, alpha: float = 1.0) -> [pg.Rect]:
+        """Draws the current state of the level."""
+        hud = self.__get_hud()
         
-        # Draw
-        self.player.draw(screen)
-        for asteroid in self.asteroids:
-            asteroid.draw(screen)
-        for pellet in self.pellets:
-            pellet.draw(screen)
+        # Only entities in view are drawn when the level is larger than the screen
+        asteroids, pellets = None, self.pellets
+        if self.camera.scrolls():
+            self.camera.follow(self.player.get_render_anchor(alpha))
+            asteroids, pellets = self.__cull(self.camera.get_viewport())
+        offset = self.camera.get_offset()
+        
+        # Draw, every entity is submitted in a single batch
+        blits = [Level.__shift(self.player.get_blit(alpha), offset)]
+        blits.extend(self.asteroids.get_blits(alpha, asteroids, offset))
+        blits.extend(Level.__shift(pellet.get_blit(alpha), offset) for pellet in pellets)
+        drawn = screen.blits([blit for blit in blits if blit is not None])
         
         # Draw HUD
-        score_text = self.font.render(f"{self.player.get_score():09}", True, (255, 255, 255))
-        lives_text = self.font.render(f"Lives: {self.lives}", True, (255, 255, 255))
-        screen.blit(score_text, (self.dim[0] - score_text.get_width(), 0))
-        screen.blit(lives_text, (0, 0))
+        drawn.extend(hud.render(screen, self.player.get_score(), self.lives))
+        return drawn
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns an immutable FrameSnapshot of the level's drawable state after the last step.
+    def capture(self) -> FrameSnapshot:
+        """Captures the level's drawable state, for rendering on another thread."""
+        focus = (self.player.get_render_anchor(0.0), self.player.get_render_anchor(1.0))
+        asteroids, pellets = None, self.pellets
+        if self.capture_camera.scrolls():
+            # Keep everything which could be in view at any point during the step
+            self.capture_camera.follow(focus[0])
+            viewport = self.capture_camera.get_viewport()
+            self.capture_camera.follow(focus[1])
+            asteroids, pellets = self.__cull(viewport.union(self.capture_camera.get_viewport()))
+        previous = [self.player.get_blit(0.0)]
+        previous.extend(self.asteroids.get_blits(0.0, asteroids))
+        previous.extend(pellet.get_blit(0.0) for pellet in pellets)
+        current = [self.player.get_blit(1.0)]
+        current.extend(self.asteroids.get_blits(1.0, asteroids))
+        current.extend(pellet.get_blit(1.0) for pellet in pellets)
+        pairs = [(prev, cur) for prev, cur in zip(previous, current) if cur is not None]
+        return FrameSnapshot(tuple(cur[0] for _, cur in pairs), tuple(prev[1] for prev, _ in pairs),
+                             tuple(cur[1] for _, cur in pairs), self.player.get_score(), self.lives, focus,
+                             (len(self.asteroids), len(self.pellets)))
+
+    # Precond:
+    #   screen is the Pygame Surface object where the level will be drawn.
+    #   snapshot is a FrameSnapshot captured from this level.
+    #   alpha is a floating point number in [0, 1] indicating how far between simulation steps to draw.
+    #
+    # Postcond:
+    #   Draws the snapshot, returning the list of Rects drawn to.
+    #   Does not read the level's simulation state, so it is safe to call while the level is being stepped.
+    def render_snapshot(self, screen: pg.Surface, snapshot: FrameSnapshot, alpha: float = 1.0) -> [pg.Rect]:
+        """Draws a captured state of the level."""
+        hud = self.__get_hud()
+        if self.camera.scrolls():
+            self.camera.follow(snapshot.get_focus(alpha))
+        drawn = screen.blits(snapshot.get_blits(alpha, self.camera.get_offset()))
+        drawn.extend(hud.render(screen, snapshot.score, snapshot.lives))
+        return drawn
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns a SHA-256 digest of the level's simulation state, ignoring anything only used for drawing.
+    def state_hash(self) -> bytes:
+        """Hashes the level's state, for checking that a replay matches its recording."""
+        digest = hashlib.sha256()
+        player = self.player
+        anchor = player.collider.anchor
+        digest.update(struct.pack("<5dqd?qdq", anchor.x, anchor.y, player.velocity.x, player.velocity.y, player.facing,
+                                  player.score, player.cooldown, self.paused, self.lives, self.i_frames,
+                                  self.i_blink_count))
+        n = self.asteroids.count
+        for array in [self.asteroids.position, self.asteroids.velocity, self.asteroids.size, self.asteroids.shape]:
+            digest.update(np.ascontiguousarray(array[:n]).tobytes())
+        for pellet in self.pellets:
+            anchor = pellet.collider.anchor
+            digest.update(struct.pack("<4d", anchor.x, anchor.y, pellet.velocity.x, pellet.velocity.y))
+        return digest.digest()
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns the level's full simulation state, along with the state of the global random sequence,
+    #   packed into a bytes object.
+    def snapshot(self) -> bytes:
+        """Serializes the level's state."""
+        player = self.player
+        anchor = player.collider.anchor
+        previous = player.previous_anchor
+        _, internal, gauss_next = getstate()
+        pack_pellet = Level.SNAPSHOT_PELLET.pack
+        pellets = [pack_pellet(pellet.collider.anchor.x, pellet.collider.anchor.y, pellet.previous_anchor.x,
+                               pellet.previous_anchor.y, pellet.velocity.x, pellet.velocity.y)
+                   for pellet in self.pellets]
+        return b"".join([
+            Level.SNAPSHOT_HEADER.pack(Level.SNAPSHOT_MAGIC, Level.SNAPSHOT_VERSION, self.dim[0], self.dim[1],
+                                       self.paused, self.i_frames, self.i_blink_count, self.lives,
+                                       len(self.pellets), self.asteroids.count),
+            Level.SNAPSHOT_PLAYER.pack(anchor.x, anchor.y, previous.x, previous.y, player.velocity.x,
+                                       player.velocity.y, player.facing, player.previous_facing, player.score,
+                                       player.cooldown, player.is_active(), player.is_visible()),
+            Level.SNAPSHOT_RANDOM.pack(*internal, gauss_next is not None, 0.0 if gauss_next is None else gauss_next),
+            b"".join(pellets),
+            self.asteroids.to_bytes()
+        ])
+
+    # Precond:
+    #   data is a bytes-like object produced by snapshot.
+    #
+    # Postcond:
+    #   Replaces the level's state, its player's state, and the state of the global random sequence with
+    #   those in the snapshot. Raises ValueError if the data is not a valid snapshot.
+    def restore(self, data: bytes):
+        """Restores the level's state from a snapshot."""
+        if len(data) < Level.SNAPSHOT_HEADER.size + Level.SNAPSHOT_PLAYER.size + Level.SNAPSHOT_RANDOM.size:
+            raise ValueError("Data is too short to be a level snapshot")
+        magic, version, width, height, paused, i_frames, i_blink_count, lives, pellet_count, asteroid_count = \
+            Level.SNAPSHOT_HEADER.unpack_from(data)
+        if magic != Level.SNAPSHOT_MAGIC or version != Level.SNAPSHOT_VERSION:
+            raise ValueError(f"Data is not a version {Level.SNAPSHOT_VERSION} level snapshot")
+        idx = Level.SNAPSHOT_HEADER.size
+        pellet_end = idx + Level.SNAPSHOT_PLAYER.size + Level.SNAPSHOT_RANDOM.size + \
+            Level.SNAPSHOT_PELLET.size * pellet_count
+        if len(data) < pellet_end:
+            raise ValueError("Level snapshot is truncated")
+        view = memoryview(data)
+        
+        # Asteroids, first so nothing is changed when their data is the wrong length
+        self.asteroids.from_bytes(view[pellet_end:], asteroid_count)
+        self.view_stale = True
+        
+        # Level
+        if (width, height) != tuple(self.dim):
+            self.dim = (width, height)
+            self.camera = Camera(self.camera.view_dim, self.dim)
+            self.capture_camera = Camera(self.capture_camera.view_dim, self.dim)
+        self.paused = paused
+        self.i_frames = i_frames
+        self.i_blink_count = i_blink_count
+        self.lives = lives
+        
+        # Player
+        player = self.player
+        x, y, prev_x, prev_y, vel_x, vel_y, facing, previous_facing, score, cooldown, active, visible = \
+            Level.SNAPSHOT_PLAYER.unpack_from(data, idx)
+        idx += Level.SNAPSHOT_PLAYER.size
+        player.move_anchor_to(Vector2D(x, y))
+        player.previous_anchor.set(prev_x, prev_y)
+        player.velocity.set(vel_x, vel_y)
+        player.facing = facing
+        player.previous_facing = previous_facing
+        player.score = score
+        player.cooldown = cooldown
+        player.set_active(active)
+        player.set_visible(visible)
+        
+        # Random sequence
+        state = Level.SNAPSHOT_RANDOM.unpack_from(data, idx)
+        idx += Level.SNAPSHOT_RANDOM.size
+        setstate((3, state[:625], state[626] if state[625] else None))
+        
+        # Pellets
+        pellet_pool = Pellet.get_pool()
+        for pellet in self.pellets:
+            pellet_pool.release(pellet)
+        self.pellets = []
+        for x, y, prev_x, prev_y, vel_x, vel_y in Level.SNAPSHOT_PELLET.iter_unpack(view[idx:pellet_end]):
+            pellet = pellet_pool.acquire(Vector2D(x, y), Vector2D(0, 0))
+            pellet.previous_anchor.set(prev_x, prev_y)
+            pellet.velocity.set(vel_x, vel_y)
+            pellet.activate()
+            self.pellets.append(pellet)
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns every pellet still in the level to the pellet pool.
+    #   The level should not be stepped after it has been closed.
+    def close(self):
+        """Releases the level's pooled objects."""
+        for pellet in self.pellets:
+            Pellet.get_pool().release(pellet)
+        self.pellets = []
+    
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns a dictionary of object pool statistics, keyed by pool name.
+    #   Asteroids are not pooled, their AsteroidField rows are reused in place.
+    @staticmethod
+    def pool_stats() -> dict:
+        """Retrieves the usage statistics of the object pools used by levels."""
+        return {"pellet": Pellet.get_pool().get_stats()}
 
     def win(self):
         return len(self.asteroids) == 0
@@ -185,6 +436,41 @@ class Level:
             self.player.set_visible(True)
         pass
 
+    def __collide_asteroids(self, objects: [GameObject]) -> np.ndarray:
+        """Retrieves every (object index, asteroid index) pair of colliding objects and asteroids."""
+        centers = np.array([obj.collider.anchor.to_tuple() for obj in objects], dtype=np.float64).reshape(-1, 2)
+        radii = np.array([obj.collider.get_radius() for obj in objects], dtype=np.float64)
+        candidates = self.asteroid_hash.query_many(centers, radii)
+        return CircleCollider.collide_many(centers, radii, self.asteroids.positions(), self.asteroids.radii(), candidates)
+
+    def __get_hud(self) -> Hud:
+        """Retrieves the level's HUD, creating it on first use."""
+        if self.hud is None:
+            font = AssetManager.get_instance().get_glyph_atlas("hud")
+            if font is None:
+                font = GlyphAtlas(pg.font.SysFont("consolas", 30))
+            self.hud = Hud(font)
+        return self.hud
+
+    def __cull(self, viewport: pg.Rect) -> (np.ndarray, [Pellet]):
+        """Finds the asteroid indices and pellets which may be visible in a viewport."""
+        if self.view_stale:
+            self.view_index.rebuild(self.asteroids.positions(), self.asteroids.radii())
+            self.view_stale = False
+        area = viewport.inflate(2 * self.view_margin, 2 * self.view_margin)
+        # Compared in place, without building a point for every pellet
+        left, top, right, bottom = area.left, area.top, area.right, area.bottom
+        pellets = [pellet for pellet in self.pellets
+                   if left <= pellet.collider.anchor.x < right and top <= pellet.collider.anchor.y < bottom]
+        return self.view_index.query_rect(viewport, self.view_margin), pellets
+
+    @staticmethod
+    def __shift(blit: (pg.Surface, (int, int)), offset: (int, int)) -> (pg.Surface, (int, int)):
+        """Moves a blit from world coordinates to screen coordinates."""
+        if blit is None or offset == (0, 0):
+            return blit
+        return blit[0], (blit[1][0] - offset[0], blit[1][1] - offset[1])
+
     def __rand_point(self):
         return Vector2D(randint(0, self.dim[0]), randint(0, self.dim[1]))
     
\ No newline at end of file
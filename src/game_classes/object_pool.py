@@ -0,0 +1,79 @@
+# File: object_pool.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   A simple free-list pool for reusing short-lived game objects.
+# Notes:
+#   Pooled classes must provide a reset method taking the same arguments as their constructor.
+#   Released objects must not be used again until they are re-acquired.
+#   Releasing an object which is already in the pool raises ValueError, instead of handing it out twice.
+
+
+class ObjectPool:
+    """A free-list pool of reusable objects."""
+
+    # Precond:
+    #   factory is a class (or callable) used to create new objects when the pool is empty.
+    #
+    # Postcond:
+    #   Creates a new, empty ObjectPool.
+    def __init__(self, factory):
+        """ObjectPool constructor."""
+        self.factory = factory
+        self.free = []
+        # ids of the objects in free, to catch double releases
+        self.free_ids = set()
+        self.acquired = 0
+        self.hits = 0
+        self.in_use = 0
+        self.high_water = 0
+
+    # Precond:
+    #   args are the constructor arguments for the pooled class.
+    #
+    # Postcond:
+    #   Returns a recycled object reset with the given arguments, or a new object if none are free.
+    def acquire(self, *args):
+        """Retrieves an object from the pool."""
+        self.acquired += 1
+        self.in_use += 1
+        self.high_water = max(self.high_water, self.in_use)
+        if len(self.free) == 0:
+            return self.factory(*args)
+        self.hits += 1
+        obj = self.free.pop()
+        self.free_ids.discard(id(obj))
+        obj.reset(*args)
+        return obj
+
+    # Precond:
+    #   obj is an object previously acquired from this pool, which is no longer in use.
+    #
+    # Postcond:
+    #   Returns the object to the pool for reuse.
+    #   Raises ValueError if the object is already in the pool.
+    def release(self, obj):
+        """Returns an object to the pool."""
+        if id(obj) in self.free_ids:
+            raise ValueError("Object released to the pool twice")
+        self.in_use -= 1
+        self.free_ids.add(id(obj))
+        self.free.append(obj)
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns a dictionary of usage statistics for the pool.
+    def get_stats(self) -> dict:
+        """Retrieves the pool's usage statistics."""
+        return {
+            "acquired": self.acquired,
+            "hits": self.hits,
+            "hit_rate": self.hits / self.acquired if self.acquired > 0 else 0.0,
+            "in_use": self.in_use,
+            "free": len(self.free),
+            "high_water": self.high_water
+        }
@@ -6,9 +6,15 @@
 # Purpose:
 #   A class for handling the pellet shot by the player's ship.
 # Notes:
+#   The shared sprite is drawn on first use, which must be on the main thread as SDL surfaces cannot be made
+#   elsewhere. Games with a simulation thread build it ahead of time with build_sprite.
 
 from .game_object import MovingGameObject
 from .vector2d import Vector2D
+from .object_pool import ObjectPool
+from .asset_manager import AssetManager
+
+import threading
 
 import pygame as pg
 
@@ -17,12 +23,46 @@ class Pellet(MovingGameObject):
     """A class for handling Player ship pellets."""
     SPEED = 100
     RADIUS = 3
+    COLOR = (0, 255, 0)
+    SPRITE = None
+    __POOL = None
     
     def __init__(self, anchor: Vector2D, direction: Vector2D):
         super(Pellet, self).__init__(anchor, Pellet.RADIUS, direction.scale(Pellet.SPEED))
     
-    def draw(self, screen: pg.Surface):
+    def reset(self, anchor: Vector2D, direction: Vector2D):
+        """Resets the pellet so it can be reused from the pellet pool."""
+        self.set_anchor(anchor)
+        self.velocity.set(Pellet.SPEED * direction.x, Pellet.SPEED * direction.y)
+        self.active = False
+        self.visible = False
+    
+    def get_blit(self, alpha: float = 1.0) -> (pg.Surface, (int, int)):
         if not self.visible:
-            return
-        pg.draw.circle(screen, (0, 255, 0), self.collider.get_anchor().to_int_tuple(), Pellet.RADIUS)
-    
\ No newline at end of file
+            return None
+        anchor = self.get_render_anchor(alpha)
+        return Pellet.get_sprite(), (int(anchor[0]) - Pellet.RADIUS, int(anchor[1]) - Pellet.RADIUS)
+    
+    @staticmethod
+    def get_pool() -> ObjectPool:
+        """Retrieves the pellet pool, creating it if needed."""
+        if Pellet.__POOL is None:
+            Pellet.__POOL = ObjectPool(Pellet)
+        return Pellet.__POOL
+    
+    @staticmethod
+    def get_sprite() -> pg.Surface:
+        """Retrieves the shared pellet sprite, drawing it if needed."""
+        if Pellet.SPRITE is None:
+            if threading.current_thread() is not threading.main_thread():
+                raise RuntimeError("The pellet sprite was never built, call Pellet.build_sprite on the main thread")
+            Pellet.build_sprite()
+        return Pellet.SPRITE
+    
+    @staticmethod
+    def build_sprite():
+        """Draws the shared pellet sprite ahead of time."""
+        sprite = pg.Surface((2*Pellet.RADIUS + 1, 2*Pellet.RADIUS + 1), flags=pg.SRCALPHA)
+        sprite.fill((0, 0, 0, 0))
+        pg.draw.circle(sprite, Pellet.COLOR, (Pellet.RADIUS, Pellet.RADIUS), Pellet.RADIUS)
+        Pellet.SPRITE = AssetManager.convert_sprite(sprite)
@@ -0,0 +1,199 @@
+# File: phase_recorder.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   A base class for instruments which measure each phase of every frame, such as FrameProfiler.
+# Notes:
+#   Subclasses provide mark and record, which add a phase's measurement to the current frame, along with
+#   what a measurement is (empty), how a phase's measurements are summarized (summarize), and the overlay,
+#   CSV and JSON contents (overlay_lines, csv_header, csv_row and report).
+#   A measurement is a number or a list of numbers, every phase's measurement having the same shape.
+#   Rolling statistics cover the last window frames, while exports cover every frame of the session.
+
+from .glyph_atlas import GlyphAtlas
+
+from collections import deque
+import csv
+import json
+
+import numpy as np
+import pygame as pg
+
+
+class PhaseRecorder:
+    """Keeps rolling and whole-session measurements of each phase of every frame."""
+    PHASES = ["update", "bounds", "collide", "gc", "input", "render", "present", "events"]
+    # Frames between refreshes of the overlay's text
+    OVERLAY_REFRESH = 30
+
+    # Precond:
+    #   window is the number of recent frames the rolling statistics cover.
+    #
+    # Postcond:
+    #   Creates a new PhaseRecorder with no recorded frames.
+    def __init__(self, window: int = 240):
+        """PhaseRecorder constructor."""
+        self.phases = list(PhaseRecorder.PHASES)
+        self.current = {phase: self.empty() for phase in self.phases}
+        self.samples = {phase: deque(maxlen=window) for phase in self.phases}
+        self.history = []
+        self.show_overlay = False
+        self.overlay = None
+        self.overlay_age = 0
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns a phase's measurement before anything has been recorded for it.
+    def empty(self):
+        """Creates an empty measurement, overridden by subclasses."""
+        return 0.0
+
+    # Precond:
+    #   column is an array of a single phase's measurements, one row per frame.
+    #
+    # Postcond:
+    #   Returns a dictionary of statistics summarizing the measurements.
+    def summarize(self, column: np.ndarray) -> dict:
+        """Summarizes a phase's measurements, overridden by subclasses."""
+        return {"mean": float(column.mean()) if len(column) > 0 else 0.0}
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns the lines of text shown by the overlay.
+    def overlay_lines(self) -> [str]:
+        """Creates the overlay's text, overridden by subclasses."""
+        return [f"{phase:<8}{stat['mean']:8.2f}" for phase, stat in self.get_stats().items()]
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns the names of the CSV columns following the frame number.
+    def csv_header(self) -> [str]:
+        """Names the CSV columns, overridden by subclasses."""
+        return list(self.phases)
+
+    # Precond:
+    #   frame is the index of a recorded frame.
+    #
+    # Postcond:
+    #   Returns the CSV values of the frame, following the frame number.
+    def csv_row(self, frame: int) -> list:
+        """Creates a frame's CSV row, overridden by subclasses."""
+        return list(self.history[frame])
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns a dictionary of entries added to the JSON export, after the session summary.
+    def report(self) -> dict:
+        """Creates the extra JSON export entries, overridden by subclasses."""
+        return {}
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Stores the current frame's measurements and starts a new frame.
+    def end_frame(self):
+        """Finishes the current frame."""
+        frame = []
+        for phase in self.phases:
+            measurement = self.current[phase]
+            self.samples[phase].append(measurement)
+            frame.append(measurement)
+            self.current[phase] = self.empty()
+        self.history.append(frame)
+
+    # Precond:
+    #   phase is the name of a phase which is not being tracked yet.
+    #
+    # Postcond:
+    #   Starts tracking the phase, with an empty measurement for every earlier frame.
+    def add_phase(self, phase: str):
+        """Starts tracking a phase which is not in PHASES."""
+        window = self.samples[self.phases[0]]
+        self.phases.append(phase)
+        self.current[phase] = self.empty()
+        self.samples[phase] = deque([self.empty() for _ in range(len(window))], maxlen=window.maxlen)
+        for frame in self.history:
+            frame.append(self.empty())
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Toggles whether draw_overlay shows anything.
+    def toggle_overlay(self):
+        """Shows or hides the overlay."""
+        self.show_overlay = not self.show_overlay
+        self.overlay = None
+
+    # Precond:
+    #   session is true to summarize every frame of the session, instead of the rolling window.
+    #
+    # Postcond:
+    #   Returns a dictionary mapping each phase to the summary of its measurements.
+    def get_stats(self, session: bool = False) -> dict:
+        """Summarizes the recorded measurements."""
+        shape = np.shape(self.empty())
+        if session:
+            frames = np.array(self.history, dtype=np.float64).reshape((-1, len(self.phases)) + shape)
+            columns = {phase: frames[:, idx] for idx, phase in enumerate(self.phases)}
+        else:
+            columns = {phase: np.array(self.samples[phase], dtype=np.float64).reshape((-1,) + shape)
+                       for phase in self.phases}
+        return {phase: self.summarize(column) for phase, column in columns.items()}
+
+    # Precond:
+    #   screen is the Pygame Surface object where the overlay will be drawn.
+    #   font is a valid GlyphAtlas object.
+    #   anchor is the (x, y) position of the overlay's top left corner.
+    #
+    # Postcond:
+    #   Draws the rolling statistics if the overlay is shown, returning the list of Rects drawn to.
+    def draw_overlay(self, screen: pg.Surface, font: GlyphAtlas, anchor: (int, int)) -> [pg.Rect]:
+        """Draws the overlay."""
+        if not self.show_overlay:
+            return []
+        self.overlay_age -= 1
+        if self.overlay is None or self.overlay_age <= 0:
+            self.overlay = font.render_lines(self.overlay_lines())
+            self.overlay_age = PhaseRecorder.OVERLAY_REFRESH
+        return [screen.blit(self.overlay, anchor)]
+
+    # Precond:
+    #   filename is the path of the CSV file to write.
+    #
+    # Postcond:
+    #   Writes every recorded frame's measurements to the file, one row per frame.
+    def export_csv(self, filename: str):
+        """Exports the session's measurements as CSV."""
+        with open(filename, 'w', newline='') as fout:
+            writer = csv.writer(fout)
+            writer.writerow(["frame"] + self.csv_header())
+            for frame in range(len(self.history)):
+                writer.writerow([frame] + self.csv_row(frame))
+
+    # Precond:
+    #   filename is the path of the JSON file to write.
+    #
+    # Postcond:
+    #   Writes the session summary, along with the subclass's report, to the file.
+    def export_json(self, filename: str):
+        """Exports the session's measurements as JSON."""
+        report = {
+            "frames": len(self.history),
+            "phases": self.phases,
+            "summary": self.get_stats(session=True)
+        }
+        report.update(self.report())
+        with open(filename, 'w') as fout:
+            json.dump(report, fout, indent=2)
@@ -8,10 +8,10 @@
 # Notes:
 
 from .game_object import MovingGameObject
-from .vector2d import Vector2D
+from .vector2d import Vector2D, MutableVector2D
 from .pellet import Pellet
 from .asset_manager import AssetManager
-from math import radians
+from math import radians, tau
 
 import pygame as pg
 
@@ -24,35 +24,39 @@ class Player(MovingGameObject):
     SHIP_MAX_VELOCITY = 90
     SHIP_ANGULAR_SPEED = radians(180)
     COOLDOWN_TIMER = 0.4
+    # Ship sprites are cached for this many evenly spaced facings
+    SPRITE_FACINGS = 256
+    SPRITE_CACHE = [None] * SPRITE_FACINGS
     
     def __init__(self, anchor: Vector2D):
         """Player constructor."""
         super(Player, self).__init__(anchor, Player.SHIP_RADIUS, Vector2D(0, 0))
         self.facing = 0
+        self.previous_facing = 0
         self.score = 0
         self.cooldown = 0
+        self.thrust = MutableVector2D(0, 0)
     
     def throttle_up(self, delta: float):
         """Apply acceleration in the direction of facing."""
-        facing_vector = Vector2D.ang_to_vec(self.facing).scale(delta).scale(Player.SHIP_ACCELERATION)
-        self.velocity = self.velocity.add(facing_vector)
-        if self.velocity.magnitude() >= Player.SHIP_MAX_VELOCITY:
-            self.velocity = self.velocity.unit().scale(Player.SHIP_MAX_VELOCITY)
+        self.thrust.set_angle(self.facing).iscale(delta).iscale(Player.SHIP_ACCELERATION)
+        self.velocity.iadd(self.thrust)
+        self.__limit_velocity()
     
     def throttle_down(self, delta: float):
         """Apply acceleration in the inverse direction of facing."""
-        facing_vector = Vector2D.ang_to_vec(self.facing).scale(delta).scale(Player.SHIP_ACCELERATION)
-        self.velocity = self.velocity.sub(facing_vector)
-        if self.velocity.magnitude() >= Player.SHIP_MAX_VELOCITY:
-            self.velocity = self.velocity.unit().scale(Player.SHIP_MAX_VELOCITY)
+        self.thrust.set_angle(self.facing).iscale(delta).iscale(Player.SHIP_ACCELERATION)
+        self.velocity.isub(self.thrust)
+        self.__limit_velocity()
     
     def halt_ship(self):
         """Set the ship's velocity to zero."""
-        self.velocity = Vector2D(0, 0)
+        self.velocity.set(0, 0)
         
     def reset_facing(self):
         """Resets the ship's facing to zero."""
         self.facing = 0
+        self.previous_facing = 0
     
     def rotate_cw(self, delta: float):
         """Rotate the ship clockwise."""
@@ -72,19 +76,27 @@ class Player(MovingGameObject):
         return self.score
     
     def fire(self):
-        """Spawn and return new pellet object in front of the player's ship."""
+        """Spawn and return a pooled pellet object in front of the player's ship."""
         if self.cooldown > 0:
             return None
         pellet_anchor = Vector2D.ang_to_vec(self.facing).scale(Player.SHIP_RADIUS)
-        pellet = Pellet(pellet_anchor.add(self.get_anchor()), pellet_anchor.unit())
+        pellet = Pellet.get_pool().acquire(pellet_anchor.add(self.get_anchor()), pellet_anchor.unit())
         pellet.activate()
-        AssetManager.get_instance().get_sound("shooting").play()
+        sound = AssetManager.get_instance().get_sound("shooting")
+        if sound is not None:
+            sound.play()
         self.cooldown = Player.COOLDOWN_TIMER
         return pellet
     
     def reset_cooldown(self):
         self.cooldown = Player.COOLDOWN_TIMER
     
+    def __limit_velocity(self):
+        """Caps the ship's velocity at the maximum velocity."""
+        magnitude = self.velocity.magnitude()
+        if magnitude >= Player.SHIP_MAX_VELOCITY:
+            self.velocity.iscale(1 / magnitude).iscale(Player.SHIP_MAX_VELOCITY)
+    
     # =======================
     #   Overridden methods
     # =======================
@@ -101,23 +113,75 @@ class Player(MovingGameObject):
         self.cooldown -= delta
         super(Player, self).update(delta)
     
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Override of store_previous which also records the ship's facing.
+    def store_previous(self):
+        """Called at the start of each simulation step to remember the ship's state."""
+        super(Player, self).store_previous()
+        self.previous_facing = self.facing
+    
     # Precond:
     #   screen is the Pygame Surface object where the object will be drawn.
+    #   alpha is a floating point number in [0, 1] indicating how far between simulation steps to draw.
     #
     # Postcond:
-    #   Override of the draw method for drawing the player's ship.
-    def draw(self, screen: pg.Surface):
-        """Override of the draw method for the Player's ship."""
+    #   Returns the ship's sprite and where to blit it, or None if it is not visible.
+    def get_blit(self, alpha: float = 1.0) -> (pg.Surface, (int, int)):
+        """Override of the get_blit method for the Player's ship."""
         if not self.visible:
-            return
-        anchor = self.get_anchor()
-        anchor = anchor.sub(Vector2D(Player.SHIP_RADIUS, Player.SHIP_RADIUS))
+            return None
+        anchor = self.get_render_anchor(alpha)
+        anchor = int(anchor[0] - Player.SHIP_RADIUS), int(anchor[1] - Player.SHIP_RADIUS)
+        facing = self.facing if alpha >= 1 else self.previous_facing + alpha * (self.facing - self.previous_facing)
+        return Player.get_sprite(facing), anchor
+    
+    # =========================
+    #   Static Methods
+    # =========================
+    
+    # Precond:
+    #   facing is a floating point value representing the ship's facing (in radians.)
+    #
+    # Postcond:
+    #   Returns the cached ship sprite for the nearest of the quantized facings.
+    @staticmethod
+    def get_sprite(facing: float) -> pg.Surface:
+        """Retrieves the ship sprite for a given facing, building it if needed."""
+        idx = round(facing * Player.SPRITE_FACINGS / tau) % Player.SPRITE_FACINGS
+        sprite = Player.SPRITE_CACHE[idx]
+        if sprite is None:
+            sprite = Player.create_sprite(idx * tau / Player.SPRITE_FACINGS)
+            Player.SPRITE_CACHE[idx] = sprite
+        return sprite
+    
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Builds the ship sprite for every quantized facing.
+    @staticmethod
+    def build_sprite_cache():
+        """Fills the ship sprite cache ahead of time."""
+        for idx in range(Player.SPRITE_FACINGS):
+            Player.get_sprite(idx * tau / Player.SPRITE_FACINGS)
+    
+    # Precond:
+    #   facing is a floating point value representing the ship's facing (in radians.)
+    #
+    # Postcond:
+    #   Returns a newly drawn ship sprite for the given facing.
+    @staticmethod
+    def create_sprite(facing: float) -> pg.Surface:
+        """Draws the ship sprite for a given facing."""
         sprite = pg.Surface((2*Player.SHIP_RADIUS + 1, 2*Player.SHIP_RADIUS + 1), flags=pg.SRCALPHA)
         sprite.fill((0, 0, 0, 0))
         sprite_center = Vector2D(*sprite.get_rect().center)
-        p1 = Vector2D.ang_to_vec(self.facing).scale(Player.SHIP_RADIUS).add(sprite_center)
-        p2 = Vector2D.ang_to_vec(self.facing + radians(120)).scale(Player.SHIP_RADIUS//2).add(sprite_center)
-        p3 = Vector2D.ang_to_vec(self.facing - radians(120)).scale(Player.SHIP_RADIUS//2).add(sprite_center)
+        p1 = Vector2D.ang_to_vec(facing).scale(Player.SHIP_RADIUS).add(sprite_center)
+        p2 = Vector2D.ang_to_vec(facing + radians(120)).scale(Player.SHIP_RADIUS//2).add(sprite_center)
+        p3 = Vector2D.ang_to_vec(facing - radians(120)).scale(Player.SHIP_RADIUS//2).add(sprite_center)
         pg.draw.circle(sprite, (255, 255, 255), sprite_center.to_int_tuple(), Player.SHIP_RADIUS, 1)
         pg.draw.polygon(sprite, (255, 255, 255), [p1.to_int_tuple(), p2.to_int_tuple(), p3.to_int_tuple()])
-        screen.blit(sprite, anchor.to_int_tuple())
\ No newline at end of file
+        return AssetManager.convert_sprite(sprite)
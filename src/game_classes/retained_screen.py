@@ -0,0 +1,68 @@
+# File: retained_screen.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   A simple retained-mode layer for screens whose content rarely changes.
+# Notes:
+#   The screen is composed once into a cached surface and only presented again when its state
+#   changes or the window needs repainting. Between changes the display keeps showing the last frame.
+
+import pygame as pg
+
+
+class RetainedScreen:
+    """Caches a composed static screen and redraws it only when needed."""
+
+    # Precond:
+    #   compose is a function taking a Pygame Surface which draws the entire screen onto it.
+    #
+    # Postcond:
+    #   Creates a new RetainedScreen, which will compose and present on its first use.
+    def __init__(self, compose):
+        """RetainedScreen constructor."""
+        self.compose = compose
+        self.cache = None
+        self.stale = True
+        self.shown = False
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Marks the screen's state as changed, it is recomposed on the next present.
+    def invalidate(self):
+        """Requests the screen be recomposed."""
+        self.stale = True
+
+    # Precond:
+    #   event is a Pygame event.
+    #
+    # Postcond:
+    #   Requests a repaint if the event indicates the window contents were lost.
+    def handle_event(self, event: pg.event.Event):
+        """Watches for events which require the screen to be repainted."""
+        if event.type in [pg.VIDEOEXPOSE, pg.WINDOWEXPOSED, pg.WINDOWRESTORED]:
+            self.shown = False
+
+    # Precond:
+    #   screen is the Pygame display Surface.
+    #
+    # Postcond:
+    #   Recomposes the cached screen if it is stale, and displays it if it has changed.
+    #   Returns true if the display was updated.
+    def present(self, screen: pg.Surface) -> bool:
+        """Shows the screen, doing no work if nothing has changed."""
+        if self.stale:
+            if self.cache is None or self.cache.get_size() != screen.get_size():
+                self.cache = pg.Surface(screen.get_size())
+            self.compose(self.cache)
+            self.stale = False
+            self.shown = False
+        if self.shown:
+            return False
+        screen.blit(self.cache, (0, 0))
+        pg.display.flip()
+        self.shown = True
+        return True
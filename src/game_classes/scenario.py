@@ -0,0 +1,188 @@
+# File: scenario.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   A class for building levels from declarative scenario files, for reproducing specific loads.
+# Notes:
+#   Scenarios are JSON objects, every key is optional:
+#       name) a label for the scenario
+#       description) what the scenario reproduces or stresses, for readers of the file and benchmark reports
+#       seed) seed for the global random sequence, 0 by default, so the same file always builds the same level
+#       arena) [width, height] of the level, or null to match the screen
+#       player) {"position": [x, y], "lives": int, "i_frames": seconds of invulnerability}
+#       asteroids) a list of groups, each:
+#           {"size": "small" | "medium" | "large", "count": int, "placement": placement,
+#            "speed": speed, "heading": heading}
+#       pellets) a list of groups, each {"count": int, "placement": placement, "heading": heading}
+#   A placement is one of:
+#       {"type": "uniform"} spreads the group over the whole arena (the default)
+#       {"type": "cluster", "clusters": int, "radius": float, "centers": [[x, y], ...]} spreads the group
+#           evenly over discs, at the given centers or at random ones
+#   A speed is a number, a [min, max] range drawn from uniformly, or omitted for the size-class's usual speed.
+#   A heading is a [min, max] range of degrees drawn from uniformly (all directions by default), "inward" to
+#   head for the center of the group's cluster (or the arena), or "outward" to head away from it.
+#   Objects placed partly outside the arena are moved inside it.
+
+from .level import Level
+from .player import Player
+from .asteroid import Asteroid
+from .pellet import Pellet
+from .vector2d import Vector2D
+
+from math import atan2, cos, sin, radians, sqrt, pi
+from random import seed, uniform
+import json
+
+
+class Scenario:
+    """A declarative description of a level's starting state."""
+    SIZES = {"small": Asteroid.SMALL, "medium": Asteroid.MEDIUM, "large": Asteroid.LARGE}
+
+    # Precond:
+    #   definition is a dictionary in the scenario format.
+    #
+    # Postcond:
+    #   Creates a new Scenario, raising ValueError if the definition is not valid.
+    def __init__(self, definition: dict):
+        """Scenario constructor."""
+        if not isinstance(definition, dict):
+            raise ValueError("A scenario must be a JSON object")
+        self.name = str(definition.get("name", "scenario"))
+        self.description = str(definition.get("description", ""))
+        self.seed = int(definition.get("seed", 0))
+        arena = definition.get("arena")
+        self.arena = None if arena is None else tuple(int(side) for side in Scenario.__pair(arena, "arena"))
+        self.player = dict(definition.get("player", {}))
+        if "position" in self.player:
+            Scenario.__pair(self.player["position"], "player position")
+        self.asteroids = [Scenario.__check_group(group, True) for group in definition.get("asteroids", [])]
+        self.pellets = [Scenario.__check_group(group, False) for group in definition.get("pellets", [])]
+
+    # Precond:
+    #   filename is the path of a scenario file.
+    #
+    # Postcond:
+    #   Returns the Scenario the file describes, raising ValueError if it is not valid.
+    @staticmethod
+    def load(filename: str) -> 'Scenario':
+        """Reads a scenario file."""
+        with open(filename) as fin:
+            try:
+                definition = json.load(fin)
+            except json.JSONDecodeError as err:
+                raise ValueError(f"{filename} is not valid JSON: {err}")
+        return Scenario(definition)
+
+    # Precond:
+    #   player is a valid Player object.
+    #   screen_dim is a tuple of integers representing the (width, height) of the screen.
+    #
+    # Postcond:
+    #   Returns a new, paused level in the scenario's starting state.
+    #   Seeds the global random sequence with the scenario's seed, so the level is the same every time.
+    def build(self, player: Player, screen_dim: (int, int)) -> Level:
+        """Creates a level from the scenario."""
+        seed(self.seed)
+        level = Level(player, screen_dim, 0, 0, 0, self.arena)
+        if "position" in self.player:
+            player.move_anchor_to(Vector2D(*self.player["position"]))
+        level.lives = int(self.player.get("lives", level.lives))
+        level.i_frames = float(self.player.get("i_frames", level.i_frames))
+        if not player.in_bounds(level.dim):
+            player.clamp(level.dim)
+
+        for group in self.asteroids:
+            size = group["size"]
+            first = len(level.asteroids)
+            for anchor, heading in self.__scatter(group, level.dim):
+                idx = level.asteroids.spawn(size, anchor)
+                speed = Scenario.__draw_speed(group.get("speed"), Asteroid.ASTEROID_SPEED[size])
+                level.asteroids.velocity[idx] = cos(heading) * speed, sin(heading) * speed
+            level.asteroids.clamp(level.dim, slice(first, len(level.asteroids)), vel_zero=False)
+
+        pellet_pool = Pellet.get_pool()
+        for group in self.pellets:
+            for anchor, heading in self.__scatter(group, level.dim):
+                pellet = pellet_pool.acquire(anchor, Vector2D.ang_to_vec(heading))
+                if not pellet.in_bounds(level.dim):
+                    pellet.clamp(level.dim, vel_zero=False)
+                pellet.activate()
+                level.pellets.append(pellet)
+        return level
+
+    def __scatter(self, group: dict, dim: (int, int)) -> [(Vector2D, float)]:
+        """Places each object of a group, returning its anchor and heading (in radians)."""
+        placement = group.get("placement", {"type": "uniform"})
+        heading = group.get("heading", [0, 360])
+        spread = placement.get("type", "uniform") == "uniform"
+        if spread:
+            centers = [(dim[0] / 2, dim[1] / 2)]
+            radius = 0
+        else:
+            radius = float(placement.get("radius", 100))
+            centers = [tuple(center) for center in placement.get("centers", [])]
+            while len(centers) < max(int(placement.get("clusters", 1)), 1):
+                centers.append((uniform(radius, dim[0] - radius), uniform(radius, dim[1] - radius)))
+        result = []
+        for i in range(group["count"]):
+            center = centers[i % len(centers)]
+            if spread:
+                point = (uniform(0, dim[0]), uniform(0, dim[1]))
+            else:
+                # Uniform over the disc
+                angle = uniform(0, 2 * pi)
+                distance = radius * sqrt(uniform(0, 1))
+                point = (center[0] + distance * cos(angle), center[1] + distance * sin(angle))
+            if heading == "inward" or heading == "outward":
+                angle = atan2(center[1] - point[1], center[0] - point[0])
+                result.append((Vector2D(*point), angle if heading == "inward" else angle + pi))
+            else:
+                result.append((Vector2D(*point), radians(uniform(heading[0], heading[1]))))
+        return result
+
+    @staticmethod
+    def __draw_speed(speed, default: float) -> float:
+        """Draws a speed from a speed specification."""
+        if speed is None:
+            return default
+        if isinstance(speed, (int, float)):
+            return float(speed)
+        return uniform(speed[0], speed[1])
+
+    @staticmethod
+    def __check_group(group: dict, asteroids: bool) -> dict:
+        """Validates a group of asteroids or pellets, returning a copy with its size-class resolved."""
+        kind = "asteroid" if asteroids else "pellet"
+        if not isinstance(group, dict):
+            raise ValueError(f"Each {kind} group must be a JSON object")
+        group = dict(group)
+        if not isinstance(group.get("count"), int) or group["count"] < 0:
+            raise ValueError(f"Each {kind} group needs a non-negative integer count")
+        if asteroids:
+            if group.get("size") not in Scenario.SIZES:
+                raise ValueError(f"Asteroid size must be one of {', '.join(Scenario.SIZES)}")
+            group["size"] = Scenario.SIZES[group["size"]]
+            speed = group.get("speed")
+            if speed is not None and not isinstance(speed, (int, float)):
+                Scenario.__pair(speed, "asteroid speed")
+        elif "speed" in group:
+            raise ValueError("Pellets always move at the pellet speed")
+        heading = group.get("heading", [0, 360])
+        if heading not in ["inward", "outward"]:
+            Scenario.__pair(heading, f"{kind} heading")
+        placement = group.get("placement", {"type": "uniform"})
+        if not isinstance(placement, dict) or placement.get("type", "uniform") not in ["uniform", "cluster"]:
+            raise ValueError(f"{kind.capitalize()} placement type must be uniform or cluster")
+        for center in placement.get("centers", []):
+            Scenario.__pair(center, f"{kind} cluster center")
+        return group
+
+    @staticmethod
+    def __pair(value, what: str) -> (float, float):
+        """Validates a pair of numbers."""
+        if not isinstance(value, (list, tuple)) or len(value) != 2 \
+                or not all(isinstance(item, (int, float)) for item in value):
+            raise ValueError(f"The {what} must be a pair of numbers")
+        return value[0], value[1]
@@ -0,0 +1,101 @@
+# File: simulation_thread.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   A worker thread which steps a level at a fixed tick rate, separately from rendering.
+# Notes:
+#   SDL requires event handling, input polling and display updates to happen on the main thread, so the
+#   main thread keeps those and renders the latest snapshot, while this thread only runs Level.step.
+#   The main thread passes input in with set_input, and must hold lock while changing the level's state.
+#   Pygame releases the GIL while presenting a frame, so a slow flip does not delay the simulation.
+
+from .level import Level
+from .frame_input import FrameInput
+from .frame_snapshot import FrameSnapshot, SnapshotBuffer
+
+from time import perf_counter, sleep
+import threading
+
+
+class SimulationThread(threading.Thread):
+    """A thread which runs a level's fixed-timestep simulation."""
+
+    # Precond:
+    #   level is a valid Level object.
+    #   tick_delta is the time (in seconds) of a single simulation step.
+    #   max_catch_up is the maximum number of steps run back to back after a stall.
+    #
+    # Postcond:
+    #   Creates a new SimulationThread, which is not yet started.
+    def __init__(self, level: Level, tick_delta: float, max_catch_up: int):
+        """SimulationThread constructor."""
+        super(SimulationThread, self).__init__(name="simulation", daemon=True)
+        self.level = level
+        self.tick_delta = tick_delta
+        self.max_catch_up = max_catch_up
+        self.inputs = FrameInput()
+        self.lock = threading.Lock()
+        self.snapshots = SnapshotBuffer()
+        self.snapshots.publish(level.capture())
+        self.running = threading.Event()
+        self.running.set()
+
+    # Precond:
+    #   inputs is a valid FrameInput object.
+    #
+    # Postcond:
+    #   Sets the input used for the following simulation steps.
+    def set_input(self, inputs: FrameInput):
+        """Passes the latest player input to the simulation."""
+        self.inputs = inputs
+
+    # Precond:
+    #   level is a valid Level object.
+    #   The caller must hold lock.
+    #
+    # Postcond:
+    #   Replaces the simulated level.
+    def set_level(self, level: Level):
+        """Switches the simulation to a new level."""
+        self.level = level
+        self.snapshots.publish(level.capture())
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Returns the latest snapshot and how far (in [0, 1]) the renderer should interpolate through it.
+    def latest(self) -> (FrameSnapshot, float):
+        """Retrieves the snapshot to render."""
+        snapshot = self.snapshots.latest()
+        return snapshot, min(1.0, (perf_counter() - snapshot.time) / self.tick_delta)
+
+    # Precond:
+    #   None.
+    #
+    # Postcond:
+    #   Stops the simulation and waits for the thread to finish.
+    def stop(self):
+        """Stops the simulation thread."""
+        self.running.clear()
+        if self.is_alive():
+            self.join()
+
+    def run(self):
+        """Steps the level at the fixed tick rate until stopped."""
+        next_tick = perf_counter() + self.tick_delta
+        while self.running.is_set():
+            wait = next_tick - perf_counter()
+            if wait > 0:
+                sleep(wait)
+                continue
+            with self.lock:
+                self.level.step(self.tick_delta, self.inputs)
+                snapshot = self.level.capture()
+            self.snapshots.publish(snapshot)
+            next_tick += self.tick_delta
+            if perf_counter() - next_tick >= self.max_catch_up * self.tick_delta:
+                # Drop any remaining backlog after a stall
+                next_tick = perf_counter() + self.tick_delta
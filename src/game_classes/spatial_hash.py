@@ -0,0 +1,127 @@
+# File: spatial_hash.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   A uniform-grid spatial hash used as a broad-phase for circle collisions.
+# Notes:
+#   Each circle is binned into the single cell containing its center. Queries widen their
+#   search box by the largest indexed radius, so every circle that could intersect the query
+#   is returned as a candidate.
+#   The grid is stored sorted by cell key, so a full rebuild each tick is a single sort.
+#   Rectangle queries let the grid double as a viewport index for culling.
+
+from .asteroid import Asteroid
+from .vector2d import Vector2D
+
+import numpy as np
+import pygame as pg
+
+
+class SpatialHash:
+    """A uniform-grid broad-phase for circle colliders."""
+    CELL_SIZE = 2 * max(Asteroid.ASTEROID_MAX_RADIUS)
+    # Offset keeping the y-component of a cell key non-negative.
+    KEY_OFFSET = 1 << 31
+
+    # Precond:
+    #   cell_size is the positive side length of a single grid cell.
+    #
+    # Postcond:
+    #   Creates a new, empty SpatialHash.
+    def __init__(self, cell_size: float = CELL_SIZE):
+        """SpatialHash constructor."""
+        self.cell_size = cell_size
+        self.order = np.empty(0, dtype=np.intp)
+        self.cell_keys = np.empty(0, dtype=np.int64)
+        self.cell_starts = np.zeros(1, dtype=np.intp)
+        self.max_radius = 0.0
+
+    # Precond:
+    #   positions is an (n, 2) array of circle centers.
+    #   radii is an array of n circle radii.
+    #
+    # Postcond:
+    #   Replaces the contents of the hash with the given circles, indexed 0 to n-1.
+    def rebuild(self, positions: np.ndarray, radii: np.ndarray):
+        """Rebuilds the grid from a set of circles."""
+        cells = np.floor(positions / self.cell_size).astype(np.int64)
+        keys = SpatialHash.__key(cells[:, 0], cells[:, 1])
+        self.order = np.argsort(keys, kind="stable")
+        self.cell_keys, starts = np.unique(keys[self.order], return_index=True)
+        self.cell_starts = np.append(starts, len(keys))
+        self.max_radius = float(radii.max()) if len(radii) > 0 else 0.0
+
+    # Precond:
+    #   anchor is a valid Vector2D object.
+    #   radius is a floating point number.
+    #
+    # Postcond:
+    #   Returns the indices, in ascending order, of every indexed circle which may intersect the given circle.
+    def query(self, anchor: Vector2D, radius: float) -> np.ndarray:
+        """Retrieves the collision candidates for a single circle."""
+        return self.query_many(np.array([[anchor.x, anchor.y]]), np.array([radius]))[1]
+
+    # Precond:
+    #   centers is an (n, 2) array of circle centers.
+    #   radii is an array of n circle radii.
+    #
+    # Postcond:
+    #   Returns a pair of equal length index arrays (query_indices, indexed_indices) holding every
+    #   candidate pair, ordered lexicographically.
+    def query_many(self, centers: np.ndarray, radii: np.ndarray) -> (np.ndarray, np.ndarray):
+        """Retrieves the collision candidates for a set of circles."""
+        empty = np.empty(0, dtype=np.intp)
+        if len(self.cell_keys) == 0 or len(radii) == 0:
+            return empty, empty
+        reach = (radii + self.max_radius)[:, np.newaxis]
+        low = np.floor((centers - reach) / self.cell_size).astype(np.int64)
+        span = np.floor((centers + reach) / self.cell_size).astype(np.int64) - low + 1
+        # Expand every query into the cells its search box covers.
+        cell_counts = span[:, 0] * span[:, 1]
+        queries = np.repeat(np.arange(len(radii)), cell_counts)
+        local = np.arange(len(queries)) - np.repeat(np.cumsum(cell_counts) - cell_counts, cell_counts)
+        x_cells = low[queries, 0] + local // span[queries, 1]
+        y_cells = low[queries, 1] + local % span[queries, 1]
+        keys = SpatialHash.__key(x_cells, y_cells)
+        found = np.minimum(np.searchsorted(self.cell_keys, keys), len(self.cell_keys) - 1)
+        matched = self.cell_keys[found] == keys
+        queries, found = queries[matched], found[matched]
+        member_counts, members = self.__members(found)
+        queries = np.repeat(queries, member_counts)
+        indexed = self.order[members]
+        ordering = np.lexsort((indexed, queries))
+        return queries[ordering], indexed[ordering]
+
+    # Precond:
+    #   rect is a Pygame Rect.
+    #   margin is a non-negative number of pixels to widen the rectangle by on every side.
+    #
+    # Postcond:
+    #   Returns the indices, in ascending order, of every indexed circle which may overlap the rectangle.
+    def query_rect(self, rect: pg.Rect, margin: float = 0.0) -> np.ndarray:
+        """Retrieves the circles which may be inside a rectangle, such as the visible area of the screen."""
+        if len(self.cell_keys) == 0:
+            return np.empty(0, dtype=np.intp)
+        reach = self.max_radius + margin
+        low = np.floor((np.array(rect.topleft) - reach) / self.cell_size).astype(np.int64)
+        high = np.floor((np.array(rect.bottomright) + reach) / self.cell_size).astype(np.int64)
+        x_cells, y_cells = np.meshgrid(np.arange(low[0], high[0] + 1), np.arange(low[1], high[1] + 1), indexing="ij")
+        keys = SpatialHash.__key(x_cells.ravel(), y_cells.ravel())
+        found = np.minimum(np.searchsorted(self.cell_keys, keys), len(self.cell_keys) - 1)
+        _, members = self.__members(found[self.cell_keys[found] == keys])
+        return np.sort(self.order[members])
+
+    def __members(self, found: np.ndarray) -> (np.ndarray, np.ndarray):
+        """Expands occupied cells into the number of members in each, and the sorted positions of those members."""
+        starts = self.cell_starts[found]
+        member_counts = self.cell_starts[found + 1] - starts
+        members = np.arange(member_counts.sum()) + \
+            np.repeat(starts - np.cumsum(member_counts) + member_counts, member_counts)
+        return member_counts, members
+
+    @staticmethod
+    def __key(x_cells: np.ndarray, y_cells: np.ndarray) -> np.ndarray:
+        """Packs cell coordinates into a single sortable key."""
+        return (x_cells << 32) + (y_cells + SpatialHash.KEY_OFFSET)
@@ -13,32 +13,8 @@ from .asset_manager import AssetManager
 
 class TextBox:
     def __init__(self, data: str, color: (int, int, int), line_length: int, font_name: str):
-        font = AssetManager.get_instance().get_font(font_name)
-        font.set_bold(False)
-        provided_lines = data.split("\n")
-        wrapped_text = []
-        temp = ""
-        for line in provided_lines:
-            temp = ""
-            words = line.lstrip().split(" ")
-            for word in words:
-                if (len(word) + len(temp) + 1) < line_length:
-                    temp = temp + " " + word
-                else:
-                    wrapped_text.append(temp)
-                    temp = word
-            if len(temp) != 0:
-                wrapped_text.append(temp)
-        rendered_text = []
-        for line in wrapped_text:
-            rendered_text.append(font.render(line, True, color))
-        total_vertical = sum(map(lambda proc_line: proc_line.get_height(), rendered_text))
-        max_horizontal = max(map(lambda proc_line: proc_line.get_width(), rendered_text))
-        self.surf = pg.Surface((max_horizontal, total_vertical), flags=pg.SRCALPHA)
-        vert = 0
-        for line in rendered_text:
-            self.surf.blit(line, (0, vert))
-            vert += line.get_height()
+        font = AssetManager.get_instance().get_glyph_atlas(font_name, color)
+        self.surf = font.render_wrapped(data, line_length)
     
     def place(self, screen: pg.Surface, anchor: (int, int)):
         screen.blit(self.surf, anchor)
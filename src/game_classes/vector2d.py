@@ -6,12 +6,15 @@
 # Purpose:
 #   A simple, immutable two-dimensional vector class.
 # Notes:
+#   MutableVector2D is a companion class with in-place operations, used by hot paths which would
+#   otherwise allocate new vectors every frame.
 
 from math import sqrt, sin, cos
 
 
 class Vector2D:
     """An immutable 2D vector class"""
+    __slots__ = ("x", "y")
     
     # Precond:
     #   x is the x value of the 2D vector.
@@ -116,3 +119,76 @@ class Vector2D:
     @staticmethod
     def ang_to_vec(angle: float) -> 'Vector2D':
         return Vector2D(cos(angle), sin(angle))
+
+
+class MutableVector2D(Vector2D):
+    """A mutable 2D vector class with in-place operations"""
+    __slots__ = ()
+    
+    # Precond:
+    #   x is the new x value of the 2D vector.
+    #   y is the new y value of the 2D vector.
+    #
+    # Postcond:
+    #   Sets the components of this vector and returns this vector.
+    def set(self, x: float, y: float) -> 'MutableVector2D':
+        """Sets both components of the vector in place"""
+        self.x = x
+        self.y = y
+        return self
+    
+    # Precond:
+    #   angle is a floating point value representing the angle to point in (in radians.)
+    #
+    # Postcond:
+    #   Sets this vector to the unit vector pointing in the given direction and returns this vector.
+    def set_angle(self, angle: float) -> 'MutableVector2D':
+        """Sets the vector to a unit vector in place"""
+        self.x = cos(angle)
+        self.y = sin(angle)
+        return self
+    
+    # Precond:
+    #   other is a valid Vector2D object
+    #
+    # Postcond:
+    #   Adds the given vector to this vector and returns this vector.
+    def iadd(self, other: Vector2D) -> 'MutableVector2D':
+        """Adds a 2D vector in place"""
+        self.x = self.x + other.x
+        self.y = self.y + other.y
+        return self
+    
+    # Precond:
+    #   other is a valid Vector2D object
+    #   factor is a floating-point value
+    #
+    # Postcond:
+    #   Adds the given vector, scaled by the given factor, to this vector and returns this vector.
+    def iadd_scaled(self, other: Vector2D, factor: float) -> 'MutableVector2D':
+        """Adds a scaled 2D vector in place"""
+        self.x = self.x + factor * other.x
+        self.y = self.y + factor * other.y
+        return self
+    
+    # Precond:
+    #   other is a valid Vector2D object
+    #
+    # Postcond:
+    #   Subtracts the given vector from this vector and returns this vector.
+    def isub(self, other: Vector2D) -> 'MutableVector2D':
+        """Subtracts a 2D vector in place"""
+        self.x = self.x - other.x
+        self.y = self.y - other.y
+        return self
+    
+    # Precond:
+    #   factor is a floating-point value
+    #
+    # Postcond:
+    #   Scales this vector by the given factor and returns this vector.
+    def iscale(self, factor: float) -> 'MutableVector2D':
+        """Scales a 2D vector in place"""
+        self.x = factor * self.x
+        self.y = factor * self.y
+        return self
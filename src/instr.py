@@ -8,7 +8,7 @@
 # Notes:
 
 from time import perf_counter
-from game_classes import TextBox, Button, GameConfig
+from game_classes import TextBox, Button, GameConfig, RetainedScreen
 import pygame as pg
 
 def instr():
@@ -68,6 +68,18 @@ def instr():
     instr_anchor = screen.get_width() - instr_btn.get_dim()[0], 0
     back_btn = Button("Back", None, (255, 0, 0))
     back_anchor = screen.get_width() - back_btn.get_dim()[0], screen.get_height() - back_btn.get_dim()[1]
+    
+    def compose(surf: pg.Surface):
+        surf.fill((0, 0, 0))
+        controls_btn.place(surf, controls_anchor)
+        instr_btn.place(surf, instr_anchor)
+        if GameConfig.get_setting("controller") == "KEYBOARD":
+            back_btn.place(surf, back_anchor)
+        if display == "CONTR":
+            controls_text.place_center(surf)
+        elif display == "INSTR":
+            instr_text.place_center(surf)
+    retained = RetainedScreen(compose)
 
     # Update accounting
     frame_delta = 1 / 24
@@ -78,18 +90,10 @@ def instr():
         if delta >= frame_delta:
             frame_timer = perf_counter()
             # Process Frame
-            screen.fill((0, 0, 0))
-            controls_btn.place(screen, controls_anchor)
-            instr_btn.place(screen, instr_anchor)
-            if GameConfig.get_setting("controller") == "KEYBOARD":
-                back_btn.place(screen, back_anchor)
-            if display == "CONTR":
-                controls_text.place_center(screen)
-            elif display == "INSTR":
-                instr_text.place_center(screen)
-            pg.display.flip()
+            retained.present(screen)
             # Process Events
             for event in pg.event.get():
+                retained.handle_event(event)
                 if event.type == pg.QUIT:
                     running = False
                     return -1
@@ -100,16 +104,22 @@ def instr():
                     elif event.type == pg.MOUSEBUTTONDOWN and event.button == 1:
                         if controls_btn.check_click(event.pos):
                             display = "CONTR"
+                            retained.invalidate()
                         elif instr_btn.check_click(event.pos):
                             display = "INSTR"
+                            retained.invalidate()
                         elif back_btn.check_click(event.pos):
                             running = False
                 elif GameConfig.get_setting("controller") == "GAMEPAD":
                     if event.type == pg.JOYBUTTONDOWN:
                         if event.button == GameConfig.get_setting("L"):
                             display = "CONTR"
+                            retained.invalidate()
                         elif event.button == GameConfig.get_setting("R"):
                             display = "INSTR"
+                            retained.invalidate()
                         elif event.button == GameConfig.get_setting("B"):
                             running = False
+        else:
+            pg.time.wait(int((frame_delta - delta) * 1000))
     return 0
@@ -17,7 +17,7 @@ from game import game
 from menu import menu
 from instr import instr
 from board import leaderboard, leaderboard_add
-from game_classes import Leaderboard, AssetManager, GameConfig
+from game_classes import Leaderboard, AssetManager, GameConfig, Player, Asteroid, Pellet
 
 
 def create_icon():
@@ -47,6 +47,11 @@ def main():
     AssetManager.get_instance().register_font("large", pg.font.Font("assets/fonts/Consolas.ttf", 48))
     AssetManager.get_instance().register_font("medium", pg.font.Font("assets/fonts/Consolas.ttf", 24))
     AssetManager.get_instance().register_font("small", pg.font.Font("assets/fonts/Consolas.ttf", 18))
+    AssetManager.get_instance().register_font("board", pg.font.Font("assets/fonts/Consolas.ttf", 20))
+    AssetManager.get_instance().register_font("hud", pg.font.Font("assets/fonts/Consolas.ttf", 30))
+    Player.build_sprite_cache()
+    Asteroid.build_shapes()
+    Pellet.build_sprite()
 
     splash_screen(9)
     menu_selection = menu()
@@ -14,7 +14,7 @@
 
 import pygame as pg
 from time import perf_counter
-from game_classes import Button, AssetManager, GameConfig
+from game_classes import Button, AssetManager, GameConfig, RetainedScreen
 
 
 def pointer_points(btn: Button, width: int, height: int, padding: int):
@@ -31,9 +31,8 @@ def menu():
     screen = pg.display.get_surface()
     screen_dim = screen.get_size()
     running = True
-    announcement_font = AssetManager.get_instance().get_font("large")
-    announcement_font.set_bold(True)
-    masteroid_label = announcement_font.render("MASTEROIDS", True, (200, 0, 0))
+    title_font = AssetManager.get_instance().get_glyph_atlas("large", (200, 0, 0), bold=True)
+    masteroid_label = title_font.render("MASTEROIDS")
     masteroid_anchor = (screen_dim[0] - masteroid_label.get_width())//2, screen_dim[1]//4 - masteroid_label.get_height()//2
     
     # Create buttons
@@ -51,6 +50,18 @@ def menu():
     selector = 0
     selector_width = 5
     buttons = [(start_btn, start_vert), (instr_btn, instr_vert), (leader_btn, leader_vert), (quit_btn, quit_vert)]
+    
+    def compose(surf: pg.Surface):
+        surf.fill((0, 0, 0))
+        surf.blit(masteroid_label, masteroid_anchor)
+        start_btn.place_horizontal_center(surf, start_vert)
+        instr_btn.place_horizontal_center(surf, instr_vert)
+        leader_btn.place_horizontal_center(surf, leader_vert)
+        quit_btn.place_horizontal_center(surf, quit_vert)
+        if GameConfig.get_setting("controller") == "GAMEPAD":
+            pts = pointer_points(buttons[selector][0], 10, 15, 5)
+            pg.draw.polygon(surf, (0, 0, 255), pts)
+    retained = RetainedScreen(compose)
 
     # Update accounting
     frame_delta = 1 / 24
@@ -61,18 +72,10 @@ def menu():
         if delta >= frame_delta:
             frame_timer = perf_counter()
             # Process Frame
-            screen.fill((0, 0, 0))
-            screen.blit(masteroid_label, masteroid_anchor)
-            start_btn.place_horizontal_center(screen, start_vert)
-            instr_btn.place_horizontal_center(screen, instr_vert)
-            leader_btn.place_horizontal_center(screen, leader_vert)
-            quit_btn.place_horizontal_center(screen, quit_vert)
-            if GameConfig.get_setting("controller") == "GAMEPAD":
-                pts = pointer_points(buttons[selector][0], 10, 15, 5)
-                pg.draw.polygon(screen, (0, 0, 255), pts)
-            pg.display.flip()
+            retained.present(screen)
             # Process Events
             for event in pg.event.get():
+                retained.handle_event(event)
                 if event.type == pg.QUIT:
                     running = False
                 if GameConfig.get_setting("controller") == "KEYBOARD":
@@ -102,6 +105,9 @@ def menu():
                             elif round(event.value) == 1:
                                 selector += 1
                             selector = selector % len(buttons)
+                            retained.invalidate()
+        else:
+            pg.time.wait(int((frame_delta - delta) * 1000))
                                 
     return selection
                 
@@ -0,0 +1,82 @@
+# File: replay.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   Headless replay of a recorded game session, as fast as the simulation can step.
+# Notes:
+#   Run from the src directory with a log written by the record_input setting, for example:
+#       python replay.py session.mrec
+#   The replay rebuilds the session's levels from its seed, steps them with the recorded input, and checks
+#   the final score and level state against the recording. Exits with status 1 if they differ.
+
+import os
+os.environ.setdefault('SDL_VIDEODRIVER', "dummy")
+os.environ.setdefault('SDL_AUDIODRIVER', "dummy")
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
+
+import argparse
+import sys
+from random import seed
+from time import perf_counter
+
+from game_classes import Player, Vector2D, Level, GameConfig, InputRecorder, InputLog
+from game import create_level
+
+
+def apply_command(command: int, player: Player, level: Level, screen_dim: (int, int), difficulty: int) \
+        -> (Level, int):
+    """Applies a recorded game state change, returning the (possibly new) level and difficulty."""
+    if command == InputRecorder.START:
+        player.set_visible(True)
+        player.reset_cooldown()
+        level.toggle_pause()
+    elif command == InputRecorder.TOGGLE_PAUSE:
+        level.toggle_pause()
+    elif command == InputRecorder.NEXT_LEVEL:
+        difficulty += 1
+        level.close()
+        level = create_level(player, screen_dim, difficulty)
+    return level, difficulty
+
+
+def replay(log: InputLog) -> (Player, Level):
+    """Replays a recorded session, returning its player and final level."""
+    GameConfig.register_setting("world_dim", log.world_dim)
+    seed(log.seed)
+    player = Player(Vector2D(250, 250))
+    difficulty = 10
+    level = create_level(player, log.screen_dim, difficulty)
+    player.set_active(True)
+    player.set_visible(True)
+    for delta, inputs, commands in log.ticks:
+        for command in commands:
+            level, difficulty = apply_command(command, player, level, log.screen_dim, difficulty)
+        level.step(delta, inputs)
+    for command in log.final_commands:
+        level, difficulty = apply_command(command, player, level, log.screen_dim, difficulty)
+    return player, level
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Replay a recorded Masteroids session headlessly.")
+    parser.add_argument("log", help="input log written by the record_input setting")
+    args = parser.parse_args()
+    log = InputLog(args.log)
+
+    start = perf_counter()
+    player, level = replay(log)
+    elapsed = perf_counter() - start
+    score_match = player.get_score() == log.score
+    state_match = level.state_hash() == log.state_hash
+    level.close()
+
+    print(f"ticks:  {len(log.ticks)} in {elapsed:.3f}s ({len(log.ticks) / max(elapsed, 1e-9):.1f} ticks/s)")
+    print(f"score:  {player.get_score()} (recorded {log.score}) {'match' if score_match else 'MISMATCH'}")
+    print(f"state:  {'match' if state_match else 'MISMATCH'}")
+    sys.exit(0 if score_match and state_match else 1)
+
+
+if __name__ == '__main__':
+    main()
@@ -10,7 +10,7 @@
 from time import perf_counter
 
 import pygame as pg
-from game_classes import AssetManager
+from game_classes import AssetManager, RetainedScreen
 
 
 # Precond:
@@ -25,29 +25,43 @@ def splash_screen(length: float):
     masteroids_length = length/3
     screen = pg.display.get_surface()
     running = True
-    announcement_font = AssetManager.get_instance().get_font("large")
-    announcement_font.set_bold(True)
-    subtitle_font = AssetManager.get_instance().get_font("small")
+    announcement_font = AssetManager.get_instance().get_glyph_atlas("large", bold=True)
+    title_font = AssetManager.get_instance().get_glyph_atlas("large", (200, 0, 0), bold=True)
+    subtitle_font = AssetManager.get_instance().get_glyph_atlas("small")
 
     
     # SAGS labels
-    from_label = subtitle_font.render("A game from:", True, (255, 255, 255))
-    sacgs_label = announcement_font.render("SAC Game Studios", True, (255, 255, 255))
+    from_label = subtitle_font.render("A game from:")
+    sacgs_label = announcement_font.render("SAC Game Studios")
     sacgs_anchor = (screen.get_width()-sacgs_label.get_width())//2, (screen.get_height()-sacgs_label.get_height())//2
     from_anchor = sacgs_anchor[0], sacgs_anchor[1] - from_label.get_height()
     
     # Pygame labels
-    with_label = subtitle_font.render("Made with:", True, (255, 255, 255))
-    pygame_label = announcement_font.render("Pygame", True, (255, 255, 255))
+    with_label = subtitle_font.render("Made with:")
+    pygame_label = announcement_font.render("Pygame")
     pygame_anchor = (screen.get_width()-pygame_label.get_width())//2, (screen.get_height()-pygame_label.get_height())//2
     with_anchor = pygame_anchor[0], pygame_anchor[1] - with_label.get_height()
     
     # Masteroids Label
-    masteroid_label = announcement_font.render("MASTEROIDS", True, (200, 0, 0))
+    masteroid_label = title_font.render("MASTEROIDS")
     masteroid_anchor = (screen.get_width()-masteroid_label.get_width())//2, (screen.get_height()-masteroid_label.get_height())//2
     
+    def compose(surf: pg.Surface):
+        surf.fill((0, 0, 0))
+        if sacgs_length < 0:
+            if pygame_length < 0:
+                surf.blit(masteroid_label, masteroid_anchor)
+            else:
+                surf.blit(with_label, with_anchor)
+                surf.blit(pygame_label, pygame_anchor)
+        else:
+            surf.blit(from_label, from_anchor)
+            surf.blit(sacgs_label, sacgs_anchor)
+    retained = RetainedScreen(compose)
+    
     frame_delta = 1 / 24
     frame_timer = perf_counter()
+    phase = 0
     while running:
         delta = perf_counter() - frame_timer
         if delta >= frame_delta:
@@ -64,21 +78,18 @@ def splash_screen(length: float):
             length -= delta
             frame_timer = perf_counter()
             # Process Frame
-            screen.fill((0, 0, 0))
-            if sacgs_length < 0:
-                if pygame_length < 0:
-                    screen.blit(masteroid_label, masteroid_anchor)
-                else:
-                    screen.blit(with_label, with_anchor)
-                    screen.blit(pygame_label, pygame_anchor)
-            else:
-                screen.blit(from_label, from_anchor)
-                screen.blit(sacgs_label, sacgs_anchor)
-            pg.display.flip()
+            current_phase = 0 if sacgs_length >= 0 else (1 if pygame_length >= 0 else 2)
+            if current_phase != phase:
+                phase = current_phase
+                retained.invalidate()
+            retained.present(screen)
             # Process Events
             for event in pg.event.get():
+                retained.handle_event(event)
                 if event.type == pg.KEYDOWN:
                     if event.key == pg.K_ESCAPE:
                         running = False
             if length <= 0:
                 running = False
+        else:
+            pg.time.wait(int((frame_delta - delta) * 1000))
@@ -0,0 +1,18 @@
+# File: conftest.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   Shared pytest setup for the game_classes tests.
+# Notes:
+#   Run from the src directory with: python -m pytest tests
+#   Tests only step levels headlessly, so SDL uses its dummy drivers and no window is opened.
+
+import os
+import sys
+
+os.environ.setdefault('SDL_VIDEODRIVER', "dummy")
+os.environ.setdefault('SDL_AUDIODRIVER', "dummy")
+os.environ['PYGAME_HIDE_SUPPORT_PROMPT'] = "hide"
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
@@ -0,0 +1,130 @@
+# File: test_asteroid_field.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   Regression tests checking that the AsteroidField simulation matches the original Asteroid object path.
+# Notes:
+#   The reference path steps a list of Asteroid objects with the per-object loop levels used before
+#   AsteroidField, drawing from the seeded global random sequence in the same order.
+
+from random import seed, randint
+
+import numpy as np
+import pytest
+
+from game_classes import Asteroid, Level, Player, Vector2D, FrameInput
+
+DIM = (500, 500)
+DELTA = 1 / 24
+
+
+def make_inputs(frame: int) -> FrameInput:
+    """Turns and fires every frame, alternating between speeding up and slowing down."""
+    return FrameInput(rotation=1, throttle=1 if frame % 50 < 30 else -1, fire=True)
+
+
+def field_run(game_seed: int, counts: (int, int, int), frames: int) -> [tuple]:
+    """Plays a seeded level stepped by Level, returning the state after every step."""
+    seed(game_seed)
+    player = Player(Vector2D(250, 250))
+    player.activate()
+    level = Level(player, DIM, *counts)
+    level.resume()
+    states = []
+    for frame in range(frames):
+        level.step(DELTA, make_inputs(frame))
+        states.append((level.asteroids.positions().copy(), level.asteroids.size[:len(level.asteroids)].copy(), player.get_score(),
+                       level.lives))
+    level.close()
+    return states
+
+
+def object_run(game_seed: int, counts: (int, int, int), frames: int) -> [tuple]:
+    """Plays a seeded level with its asteroids as Asteroid objects, returning the state after every step."""
+    seed(game_seed)
+    player = Player(Vector2D(250, 250))
+    player.activate()
+    asteroids = []
+    for size, count in zip([Asteroid.SMALL, Asteroid.MEDIUM, Asteroid.LARGE], counts):
+        for _ in range(count):
+            asteroid = Asteroid(size, Vector2D(randint(0, DIM[0]), randint(0, DIM[1])))
+            asteroid.clamp(DIM)
+            asteroid.activate()
+            asteroids.append(asteroid)
+    # An empty level handles the player, pellets and invulnerability, the asteroids are stepped here
+    level = Level(player, DIM, 0, 0, 0)
+    level.resume()
+    states = []
+    for frame in range(frames):
+        asteroids = object_step(level, asteroids, make_inputs(frame))
+        states.append((np.array([a.get_anchor().to_tuple() for a in asteroids]).reshape(-1, 2),
+                       np.array([a.size for a in asteroids]), player.get_score(), level.lives))
+    level.close()
+    return states
+
+
+def object_step(level: Level, asteroids: [Asteroid], inputs: FrameInput) -> [Asteroid]:
+    """Steps a level and its Asteroid objects the way levels did before AsteroidField."""
+    player = level.player
+    level.handle_i_frames(DELTA)
+    player.update(DELTA)
+    for asteroid in asteroids:
+        asteroid.update(DELTA)
+    for pellet in level.pellets:
+        pellet.update(DELTA)
+    if not player.in_bounds(level.dim):
+        player.bounce(level.dim)
+    for asteroid in asteroids:
+        if not asteroid.in_bounds(level.dim):
+            asteroid.bounce(level.dim)
+
+    pellet_remove = set()
+    asteroid_remove = set()
+    asteroid_add = []
+    for idx, pellet in enumerate(level.pellets):
+        for i, asteroid in enumerate(asteroids):
+            if pellet.has_collided(asteroid):
+                asteroid_remove.add(i)
+                pellet_remove.add(idx)
+                asteroid_add.extend(asteroid.split())
+                player.add_score(asteroid.get_point_value())
+    if level.i_frames <= 0:
+        for asteroid in asteroids:
+            if asteroid.has_collided(player):
+                level.lives -= 1
+                player.move_anchor_to(Vector2D(level.dim[0]//2, level.dim[1]//2))
+                player.halt_ship()
+                level.i_frames = 1
+                level.i_blink_count = 0
+                break
+
+    level.pellets = [pellet for idx, pellet in enumerate(level.pellets)
+                     if idx not in pellet_remove and pellet.in_bounds(level.dim)]
+    asteroids = [asteroid for i, asteroid in enumerate(asteroids) if i not in asteroid_remove] + asteroid_add
+
+    if inputs.rotation == 1:
+        player.rotate_cw(DELTA)
+    if inputs.throttle == 1:
+        player.throttle_up(DELTA)
+    elif inputs.throttle == -1:
+        player.throttle_down(DELTA)
+    pellet = player.fire()
+    if pellet is not None:
+        level.pellets.append(pellet)
+    return asteroids
+
+
+@pytest.mark.parametrize("game_seed, counts", [(7, (40, 16, 8)), (11, (160, 64, 40)), (3, (0, 0, 30))])
+def test_field_matches_asteroid_objects(game_seed, counts):
+    frames = 400
+    expected = object_run(game_seed, counts, frames)
+    actual = field_run(game_seed, counts, frames)
+    for frame, (want, got) in enumerate(zip(expected, actual)):
+        assert got[1].tolist() == want[1].tolist(), f"sizes differ at frame {frame}"
+        np.testing.assert_allclose(got[0], want[0], rtol=0, atol=1e-9, err_msg=f"positions differ at frame {frame}")
+        assert got[2] == want[2], f"score differs at frame {frame}"
+        assert got[3] == want[3], f"lives differ at frame {frame}"
+    # The runs must have split asteroids for the comparison to mean anything
+    assert expected[-1][2] > 0
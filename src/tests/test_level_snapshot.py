@@ -0,0 +1,84 @@
+# File: test_level_snapshot.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   Tests checking that restoring a level snapshot replays the simulation exactly.
+# Notes:
+
+from random import Random, seed
+
+import pytest
+
+from game_classes import Level, Player, Vector2D, FrameInput
+
+DIM = (500, 500)
+DELTA = 1 / 24
+
+
+def make_level(game_seed: int, counts: (int, int, int)) -> Level:
+    """Creates a seeded, running level."""
+    seed(game_seed)
+    player = Player(Vector2D(250, 250))
+    player.activate()
+    level = Level(player, DIM, *counts)
+    level.resume()
+    return level
+
+
+def make_inputs(input_seed: int, steps: int) -> [FrameInput]:
+    """Creates a seeded sequence of random inputs."""
+    rng = Random(input_seed)
+    return [FrameInput(rng.randint(-1, 1), rng.randint(-1, 1), rng.random() < 0.05, rng.random() < 0.5)
+            for _ in range(steps)]
+
+
+def run(level: Level, inputs: [FrameInput]) -> [str]:
+    """Steps the level through the inputs, returning its state hash after every step."""
+    hashes = []
+    for frame_input in inputs:
+        level.step(DELTA, frame_input)
+        hashes.append(level.state_hash())
+    return hashes
+
+
+@pytest.mark.parametrize("game_seed, counts", [(1, (20, 8, 5)), (5, (200, 80, 50))])
+def test_restore_replays_the_same_steps(game_seed, counts):
+    level = make_level(game_seed, counts)
+    run(level, make_inputs(game_seed, 60))
+    data = level.snapshot()
+    inputs = make_inputs(game_seed + 1, 200)
+    expected = run(level, inputs)
+    level.restore(data)
+    assert run(level, inputs) == expected
+    # The steps must have split asteroids and fired pellets for the comparison to mean anything
+    assert level.player.get_score() > 0
+    level.close()
+
+
+def test_restore_into_another_level():
+    level = make_level(3, (40, 16, 8))
+    run(level, make_inputs(3, 60))
+    data = level.snapshot()
+    inputs = make_inputs(4, 200)
+    expected = run(level, inputs)
+    level.close()
+
+    other = make_level(9, (5, 0, 1))
+    run(other, make_inputs(9, 10))
+    other.restore(data)
+    assert run(other, inputs) == expected
+    other.close()
+
+
+def test_restore_rejects_bad_data():
+    level = make_level(2, (10, 4, 2))
+    data = level.snapshot()
+    before = level.state_hash()
+    with pytest.raises(ValueError):
+        level.restore(data[:-1])
+    with pytest.raises(ValueError):
+        level.restore(b"XXXX" + data[4:])
+    assert level.state_hash() == before
+    level.close()
@@ -0,0 +1,140 @@
+# File: test_spatial_hash.py
+# Author: Michael Huelsman
+# Copyright: Dr. Michael Andrew Huelsman 2023
+# License: GNU GPLv3
+# Created On: 18 Oct 2026
+# Purpose:
+#   Randomized tests checking the SpatialHash broad-phase against brute force.
+# Notes:
+#   The hash may return extra candidates, but never misses a circle that intersects (or touches) the query.
+#   Cases include centers on cell edges, negative coordinates, and radii much larger than a cell.
+
+import numpy as np
+import pygame as pg
+import pytest
+
+from game_classes import SpatialHash, Vector2D
+
+CELL = SpatialHash.CELL_SIZE
+
+
+def random_circles(rng: np.random.Generator, count: int, extent: float, max_radius: float,
+                   on_edges: bool = False) -> (np.ndarray, np.ndarray):
+    """Creates random circles, optionally snapping their centers to cell edges and corners."""
+    centers = rng.uniform(-extent, extent, (count, 2))
+    if on_edges:
+        snapped = np.round(centers / CELL) * CELL
+        # Some centers land just below an edge, in the neighbouring cell
+        below = rng.random((count, 2)) < 0.5
+        snapped[below] = np.nextafter(snapped[below], -np.inf)
+        # Snap x, y or both, so centers land on edges as well as corners
+        which = rng.integers(0, 3, count)
+        centers[which != 1, 0] = snapped[which != 1, 0]
+        centers[which != 0, 1] = snapped[which != 0, 1]
+    radii = rng.uniform(0, max_radius, count)
+    return centers, radii
+
+
+def brute_pairs(centers: np.ndarray, radii: np.ndarray, indexed: np.ndarray, indexed_radii: np.ndarray) -> set:
+    """Finds every intersecting (query, indexed) pair by checking all of them."""
+    offsets = centers[:, np.newaxis, :] - indexed[np.newaxis, :, :]
+    distances = np.sqrt(np.einsum("ijk,ijk->ij", offsets, offsets))
+    hits = np.nonzero(distances <= radii[:, np.newaxis] + indexed_radii[np.newaxis, :])
+    return set(zip(hits[0].tolist(), hits[1].tolist()))
+
+
+def brute_rect(rect: pg.Rect, margin: float, indexed: np.ndarray, indexed_radii: np.ndarray) -> set:
+    """Finds every circle overlapping a rectangle widened by the margin, by checking all of them."""
+    low = np.array(rect.topleft, dtype=np.float64) - margin
+    high = np.array(rect.bottomright, dtype=np.float64) + margin
+    nearest = np.clip(indexed, low, high)
+    offsets = indexed - nearest
+    distances = np.sqrt(np.einsum("ij,ij->i", offsets, offsets))
+    return set(np.nonzero(distances <= indexed_radii)[0].tolist())
+
+
+def check_query_many(grid: SpatialHash, centers: np.ndarray, radii: np.ndarray, indexed: np.ndarray,
+                     indexed_radii: np.ndarray):
+    """Checks a query_many result is ordered, has no duplicates, and contains every intersecting pair."""
+    queries, found = grid.query_many(centers, radii)
+    pairs = list(zip(queries.tolist(), found.tolist()))
+    assert pairs == sorted(set(pairs))
+    missing = brute_pairs(centers, radii, indexed, indexed_radii) - set(pairs)
+    assert not missing, f"missed {len(missing)} intersecting pairs, such as {sorted(missing)[:5]}"
+
+
+@pytest.mark.parametrize("trial", range(20))
+def test_query_many_matches_brute_force(trial):
+    rng = np.random.default_rng(trial)
+    indexed, indexed_radii = random_circles(rng, int(rng.integers(1, 400)), 600, 30)
+    centers, radii = random_circles(rng, int(rng.integers(1, 200)), 650, 10)
+    grid = SpatialHash()
+    grid.rebuild(indexed, indexed_radii)
+    check_query_many(grid, centers, radii, indexed, indexed_radii)
+
+
+@pytest.mark.parametrize("trial", range(20))
+def test_query_many_on_cell_edges(trial):
+    rng = np.random.default_rng(100 + trial)
+    indexed, indexed_radii = random_circles(rng, 300, 5 * CELL, 30, on_edges=True)
+    centers, radii = random_circles(rng, 150, 5 * CELL, 10, on_edges=True)
+    # Radii which make some pairs exactly touch across a cell edge
+    radii[:20] = 0.0
+    indexed_radii[:20] = CELL / 2
+    centers[:20] = indexed[:20] + [CELL / 2, 0.0]
+    grid = SpatialHash()
+    grid.rebuild(indexed, indexed_radii)
+    check_query_many(grid, centers, radii, indexed, indexed_radii)
+
+
+@pytest.mark.parametrize("trial", range(10))
+def test_query_many_large_radii(trial):
+    rng = np.random.default_rng(200 + trial)
+    indexed, indexed_radii = random_circles(rng, 200, 800, 30)
+    # A few indexed circles far larger than a cell widen every query's reach
+    indexed_radii[:3] = rng.uniform(2 * CELL, 6 * CELL, 3)
+    centers, radii = random_circles(rng, 50, 900, 10)
+    radii[:10] = rng.uniform(CELL, 8 * CELL, 10)
+    grid = SpatialHash()
+    grid.rebuild(indexed, indexed_radii)
+    check_query_many(grid, centers, radii, indexed, indexed_radii)
+
+
+def test_query_matches_query_many():
+    rng = np.random.default_rng(300)
+    indexed, indexed_radii = random_circles(rng, 200, 600, 30)
+    grid = SpatialHash()
+    grid.rebuild(indexed, indexed_radii)
+    centers, radii = random_circles(rng, 20, 600, 40)
+    queries, found = grid.query_many(centers, radii)
+    for idx, (center, radius) in enumerate(zip(centers, radii)):
+        single = grid.query(Vector2D(*center), radius)
+        assert single.tolist() == found[queries == idx].tolist()
+
+
+def test_empty_hash():
+    grid = SpatialHash()
+    grid.rebuild(np.empty((0, 2)), np.empty(0))
+    queries, found = grid.query_many(np.array([[0.0, 0.0]]), np.array([10.0]))
+    assert len(queries) == 0 and len(found) == 0
+    assert len(grid.query_rect(pg.Rect(0, 0, 100, 100))) == 0
+
+
+@pytest.mark.parametrize("trial", range(20))
+def test_query_rect_matches_brute_force(trial):
+    rng = np.random.default_rng(400 + trial)
+    indexed, indexed_radii = random_circles(rng, int(rng.integers(1, 500)), 1000, 30, on_edges=trial % 2 == 0)
+    if trial % 5 == 0:
+        indexed_radii[:2] = rng.uniform(2 * CELL, 5 * CELL, 2)
+    grid = SpatialHash()
+    grid.rebuild(indexed, indexed_radii)
+    corner = rng.integers(-1000, 1000, 2)
+    if trial % 2 == 0:
+        # Rectangles aligned to cell edges
+        corner = (corner // int(CELL)) * int(CELL)
+    rect = pg.Rect(int(corner[0]), int(corner[1]), int(rng.integers(0, 800)), int(rng.integers(0, 800)))
+    margin = float(rng.uniform(0, 2 * CELL)) if trial % 3 == 0 else 0.0
+    result = grid.query_rect(rect, margin)
+    assert result.tolist() == sorted(set(result.tolist()))
+    missing = brute_rect(rect, margin, indexed, indexed_radii) - set(result.tolist())
+    assert not missing, f"missed {len(missing)} overlapping circles, such as {sorted(missing)[:5]}"